@@ -2,53 +2,130 @@
 # world.py - Flight AURORA Game World
 # ============================================
 
-from database import fetch_airports, phantom_airports, aurora_airport
+from database import airport_tree, nearest_airports, fetch_airports_by_key, phantom_airports, aurora_airport
 from clue_bank import CLUE_BANK
 import random
+import zlib
+
+import metrics
 
 # -------------------------------
 # Helper: get clue for airport
 # -------------------------------
+# Clues for airports that have no entry of their own, by zone prefix.
+# Keys starting with one of the zone's key prefixes belong to it; keys
+# naming a single phantom airport (X-LOOP, X-AURORA, ...) never match.
+ZONE_CLUE_PREFIXES = {
+    "Reality": ("R",),
+    "Transition": ("T0",),
+    "Twilight": ("X0", "TSAFE"),
+    "Crisis": ("C",),
+    "Aurora": ("F",)
+}
+
+# zone prefix -> clue texts, compiled once from CLUE_BANK
+ZONE_CLUES = {
+    zone: tuple(CLUE_BANK[key] for key in sorted(CLUE_BANK) if key.startswith(prefixes))
+    for zone, prefixes in ZONE_CLUE_PREFIXES.items()
+}
+
+
 def get_airport_clue(airport, zone_prefix=""):
     key = airport.get("id") or airport.get("ident")
+    if key in CLUE_BANK:
+        return CLUE_BANK[key]
 
-    # Fallback clues if ID not in CLUE_BANK
-    if key not in CLUE_BANK:
-        if zone_prefix == "Reality":
-            key = random.choice(["R001","R002","R003"])
-        elif zone_prefix == "Transition":
-            key = random.choice(["T001","T002","T003"])
-        elif zone_prefix == "Twilight":
-            key = "TSAFE"
-        elif zone_prefix == "Crisis":
-            key = random.choice(["C001","C002","C003"])
-        elif zone_prefix == "Aurora":
-            key = "F-FINAL"
-    return CLUE_BANK.get(key, "No clue recorded.")
+    # Same airport, same clue, on every run: pick by a stable hash of its ident
+    clues = ZONE_CLUES.get(zone_prefix)
+    if not clues or not key:
+        return "No clue recorded."
+    return clues[zlib.crc32(key.encode("utf-8")) % len(clues)]
 
 # -------------------------------
 # Build Game World Zones
 # -------------------------------
-def build_game_world():
+# Airport draws per zone: (limit, airport_type) for Reality, Transition, Twilight, Crisis
+ZONE_DRAWS = [
+    (3, "large_airport"),
+    (3, "medium_airport"),
+    (2, "medium_airport"),
+    (3, "all")
+]
+
+# A zone's real airports are drawn around the airport the pilot stands at
+# when they reach it: `limit` picks from the ZONE_POOL nearest airports of
+# the zone's type that are within the zone's reach (the `limit` nearest if
+# too few are). The reach grows as the storm pushes the pilot further.
+ZONE_REACH_KM = {
+    "Reality Zone": 1500,
+    "Transition Zone": 2500,
+    "Twilight Zone": 3500,
+    "Crisis Zone": 5000
+}
+ZONE_POOL = 24
+HOME_POSITION = (60.3172, 24.963301)   # EFHK, game.HOME_BASE
+
+
+@metrics.timed("world.build")
+def build_game_world(rng=random, position=HOME_POSITION):
+    """
+    The five zones, with the Reality Zone drawn around `position` (lat, lon).
+    Later zones are drawn by fill_zone as the pilot reaches them.
+    """
+    world = assemble_world([], [], [], [])
+    for data, draw in zip(world.values(), ZONE_DRAWS):
+        airport_tree(draw[1])   # build every index (and load its airports) now, not mid-mission
+        data["draw"] = draw
+    fill_zone(world, "Reality Zone", position, rng)
+    return world
+
+
+def fill_zone(world, zone_name, position, rng=random):
+    """Draw a zone's real airports around `position` (lat, lon); no-op once drawn."""
+    data = world[zone_name]
+    draw = data.pop("draw", None)
+    if draw is None:
+        return
+    limit, airport_type = draw
+    nearby, reachable = zone_candidates(zone_name, airport_type, position)
+    if len(reachable) >= limit:
+        keys = rng.sample([key for _, key in reachable], limit)
+    else:
+        keys = [key for _, key in nearby[:limit]]
+    data["airports"] = data["airports"] + fetch_airports_by_key(keys)
+
+
+def zone_candidates(zone_name, airport_type, position):
+    """
+    (nearby, reachable): the (km, key) pairs fill_zone draws a zone from,
+    nearest first. It picks from `reachable` if that holds enough airports.
+    """
+    nearby = [(km, key) for km, key in nearest_airports(airport_type, *position, ZONE_POOL + 1)
+              if km > 1]   # not the airport the pilot is standing at
+    return nearby, [(km, key) for km, key in nearby if km <= ZONE_REACH_KM[zone_name]]
+
+
+def assemble_world(reality, transition, twilight, crisis):
+    """Lay out the five zones around the real airports drawn for them."""
     return {
         "Reality Zone": {
             "description": "Safe skies with stable airports.",
-            "airports": fetch_airports(limit=3, airport_type="large_airport"),
+            "airports": reality,
             "prefix": "Reality"
         },
         "Transition Zone": {
             "description": "Airports seem normal, but static creeps into the radios.",
-            "airports": fetch_airports(limit=3, airport_type="medium_airport"),
+            "airports": transition,
             "prefix": "Transition"
         },
         "Twilight Zone": {
             "description": "Phantom and real airports mix. One wrong choice ends your journey.",
-            "airports": phantom_airports + fetch_airports(limit=2, airport_type="medium_airport"),
+            "airports": phantom_airports + twilight,
             "prefix": "Twilight"
         },
         "Crisis Zone": {
             "description": "Storms rage, survivors call for help. Every choice costs fuel.",
-            "airports": fetch_airports(limit=3, airport_type="all"),
+            "airports": crisis,
             "prefix": "Crisis"
         },
         "Aurora Frontier": {
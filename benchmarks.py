@@ -0,0 +1,692 @@
+# ============================================
+# benchmarks.py – Performance checks for Flight AURORA
+# ============================================
+# Run:  python benchmarks.py db [--stand-in]
+#       python benchmarks.py sampling [--stand-in]
+#       python benchmarks.py startup [--stand-in]
+#       python benchmarks.py distance
+#       python benchmarks.py weather
+#       python benchmarks.py render [--delay 0.005]
+#       python benchmarks.py players
+#       python benchmarks.py endings
+#       python benchmarks.py spatial [--stand-in]
+#       python benchmarks.py suite [--json results.json] [--compare baseline.json]   (always on the stand-in)
+
+import argparse
+import io
+import itertools
+import json
+import platform
+import os
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from contextlib import redirect_stdout
+
+import clock
+import database
+
+
+# -------------------------------
+# Timing helpers
+# -------------------------------
+def time_calls(fn, repeat):
+    """Call fn() `repeat` times and return per-call latencies in ms."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label, samples):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<32} median {statistics.median(samples):8.3f} ms | p95 {p95:8.3f} ms")
+
+
+# -------------------------------
+# Local MySQL stand-in
+# -------------------------------
+class StandInConnection:
+    """
+    Pretends to be a mysql.connector connection.
+    Opening one costs `handshake` seconds (TCP + auth), each query `query` seconds.
+    """
+
+    def __init__(self, handshake=0.004, query=0.0003):
+        time.sleep(handshake)
+        self.query_delay = query
+        self.in_transaction = False
+
+    def cursor(self, dictionary=False):
+        return StandInCursor(self)
+
+    def ping(self, reconnect=False):
+        pass
+
+    def commit(self):
+        self.in_transaction = False
+
+    def rollback(self):
+        self.in_transaction = False
+
+    def close(self):
+        pass
+
+
+class StandInCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=()):
+        time.sleep(self.conn.query_delay)
+        if query.lstrip().upper().startswith("INSERT"):
+            self.conn.in_transaction = True
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+# -------------------------------
+# Connection pool: before / after
+# -------------------------------
+def bench_db_connections(repeat=200, stand_in=False):
+    """Per-call latency of fetch_runs with a fresh connection vs the pool."""
+    connect = StandInConnection if stand_in else database.connect_db
+
+    def unpooled_fetch_runs():
+        # The pre-pool code path: connect, query, close on every call.
+        conn = connect()
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT id, player_name, ending, survivors, fuel, played_at "
+                       "FROM hall_of_fame ORDER BY played_at DESC, id DESC LIMIT %s;", (5,))
+        cursor.fetchall()
+        cursor.close()
+        conn.close()
+
+    database.init_pool(connect=connect)
+    print(f"\n=== DB connection benchmark ({'stand-in' if stand_in else 'MySQL'}, {repeat} calls) ===")
+    report("fetch_runs, new connection", time_calls(unpooled_fetch_runs, repeat))
+
+    def pooled_fetch_runs():
+        database.clear_hall_of_fame_cache()  # measure the query, not the read cache
+        database.fetch_runs()
+    report("fetch_runs, pooled", time_calls(pooled_fetch_runs, repeat))
+    report("fetch_runs, cached", time_calls(database.fetch_runs, repeat))
+    database.get_pool().close()
+
+
+# -------------------------------
+# Airport sampling: ORDER BY RAND() vs indexed sequence
+# -------------------------------
+AIRPORT_TYPE_MIX = {
+    "small_airport": 0.55, "heliport": 0.20, "closed": 0.10, "medium_airport": 0.07,
+    "seaplane_base": 0.05, "large_airport": 0.02, "balloonport": 0.01
+}
+
+
+def synthetic_airports(rows, seed=0):
+    """Airport dicts shaped like the airport table, with a realistic type mix."""
+    rng = random.Random(seed)
+    types = list(AIRPORT_TYPE_MIX)
+    weights = list(AIRPORT_TYPE_MIX.values())
+    return [{
+        "ident": f"B{i:07d}",
+        "name": f"Bench Field {i}",
+        "iso_country": "FI",
+        "type": rng.choices(types, weights)[0],
+        "latitude_deg": rng.uniform(-60, 70),
+        "longitude_deg": rng.uniform(-180, 180)
+    } for i in range(1, rows + 1)]
+
+
+def make_bench_airports(conn, rows, mark="%s"):
+    """Fill a scratch bench_airport table shaped like the migrated airport table."""
+    cursor = conn.cursor()
+    cursor.execute("DROP TABLE IF EXISTS bench_airport;")
+    cursor.execute("""
+        CREATE TABLE bench_airport (
+            id INT PRIMARY KEY, ident VARCHAR(40), name VARCHAR(100),
+            iso_country VARCHAR(2), type VARCHAR(40), sample_seq INT, type_seq INT
+        );
+    """)
+    per_type = {t: 0 for t in AIRPORT_TYPE_MIX}
+    batch = []
+    for i, airport in enumerate(synthetic_airports(rows, seed=rows), start=1):
+        per_type[airport["type"]] += 1
+        batch.append((i, airport["ident"], airport["name"], airport["iso_country"], airport["type"],
+                      i, per_type[airport["type"]]))
+        if len(batch) == 10_000 or i == rows:
+            cursor.executemany(f"INSERT INTO bench_airport VALUES ({', '.join([mark] * 7)});", batch)
+            batch = []
+    cursor.execute("CREATE UNIQUE INDEX idx_bench_sample_seq ON bench_airport (sample_seq);")
+    cursor.execute("CREATE UNIQUE INDEX idx_bench_type_seq ON bench_airport (type, type_seq);")
+    conn.commit()
+    cursor.close()
+    return per_type
+
+
+def bench_airport_sampling(sizes=(10_000, 100_000, 1_000_000), repeat=20, stand_in=False):
+    """Latency of one zone's airport draw with ORDER BY RAND() and with the seq index."""
+    if stand_in:
+        conn, mark, rand = sqlite3.connect(":memory:"), "?", "RANDOM()"
+    else:
+        conn, mark, rand = database.connect_db(), "%s", "RAND()"
+
+    print(f"\n=== Airport sampling benchmark ({'SQLite stand-in' if stand_in else 'MySQL'}, "
+          f"{repeat} draws of 3) ===")
+    for rows in sizes:
+        per_type = make_bench_airports(conn, rows, mark)
+        per_type["all"] = rows
+        cursor = conn.cursor()
+        print(f"--- {rows:,} rows ---")
+        for airport_type in ("large_airport", "medium_airport", "all"):
+            where = "" if airport_type == "all" else f"WHERE type = {mark}"
+            type_param = () if airport_type == "all" else (airport_type,)
+
+            def order_by_rand():
+                cursor.execute(f"SELECT ident, name, iso_country, type FROM bench_airport "
+                               f"{where} ORDER BY {rand} LIMIT {mark};", type_param + (3,))
+                cursor.fetchall()
+
+            def indexed_seq():
+                seqs = random.sample(range(1, per_type[airport_type] + 1), 3)
+                column = "sample_seq" if airport_type == "all" else "type_seq"
+                extra = "" if airport_type == "all" else f"type = {mark} AND "
+                cursor.execute(f"SELECT ident, name, iso_country, type FROM bench_airport "
+                               f"WHERE {extra}{column} IN ({', '.join([mark] * 3)});",
+                               type_param + tuple(seqs))
+                cursor.fetchall()
+
+            report(f"{airport_type:<15} ORDER BY RAND", time_calls(order_by_rand, repeat))
+            report(f"{airport_type:<15} indexed seq", time_calls(indexed_seq, repeat))
+        cursor.execute("DROP TABLE bench_airport;")
+        cursor.close()
+    conn.close()
+
+
+# -------------------------------
+# Cold start: snapshot vs MySQL
+# -------------------------------
+def time_cold_start(env, repeat):
+    """Wall time of a fresh interpreter that imports World and builds one world."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "import World; World.build_game_world()"],
+                       env={**os.environ, **env}, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def bench_cold_start(repeat=10, stand_in=False):
+    """Fresh-process time to the main menu, and world build from the mmap snapshot and from MySQL."""
+    import snapshot
+    import startup
+
+    print(f"\n=== Cold start benchmark ({repeat} fresh processes) ===")
+    report("python game.py -> main menu", [startup.time_to_menu() * 1000 for _ in range(repeat)])
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "airports.snap")
+        if stand_in:
+            snapshot.write_snapshot(path, synthetic_airports(70_000))
+        else:
+            snapshot.export_snapshot(path)
+        print(f"snapshot size: {os.path.getsize(path) / 1024:.0f} KiB")
+        report("build_game_world, snapshot", time_cold_start({"AURORA_SNAPSHOT": path}, repeat))
+
+    if stand_in:
+        print("(MySQL path skipped: needs a live flight_game database)")
+    else:
+        report("build_game_world, MySQL", time_cold_start({"AURORA_SNAPSHOT": ""}, repeat))
+
+
+# -------------------------------
+# Distances: scalar haversine vs batch kernels
+# -------------------------------
+def bench_distance(sizes=(10**3, 10**4, 10**5, 10**6)):
+    """Total time for n haversine pairs: per-pair calls vs the batch API vs a matrix."""
+    from game import calculate_distance, calculate_distance_batch, distance_matrix
+
+    print("\n=== Distance benchmark ===")
+    for pairs in sizes:
+        rng = random.Random(pairs)
+        lats1 = [rng.uniform(-60, 70) for _ in range(pairs)]
+        lons1 = [rng.uniform(-180, 180) for _ in range(pairs)]
+        lats2 = [rng.uniform(-60, 70) for _ in range(pairs)]
+        lons2 = [rng.uniform(-180, 180) for _ in range(pairs)]
+        # Same pair count as a (pairs/1000 x 1000) zone matrix
+        origins = list(zip(lats1[:max(1, pairs // 1000)], lons1))
+        candidates = list(zip(lats2[:1000], lons2))
+
+        def scalar():
+            for args in zip(lats1, lons1, lats2, lons2):
+                calculate_distance(*args)
+
+        print(f"--- {pairs:,} pairs ---")
+        report("calculate_distance loop", time_calls(scalar, 3))
+        report("calculate_distance_batch", time_calls(
+            lambda: calculate_distance_batch(lats1, lons1, lats2, lons2), 3))
+        report("distance_matrix", time_calls(lambda: distance_matrix(origins, candidates), 3))
+
+
+# -------------------------------
+# Weather: per-call list building vs compiled alias tables
+# -------------------------------
+def legacy_get_weather(zone_name):
+    """The pre-compiled get_weather: rebuild the lists and call random.choices."""
+    import weather
+    conditions = [dict(c) for c in weather.CONDITIONS]
+    weights = weather.UNIFORM_WEIGHTS
+    for zone, zone_weights in weather.ZONE_WEIGHTS.items():
+        if zone in zone_name:
+            weights = zone_weights
+            break
+    return random.choices(conditions, weights=weights, k=1)[0]
+
+
+def bench_weather(draws=1_000_000):
+    """Time `draws` Crisis Zone weather samples three ways."""
+    import weather
+
+    print(f"\n=== Weather benchmark ({draws:,} draws) ===")
+    report("legacy get_weather loop", time_calls(
+        lambda: [legacy_get_weather("Crisis Zone") for _ in range(draws)], 3))
+    report("get_weather loop", time_calls(
+        lambda: [weather.get_weather("Crisis Zone") for _ in range(draws)], 3))
+    report("get_weather_batch", time_calls(
+        lambda: weather.get_weather_batch("Crisis Zone", draws), 3))
+
+
+# -------------------------------
+# Text rendering: per-character vs frame-batched
+# -------------------------------
+class CountingStream:
+    """Discards output but counts write and flush calls."""
+
+    def __init__(self):
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, text):
+        self.writes += 1
+
+    def flush(self):
+        self.flushes += 1
+
+
+def script_lines():
+    """Every line the intro and the ending scripts type out."""
+    import dialogue
+
+    scripts = {"intro": [lambda: dialogue.intro_dialogue("Pilot")]}
+    scripts["endings"] = [getattr(dialogue, name) for name in dir(dialogue) if name.startswith("ending_")]
+    lines = {}
+    real_slow_print = dialogue.slow_print
+    try:
+        for name, calls in scripts.items():
+            dialogue.slow_print = lambda text, delay=0.03: lines.setdefault(name, []).append(text)
+            with clock.using("zero"), redirect_stdout(io.StringIO()):
+                for call in calls:
+                    call()
+    finally:
+        dialogue.slow_print = real_slow_print
+    return lines
+
+
+def legacy_slow_print(text, delay, out):
+    """The pre-render slow_print: write, flush and sleep per character."""
+    for char in text:
+        out.write(char)
+        out.flush()
+        time.sleep(delay)
+    out.write("\n")
+    out.flush()
+
+
+def bench_render(delay=0.005):
+    """Syscalls and wall time for the intro and ending scripts, old vs new renderer."""
+    from render import render_text
+
+    print(f"\n=== Render benchmark (delay {delay * 1000:.0f} ms/char) ===")
+    real_sleep = time.sleep
+    for script, lines in script_lines().items():
+        chars = sum(len(line) for line in lines)
+        nominal = chars * delay
+        for label, typer in (("per-character", legacy_slow_print),
+                             ("frame-batched", lambda text, d, out: render_text(text, d, out))):
+            out = CountingStream()
+            sleeps = [0]
+
+            def counting_sleep(seconds):
+                sleeps[0] += 1
+                real_sleep(seconds)
+            time.sleep = counting_sleep
+            try:
+                start = time.perf_counter()
+                for line in lines:
+                    typer(line, delay, out)
+                wall = time.perf_counter() - start
+            finally:
+                time.sleep = real_sleep
+            calls = out.writes + out.flushes + sleeps[0]
+            print(f"{script:<8} {label:<14} {chars:5d} chars | {calls:6d} calls "
+                  f"(write {out.writes}, flush {out.flushes}, sleep {sleeps[0]}) | "
+                  f"wall {wall:6.2f} s ({wall - nominal:+.2f} s vs nominal)")
+
+
+# -------------------------------
+# Player state: dict vs slotted Player
+# -------------------------------
+def legacy_player():
+    """The pre-Player create_player(): a dict with an inventory list (two items held)."""
+    return {"fuel": 100, "survivors": 0, "chances": 3, "zone": "Reality",
+            "inventory": ["Storm Compass", "Engine Upgrade"], "role": "Leader",
+            "difficulty": "Normal", "engine_boost": False}
+
+
+def bytes_per_player(make, count):
+    """Traced memory per live player state, excluding the list holding them."""
+    tracemalloc.start()
+    players = [make() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - sys.getsizeof(players)
+    tracemalloc.stop()
+    return size / count
+
+
+def bench_players(count=1_000_000):
+    """Memory per live player and one simulated turn of reads/writes per player."""
+    from hud import ITEM_BITS, Player
+
+    def slotted_player():
+        return Player(role="Leader", items=ITEM_BITS["Storm Compass"] | ITEM_BITS["Engine Upgrade"])
+
+    def turns_by_key(players):
+        for p in players:
+            p["fuel"] = max(0, p["fuel"] - 3)
+            if p["role"] == "Leader":
+                p["survivors"] += 1
+            if "Storm Shield" in p["inventory"]:
+                p["chances"] -= 1
+
+    def turns_by_attribute(players):
+        for p in players:
+            p.fuel = max(0, p.fuel - 3)
+            if p.role == "Leader":
+                p.survivors += 1
+            if p.has("Storm Shield"):
+                p.chances -= 1
+
+    print(f"\n=== Player state benchmark ({count:,} live players) ===")
+    print(f"{'dict':<32} {bytes_per_player(legacy_player, count):8.0f} bytes/player")
+    print(f"{'Player (slots + bitset)':<32} {bytes_per_player(slotted_player, count):8.0f} bytes/player")
+
+    dicts = [legacy_player() for _ in range(count)]
+    slotted = [slotted_player() for _ in range(count)]
+    report("dict, one turn each", time_calls(lambda: turns_by_key(dicts), 3))
+    report("Player, attributes", time_calls(lambda: turns_by_attribute(slotted), 3))
+    report("Player, dict adapter", time_calls(lambda: turns_by_key(slotted), 3))
+
+
+# -------------------------------
+# Endings: rule walk vs compiled table vs batch
+# -------------------------------
+def bench_endings(count=1_000_000):
+    """Classify `count` random end-of-game states one at a time and as one batch."""
+    import endings
+
+    rng = random.Random(count)
+    choices = ["AURORA", "LOOP", "DEC", "HAUNT", "STORM", "REBELLION", "COMPASS", "GHOST", "SURVIVOR"]
+    fuel = array("i", (rng.randint(-10, 200) for _ in range(count)))
+    survivors = array("i", (rng.randint(0, 12) for _ in range(count)))
+    chances = array("i", (rng.randint(0, 5) for _ in range(count)))
+    final_choices = [rng.choice(choices) for _ in range(count)]
+    players = [{"fuel": f, "survivors": s, "chances": c} for f, s, c in zip(fuel, survivors, chances)]
+
+    print(f"\n=== Ending benchmark ({count:,} states) ===")
+    report("evaluate_rules loop", time_calls(
+        lambda: [endings.evaluate_rules(p, c) for p, c in zip(players, final_choices)], 3))
+    report("resolve_ending loop", time_calls(
+        lambda: [endings.resolve_ending(p, c) for p, c in zip(players, final_choices)], 3))
+    report("resolve_endings batch", time_calls(
+        lambda: endings.resolve_endings(fuel, survivors, chances, final_choices), 3))
+
+
+# -------------------------------
+# Spatial index: KD-tree vs scanning every airport
+# -------------------------------
+def bench_spatial(queries=1_000, stand_in=False):
+    """Index build time per airport type, then k-nearest and radius latency vs a full distance scan."""
+    from game import distance_matrix
+    from spatial import KDTree
+
+    if stand_in:
+        airports = synthetic_airports(70_000)
+        by_type = {"all": airports}
+        for airport in airports:
+            by_type.setdefault(airport["type"], []).append(airport)
+        positions = {t: ([a["latitude_deg"] for a in rows], [a["longitude_deg"] for a in rows], None)
+                     for t, rows in by_type.items()}
+    else:
+        positions = {t: database._airport_positions(t) for t in ("large_airport", "medium_airport", "all")}
+
+    rng = random.Random(queries)
+    points = [(rng.uniform(-60, 70), rng.uniform(-180, 180)) for _ in range(queries)]
+    print(f"\n=== Spatial index benchmark ({'synthetic airports' if stand_in else 'airport table'}, "
+          f"{queries:,} queries) ===")
+    for airport_type in ("large_airport", "medium_airport", "all"):
+        lats, lons, keys = positions[airport_type]
+        start = time.perf_counter()
+        tree = KDTree(lats, lons, keys)
+        print(f"--- {airport_type}: {len(tree):,} airports, index built in "
+              f"{(time.perf_counter() - start) * 1000:.0f} ms ---")
+        for label, query in (("nearest k=1", lambda lat, lon: tree.nearest(lat, lon, 1)),
+                             ("nearest k=25", lambda lat, lon: tree.nearest(lat, lon, 25)),
+                             ("within 300 km", lambda lat, lon: tree.within(lat, lon, 300))):
+            queries_left = iter(points)
+            report(label, time_calls(lambda: query(*next(queries_left)), queries))
+        candidates = list(zip(lats, lons))
+        report("scan + sort, k=25", time_calls(
+            lambda: sorted(distance_matrix([points[0]], candidates)[0])[:25], 5))
+
+
+# -------------------------------
+# Seeded flight_game stand-in (SQLite)
+# -------------------------------
+def seeded_flight_game(rows=70_000, runs=10_000, seed=0):
+    """
+    In-memory database.SQLiteBackend holding `rows` synthetic airports and
+    `runs` Hall of Fame entries, the same on every run for a given seed.
+    """
+    rng = random.Random(seed)
+    backend = database.SQLiteBackend(f"file:bench_flight_game_{seed}?mode=memory&cache=shared")
+    backend.create_schema()
+    backend.load_airports(synthetic_airports(rows, seed))
+
+    endings = ["Victory", "Loop Failure", "Storm Failure", "Drowned Failure", "Haunted Failure"]
+    conn = backend.connect()
+    cursor = conn.cursor()
+    cursor.executemany("INSERT INTO hall_of_fame (player_name, ending, survivors, fuel, played_at) "
+                       "VALUES (%s, %s, %s, %s, %s);",
+                       [(f"Pilot {i}", rng.choice(endings), rng.randint(0, 12), rng.randint(0, 150),
+                         f"2025-01-01 00:00:{i % 60:02d}") for i in range(runs)])
+    database.rebuild_ending_counts(cursor)
+    conn.commit()
+    conn.close()
+    return backend
+
+
+# -------------------------------
+# Hot-path suite: JSON results and baseline comparison
+# -------------------------------
+def measure(fn, calls, samples):
+    """
+    Best, median and p95 of `samples` timed batches of `calls` calls to fn,
+    in microseconds per call (after one untimed warm-up batch).
+    """
+    def batch():
+        for _ in range(calls):
+            fn()
+    batch()
+    per_call = sorted(ms * 1000 / calls for ms in time_calls(batch, samples))
+    return {"best_us": round(per_call[0], 3),
+            "median_us": round(statistics.median(per_call), 3),
+            "p95_us": round(per_call[max(0, int(len(per_call) * 0.95) - 1)], 3),
+            "calls": calls, "samples": samples}
+
+
+def headless_game(seed):
+    """One complete mission with scripted answers: the same game for the same seed."""
+    from game import run_game
+    from rng import RNGContext
+
+    answers = random.Random(seed)
+    return run_game("Bench Pilot", RNGContext(seed),
+                    lambda prompt: answers.choice(["1", "2", "3", "y", "n"]))
+
+
+def bench_suite(samples=15):
+    """
+    Time every hot path the game runs per decision, plus whole headless
+    games, against the seeded SQLite stand-in so results only depend on
+    the code and the machine. Returns {name: {"best_us", "median_us", "p95_us", "calls", "samples"}}.
+    """
+    import World
+    import endings
+    import weather
+    from game import HOME_BASE, calculate_distance, calculate_fuel_cost, nova_destination_advice, random_flight_event
+    from hud import Player
+
+    # Always measure the database path, not the offline snapshot
+    saved = database.get_backend(), database.SNAPSHOT_PATH, database._snapshot
+    database.SNAPSHOT_PATH, database._snapshot = "", None
+    database.set_backend(seeded_flight_game())
+
+    rng = random.Random(0)
+    destination = ("EFHK", "Helsinki Vantaa", "FI", 60.3172, 24.9633)
+    storm = weather.get_weather("Crisis Zone", rng)
+    airport = {"ident": "EFHK", "name": "Helsinki Vantaa"}
+    player = Player(role="Engineer")
+    final_choices = ["AURORA", "LOOP", "DEC", "HAUNT", "STORM"]
+    game_seeds = itertools.cycle(range(20))   # every batch plays the same 20 games
+
+    def check_ending():
+        player.fuel, player.survivors = rng.randint(0, 150), rng.randint(0, 12)
+        endings.check_ending(player, rng.choice(final_choices))
+
+    advised = [{"ident": f"B{i}"} for i in range(5)] + [{"name": "Drowned Terminal", "effect": "stranded"}]
+    advised_km = {f"B{i}": 400.0 + 250 * i for i in range(5)}
+
+    def flight_event():
+        player.fuel = 100
+        random_flight_event(player, rng)
+
+    cases = [
+        ("calculate_distance", lambda: calculate_distance(60.3172, 24.9633, 51.47, -0.4543), 10_000),
+        ("calculate_fuel_cost", lambda: calculate_fuel_cost(HOME_BASE, destination, storm, player), 10_000),
+        ("get_weather", lambda: weather.get_weather("Crisis Zone", rng), 10_000),
+        ("get_airport_clue", lambda: World.get_airport_clue(airport, "Reality"), 10_000),
+        ("check_ending", check_ending, 1_000),
+        ("random_flight_event", flight_event, 10_000),
+        ("nova_destination_advice", lambda: nova_destination_advice(player, "Crisis Zone", advised, advised_km), 10_000),
+        ("build_game_world", lambda: World.build_game_world(rng), 20),
+        ("headless_game", lambda: headless_game(next(game_seeds)), 20),
+    ]
+    results = {}
+    try:
+        with clock.using("zero"):
+            for name, fn, calls in cases:
+                with redirect_stdout(io.StringIO()):
+                    results[name] = measure(fn, calls, samples)
+                result = results[name]
+                print(f"{name:<24} best {result['best_us']:11.3f} us | median {result['median_us']:11.3f} us | "
+                      f"p95 {result['p95_us']:11.3f} us  ({calls:,} calls x {samples})")
+    finally:
+        database.SNAPSHOT_PATH, database._snapshot = saved[1:]
+        database.set_backend(saved[0])
+    games_per_sec = 1e6 / results["headless_game"]["median_us"]   # median: what a long run would see
+    print(f"{'headless throughput':<24} {games_per_sec:12,.0f} games/sec")
+    return results
+
+
+def save_results(path, results):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                   "results": results}, f, indent=2)
+
+
+def compare_results(results, baseline_path, tolerance=0.10):
+    """
+    Print new vs baseline best times; returns the names that got slower
+    than 1 + tolerance. The best of several batches is the least noisy
+    figure on a shared machine, so that is what is compared.
+    """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    print(f"\n=== Against {baseline_path} (regression above +{tolerance:.0%}) ===")
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<24} (not in baseline)")
+            continue
+        ratio = result["best_us"] / baseline[name]["best_us"]
+        flag = ""
+        if ratio > 1 + tolerance:
+            flag = "  <-- REGRESSION"
+            regressions.append(name)
+        print(f"{name:<24} {baseline[name]['best_us']:12.3f} -> {result['best_us']:12.3f} us "
+              f"({ratio - 1:+7.1%}){flag}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flight AURORA benchmarks")
+    parser.add_argument("bench", choices=["db", "sampling", "startup", "distance", "weather", "render", "players",
+                                          "endings", "spatial", "suite"])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.005, help="typing delay per character (render)")
+    parser.add_argument("--stand-in", action="store_true",
+                        help="use an in-process stand-in instead of a live MySQL server")
+    parser.add_argument("--samples", type=int, default=15, help="timed batches per case (suite)")
+    parser.add_argument("--json", metavar="PATH", help="write the suite results to PATH")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag suite regressions against a saved --json file")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="slowdown allowed before a case counts as a regression (suite)")
+    args = parser.parse_args()
+
+    if args.bench == "db":
+        bench_db_connections(args.repeat, args.stand_in)
+    elif args.bench == "sampling":
+        bench_airport_sampling(repeat=args.repeat, stand_in=args.stand_in)
+    elif args.bench == "startup":
+        bench_cold_start(args.repeat, args.stand_in)
+    elif args.bench == "distance":
+        bench_distance()
+    elif args.bench == "weather":
+        bench_weather()
+    elif args.bench == "render":
+        bench_render(args.delay)
+    elif args.bench == "players":
+        bench_players()
+    elif args.bench == "endings":
+        bench_endings()
+    elif args.bench == "spatial":
+        bench_spatial(stand_in=args.stand_in)
+    elif args.bench == "suite":
+        print(f"\n=== Hot-path suite (seeded SQLite stand-in, {args.samples} samples) ===")
+        results = bench_suite(args.samples)
+        if args.json:
+            save_results(args.json, results)
+        if args.compare and compare_results(results, args.compare, args.tolerance):
+            sys.exit(1)
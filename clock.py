@@ -0,0 +1,89 @@
+# ============================================
+# clock.py – Game clock for Flight AURORA pacing
+# ============================================
+# Every cinematic pause goes through clock.sleep so pacing can be changed
+# in one place:
+#   "real"    – sleeps as written (default)
+#   "scaled"  – every pause divided by `scale` (e.g. 10x faster)
+#   "zero"    – no real waiting; simulated time still advances
+#
+# Pick a mode at startup with AURORA_CLOCK=real | zero | <scale>,
+# e.g. AURORA_CLOCK=10 for a 10x scaled clock.
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+MODES = ("real", "scaled", "zero")
+
+_mode = "real"
+_scale = 1.0
+_virtual = 0.0          # simulated seconds slept in zero mode
+_lock = threading.Lock()
+
+
+def set_mode(mode, scale=1.0):
+    """Switch pacing mode for the whole process."""
+    global _mode, _scale
+    if mode not in MODES:
+        raise ValueError(f"Unknown clock mode: {mode}")
+    if mode == "scaled" and scale <= 0:
+        raise ValueError("Clock scale must be positive")
+    _mode = mode
+    _scale = scale if mode == "scaled" else 1.0
+
+
+def get_mode():
+    return _mode, _scale
+
+
+def is_instant():
+    """True when pauses cost no real time."""
+    return _mode == "zero"
+
+
+def sleep(seconds):
+    """Pause for `seconds` of game time."""
+    global _virtual
+    if _mode == "zero":
+        with _lock:
+            _virtual += seconds
+        return
+    time.sleep(seconds / _scale)
+
+
+def now():
+    """Monotonic game time in seconds (matches the pacing of sleep)."""
+    if _mode == "zero":
+        return _virtual
+    return time.perf_counter() * _scale
+
+
+@contextmanager
+def using(mode, scale=1.0):
+    """Temporarily switch the pacing mode, e.g. for replays and tests."""
+    saved = get_mode()
+    set_mode(mode, scale)
+    try:
+        yield
+    finally:
+        set_mode(*saved)
+
+
+def _from_env(value):
+    value = value.strip().lower()
+    if value in ("", "real"):
+        return "real", 1.0
+    if value == "zero":
+        return "zero", 1.0
+    try:
+        scale = float(value.rstrip("x"))
+    except ValueError:
+        scale = 0.0
+    if not scale > 0:   # also rejects nan
+        raise ValueError(f"Bad AURORA_CLOCK value {value!r}: use real, zero or a speed-up such as 2x")
+    return "scaled", scale
+
+
+set_mode(*_from_env(os.environ.get("AURORA_CLOCK", "")))
@@ -1,45 +1,469 @@
-import mysql.connector
+import atexit
+import functools
+import itertools
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
 
+import metrics
+
+DB_CONFIG = {
+    "host": "127.0.0.1",
+    "user": "kuser",        # change if needed
+    "password": "1234",     # change if needed
+    "database": "flight_game"
+}
+
+POOL_SIZE = 4   # connections kept open per game process
+POOL_TIMEOUT = 30.0   # seconds to wait for a free connection before giving up
+
+# Offline airport snapshot (see snapshot.py). When the file exists, airports
+# are sampled from it and the airport table is never queried.
+# Set AURORA_SNAPSHOT="" to force the MySQL path.
+SNAPSHOT_PATH = os.environ.get("AURORA_SNAPSHOT", "airports.snap")
+
+
+# -------------------------------
+# 0. STORAGE BACKENDS
+# -------------------------------
+# Every query below is plain SQL with %s placeholders, run on a pooled
+# DB-API connection; a backend only decides where connections come from.
+# Pick one with AURORA_DB:
+#   AURORA_DB=mysql                  (default) the flight_game server in DB_CONFIG
+#   AURORA_DB=sqlite:flight_game.db  an embedded SQLite file with the same schema,
+#                                    created by `python database.py init-sqlite`
+SQLITE_PATH = "flight_game.db"
+
+# The airport columns the game reads, plus migrations 001, 002 and 003
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS airport (
+    id INTEGER PRIMARY KEY,
+    ident TEXT NOT NULL,
+    name TEXT,
+    iso_country TEXT,
+    type TEXT,
+    latitude_deg REAL,
+    longitude_deg REAL,
+    sample_seq INTEGER,
+    type_seq INTEGER
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_airport_sample_seq ON airport (sample_seq);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_airport_type_seq ON airport (type, type_seq);
+
+CREATE TABLE IF NOT EXISTS hall_of_fame (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player_name TEXT,
+    ending TEXT,
+    survivors INTEGER,
+    fuel INTEGER,
+    played_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_hof_played_at ON hall_of_fame (played_at, id);
+CREATE INDEX IF NOT EXISTS idx_hof_survivors ON hall_of_fame (survivors, id);
+CREATE INDEX IF NOT EXISTS idx_hof_fuel ON hall_of_fame (fuel, id);
+CREATE INDEX IF NOT EXISTS idx_hof_ending_survivors ON hall_of_fame (ending, survivors, id);
+CREATE INDEX IF NOT EXISTS idx_hof_ending_fuel ON hall_of_fame (ending, fuel, id);
+
+CREATE TABLE IF NOT EXISTS hall_of_fame_endings (
+    ending TEXT NOT NULL PRIMARY KEY,
+    runs INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class MySQLBackend:
+    """The flight_game MySQL server."""
+
+    name = "mysql"
+    add_ending_runs = """
+        INSERT INTO hall_of_fame_endings (ending, runs) VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE runs = runs + VALUES(runs)
+    """
+
+    def __init__(self, config=None):
+        self.config = dict(config or DB_CONFIG)
+
+    def connect(self):
+        import mysql.connector  # the driver is slow to import; load it on the first connection
+
+        return mysql.connector.connect(**self.config)
+
+
+class SQLiteBackend:
+    """
+    An embedded SQLite database laid out like the migrated flight_game.
+    path is a file, or a "file:name?mode=memory&cache=shared" URI for a
+    database that lives in memory while the backend exists.
+    """
+
+    name = "sqlite"
+    add_ending_runs = """
+        INSERT INTO hall_of_fame_endings (ending, runs) VALUES (%s, %s)
+        ON CONFLICT (ending) DO UPDATE SET runs = runs + excluded.runs
+    """
+
+    def __init__(self, path=SQLITE_PATH):
+        self.path = path
+        # A shared in-memory database disappears with its last connection
+        self._keep_alive = self.connect() if "mode=memory" in path else None
+
+    def connect(self):
+        db = sqlite3.connect(self.path, uri=self.path.startswith("file:"), timeout=30,
+                             check_same_thread=False)   # the pool hands connections between threads
+        return SQLiteConnection(db)
+
+    def create_schema(self):
+        conn = self.connect()
+        try:
+            if not self.path.startswith("file:"):
+                conn.db.execute("PRAGMA journal_mode=WAL;")   # readers never wait for the run writer
+            conn.db.executescript(SQLITE_SCHEMA)
+            cursor = conn.cursor()
+            rebuild_ending_counts(cursor)   # runs saved before the counters existed
+            conn.commit()
+        finally:
+            conn.close()
+
+    def load_airports(self, airports):
+        """
+        Replace the airport table with airport dicts, numbering sample_seq
+        and type_seq in the order given (as migration 001 does by id).
+        """
+        rows = []
+        per_type = {}
+        for seq, airport in enumerate(airports, start=1):
+            per_type[airport["type"]] = per_type.get(airport["type"], 0) + 1
+            rows.append((seq, airport["ident"], airport["name"], airport["iso_country"], airport["type"],
+                         airport["latitude_deg"], airport["longitude_deg"], seq, per_type[airport["type"]]))
+        conn = self.connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM airport;")
+            cursor.executemany("INSERT INTO airport VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s);", rows)
+            conn.commit()
+        finally:
+            conn.close()
+        return len(rows)
+
+
+class SQLiteConnection:
+    """A sqlite3 connection with the mysql.connector calls this module uses."""
+
+    def __init__(self, db):
+        self.db = db
+
+    @property
+    def in_transaction(self):
+        return self.db.in_transaction
+
+    def cursor(self, dictionary=False):
+        return SQLiteCursor(self.db.cursor(), dictionary)
+
+    def ping(self, reconnect=False):
+        self.db.execute("SELECT 1;")
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
+    def close(self):
+        self.db.close()
+
+
+class SQLiteCursor:
+    """Runs %s-style queries; cursor(dictionary=True) rows come back as dicts."""
+
+    def __init__(self, cursor, dictionary):
+        self._cursor = cursor
+        self._dictionary = dictionary
+
+    def execute(self, query, params=()):
+        self._cursor.execute(query.replace("%s", "?"), tuple(params))
+
+    def executemany(self, query, rows):
+        self._cursor.executemany(query.replace("%s", "?"), rows)
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        if not self._dictionary:
+            return rows
+        columns = [column[0] for column in self._cursor.description]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def close(self):
+        self._cursor.close()
+
+
+def backend_from_env(value):
+    """The backend an AURORA_DB value names."""
+    value = value.strip()
+    if value in ("", "mysql"):
+        return MySQLBackend()
+    if value == "sqlite" or value.startswith("sqlite:"):
+        return SQLiteBackend(value[len("sqlite:"):] or SQLITE_PATH)
+    raise ValueError(f"Unknown AURORA_DB backend: {value}")
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = backend_from_env(os.environ.get("AURORA_DB", ""))
+    return _backend
+
+
+def set_backend(backend):
+    """Switch storage for the whole process; drops pooled connections and cached reads."""
+    global _backend
+    _backend = backend
+    with _airport_trees_lock:
+        _airport_trees.clear()
+        _airport_rows.clear()
+    nearest_airports.cache_clear()
+    init_pool()
+    clear_hall_of_fame_cache()
+
+
+@metrics.timed("db.connect")
 def connect_db():
-    conn = mysql.connector.connect(
-        host="127.0.0.1",
-        user="kuser",        # change if needed
-        password="1234",     # change if needed
-        database="flight_game"
-    )
-    return conn
+    """Open a brand-new (unpooled) connection to the game database."""
+    return get_backend().connect()
 
 # -------------------------------
-# 2. FETCH AIRPORTS (with filter)
+# 1. CONNECTION POOL
 # -------------------------------
-def fetch_airports(limit=5, airport_type="all"):
+class PoolTimeout(Exception):
+    """No pooled connection came free in time."""
+
+
+class ConnectionPool:
     """
-    Fetch random airports from DB.
-    airport_type can be 'large_airport', 'medium_airport', 'small_airport', or 'all'.
+    Fixed-size pool of open database connections.
+    Connections are opened lazily, health-checked when checked out
+    and replaced if the server dropped them.
     """
-    conn = connect_db()
-    cursor = conn.cursor(dictionary=True)
 
-    if airport_type == "all":
-        query = """
-            SELECT ident, name, iso_country, type
-            FROM airport
-            ORDER BY RAND() LIMIT %s;
+    def __init__(self, size=POOL_SIZE, connect=connect_db):
+        self.size = size
+        self._connect = connect
+        self._idle = []       # most recently returned last
+        self._opened = 0      # idle + checked out + being opened
+        self._changed = threading.Condition()
+
+    def acquire(self, timeout=POOL_TIMEOUT):
         """
-        cursor.execute(query, (limit,))
-    else:
-        query = """
-            SELECT ident, name, iso_country, type
-            FROM airport
-            WHERE type = %s
-            ORDER BY RAND() LIMIT %s;
+        Check out a live connection. When all of them are busy, wait up to
+        `timeout` seconds (None: forever) for one to be returned or for room
+        to open a new one; raises PoolTimeout if neither happens.
         """
-        cursor.execute(query, (airport_type, limit))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while not self._idle and self._opened >= self.size:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise PoolTimeout(f"no database connection free after {timeout} s")
+                self._changed.wait(remaining)
+            conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                self._opened += 1
+
+        if conn is None:
+            return self._open()
+        if self._is_healthy(conn):
+            return conn
+        self._close_quietly(conn)
+        return self._open()   # reuses the dropped connection's slot
+
+    def release(self, conn):
+        """Return a connection to the pool (dropping it if it is broken)."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except Exception:
+            self._close_quietly(conn)
+            self._forget(1)
+            return
+        with self._changed:
+            self._idle.append(conn)
+            self._changed.notify()
+
+    def close(self):
+        """Close every idle connection."""
+        with self._changed:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._close_quietly(conn)
+        self._forget(len(idle))
+
+    def _forget(self, count):
+        """`count` connections are gone: wake waiters, there is room to open new ones."""
+        with self._changed:
+            self._opened -= count
+            self._changed.notify(count)
+
+    def _open(self):
+        try:
+            return self._connect()
+        except Exception:
+            self._forget(1)
+            raise
+
+    @staticmethod
+    def _is_healthy(conn):
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def init_pool(size=POOL_SIZE, connect=connect_db):
+    """(Re)create the module pool, e.g. to change its size."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+        _pool = ConnectionPool(size=size, connect=connect)
+    return _pool
+
+
+def get_pool():
+    """Return the module pool, creating it on first use."""
+    if _pool is None:
+        init_pool()
+    return _pool
+
+
+@contextmanager
+def db_connection():
+    """Borrow a pooled connection for the duration of a with-block."""
+    pool = get_pool()
+    conn = pool.acquire()
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
+
+
+@contextmanager
+def db_cursor(dictionary=False, commit=False):
+    """Pooled cursor; commits on a clean exit when commit=True."""
+    with db_connection() as conn:
+        cursor = conn.cursor(dictionary=dictionary)
+        try:
+            yield cursor
+            if commit:
+                conn.commit()
+        finally:
+            cursor.close()
+
+# -------------------------------
+# 2. AIRPORT SNAPSHOT
+# -------------------------------
+_snapshot = None
+
+
+def get_snapshot():
+    """The memory-mapped airport snapshot, or None if there is no snapshot file."""
+    global _snapshot
+    if _snapshot is None and SNAPSHOT_PATH and os.path.exists(SNAPSHOT_PATH):
+        from snapshot import AirportSnapshot
+        _snapshot = AirportSnapshot(SNAPSHOT_PATH)
+    return _snapshot
+
+# -------------------------------
+# 2b. SPATIAL INDEX (nearest airports)
+# -------------------------------
+# One spatial.KDTree per airport type, over every airport of that type,
+# built on first use and kept for the life of the process. Keys are
+# snapshot rows when there is a snapshot, else airport.sample_seq; without
+# a snapshot the airport rows are loaded with the tree and kept beside it,
+# so drawing a zone mid-mission never waits on the database.
+_airport_trees = {}
+_airport_rows = {}   # sample_seq -> (ident, name, iso_country, type, latitude_deg, longitude_deg)
+_airport_trees_lock = threading.Lock()
+AIRPORT_ROW_COLUMNS = ("ident", "name", "iso_country", "type", "latitude_deg", "longitude_deg")
+
+
+def airport_tree(airport_type="all"):
+    """The KD-tree over every airport of a type ('all' for every airport)."""
+    with _airport_trees_lock:
+        tree = _airport_trees.get(airport_type)
+        if tree is None:
+            from spatial import KDTree
+            tree = _airport_trees[airport_type] = KDTree(*_airport_positions(airport_type))
+    return tree
+
+
+@functools.lru_cache(maxsize=4096)
+def nearest_airports(airport_type, lat, lon, k):
+    """
+    The k airports of a type nearest to (lat, lon) as ((km, key), ...).
+    Memoized: zones are drawn around a small set of airports over and over.
+    """
+    return tuple(airport_tree(airport_type).nearest(lat, lon, k))
+
+
+def _airport_positions(airport_type):
+    """(lats, lons, keys) of every airport of a type; keeps the DB rows in _airport_rows."""
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        rows = snapshot.row_range(airport_type)
+        return snapshot.latitude[rows.start:rows.stop], snapshot.longitude[rows.start:rows.stop], rows
+
+    where, params = ("", ()) if airport_type == "all" else ("AND type = %s", (airport_type,))
+    with db_cursor() as cursor:
+        cursor.execute(f"""
+            SELECT sample_seq, {", ".join(AIRPORT_ROW_COLUMNS)}
+            FROM airport
+            WHERE latitude_deg IS NOT NULL AND longitude_deg IS NOT NULL {where};
+        """, params)
+        rows = cursor.fetchall()
+    # Called under _airport_trees_lock, like every other write to _airport_rows
+    _airport_rows.update((row[0], tuple(row[1:])) for row in rows)
+    return [float(r[5]) for r in rows], [float(r[6]) for r in rows], [r[0] for r in rows]
+
+
+def fetch_airports_by_key(keys):
+    """
+    Airport dicts for airport_tree() keys, in the order given. Served from
+    memory; only keys of a tree that was never built go to the database.
+    """
+    snapshot = get_snapshot()
+    if snapshot is not None:
+        return [snapshot.airport(key) for key in keys]
+    missing = [key for key in keys if key not in _airport_rows]
+    if missing:
+        with db_cursor() as cursor:
+            cursor.execute(f"""
+                SELECT sample_seq, {", ".join(AIRPORT_ROW_COLUMNS)}
+                FROM airport
+                WHERE sample_seq IN ({", ".join(["%s"] * len(missing))});
+            """, missing)
+            fetched = cursor.fetchall()
+        with _airport_trees_lock:
+            _airport_rows.update((row[0], tuple(row[1:])) for row in fetched)
+    return [dict(zip(AIRPORT_ROW_COLUMNS, _airport_rows[key])) for key in keys if key in _airport_rows]
 
-    airports = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return airports
 
 # -------------------------------
 # 3. PHANTOM AIRPORTS
@@ -62,71 +486,376 @@ aurora_airport = {
 # -------------------------------
 # HALL OF FAME FUNCTIONS
 # -------------------------------
+# Every read is served by an index (see migrations/002_hall_of_fame_indexes.sql)
+# or by the per-ending counters of migration 003, and pages are fetched by
+# keyset -- "runs older than the last one shown" -- so the cost of a page
+# never depends on how many runs the table holds.
+# Results are cached in-process; every batch of saved runs clears the cache,
+# and entries expire after HALL_OF_FAME_TTL seconds to pick up runs saved
+# elsewhere.
+HALL_OF_FAME_TTL = 60
+RUN_COLUMNS = "id, player_name, ending, survivors, fuel, played_at"
+TOP_RUN_ORDER = {
+    "survivors": "survivors DESC, id DESC",
+    "fuel": "fuel DESC, id DESC"
+}
+
+_hall_of_fame_cache = {}
+_hall_of_fame_lock = threading.Lock()
+
+
+def _cached_query(key, query, params):
+    now = time.monotonic()
+    with _hall_of_fame_lock:
+        hit = _hall_of_fame_cache.get(key)
+    if hit and now - hit[0] < HALL_OF_FAME_TTL:
+        metrics.count("db.hall_of_fame_cache.hits")
+        return list(hit[1])
+    metrics.count("db.hall_of_fame_cache.misses")
+
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+    with _hall_of_fame_lock:
+        _hall_of_fame_cache[key] = (now, rows)
+    return list(rows)
+
+
+def clear_hall_of_fame_cache():
+    with _hall_of_fame_lock:
+        _hall_of_fame_cache.clear()
+
+
 def save_run(player_name, ending, survivors, fuel):
-    """Save a completed game run to the Hall of Fame table."""
-    conn = connect_db()
-    cursor = conn.cursor()
-    query = """
-        INSERT INTO hall_of_fame (player_name, ending, survivors, fuel)
-        VALUES (%s, %s, %s, %s);
     """
-    cursor.execute(query, (player_name, ending, survivors, fuel))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    Queue a completed game run for the Hall of Fame table.
+    Returns at once; the run writer stores it in the background (see RunWriter).
+    """
+    played_at = time.strftime("%Y-%m-%d %H:%M:%S")
+    _run_writer.submit((player_name, ending, survivors, fuel, played_at))
 
 
-def fetch_runs(limit=5):
-    """Fetch past runs from the Hall of Fame table."""
-    conn = connect_db()
-    cursor = conn.cursor(dictionary=True)
-    query = """
-        SELECT player_name, ending, survivors, fuel, played_at
+def run_writer_stats():
+    """Rows the run writer has written, journaled, replayed and lost so far."""
+    return dict(_run_writer.stats)
+
+
+def flush_runs():
+    """
+    Wait until every queued run is in the database or the journal
+    (at most RUN_FLUSH_TIMEOUT seconds); returns False if that timed out.
+    """
+    return _run_writer.flush()
+
+
+@metrics.timed("db.fetch_runs")
+def fetch_runs(limit=5, before=None):
+    """
+    Fetch past runs from the Hall of Fame table, newest first.
+    For the next page pass before=the last row of the previous one.
+    """
+    if before is None:
+        query = f"""
+            SELECT {RUN_COLUMNS}
+            FROM hall_of_fame
+            ORDER BY played_at DESC, id DESC
+            LIMIT %s;
+        """
+        return _cached_query(("recent", limit, None), query, (limit,))
+
+    query = f"""
+        SELECT {RUN_COLUMNS}
         FROM hall_of_fame
-        ORDER BY played_at DESC
+        WHERE played_at < %s OR (played_at = %s AND id < %s)
+        ORDER BY played_at DESC, id DESC
         LIMIT %s;
     """
-    cursor.execute(query, (limit,))
-    runs = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return runs
-# -------------------------------
-# HALL OF FAME FUNCTIONS
-# -------------------------------
-def save_run(player_name, ending, survivors, fuel):
-    """Save a completed game run to the Hall of Fame table."""
-    conn = connect_db()
-    cursor = conn.cursor()
+    played_at, run_id = before["played_at"], before["id"]
+    return _cached_query(("recent", limit, (played_at, run_id)), query,
+                         (played_at, played_at, run_id, limit))
+
+
+@metrics.timed("db.fetch_top_runs")
+def fetch_top_runs(by="survivors", limit=10, ending=None):
+    """Best runs by 'survivors' or 'fuel', optionally only those with one ending."""
+    order = TOP_RUN_ORDER[by]
+    if ending is None:
+        query = f"SELECT {RUN_COLUMNS} FROM hall_of_fame ORDER BY {order} LIMIT %s;"
+        return _cached_query(("top", by, limit, None), query, (limit,))
+    query = f"SELECT {RUN_COLUMNS} FROM hall_of_fame WHERE ending = %s ORDER BY {order} LIMIT %s;"
+    return _cached_query(("top", by, limit, ending), query, (ending, limit))
+
+
+@metrics.timed("db.fetch_ending_counts")
+def fetch_ending_counts(limit=10):
+    """
+    The most common endings as [{'ending', 'runs'}], most frequent first.
+    Read from the per-ending counters insert_runs keeps, one row per ending.
+    """
     query = """
-        INSERT INTO hall_of_fame (player_name, ending, survivors, fuel)
-        VALUES (%s, %s, %s, %s);
+        SELECT ending, runs
+        FROM hall_of_fame_endings
+        ORDER BY runs DESC, ending
+        LIMIT %s;
     """
-    cursor.execute(query, (player_name, ending, survivors, fuel))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    return _cached_query(("endings", limit), query, (limit,))
+
+
+def rebuild_ending_counts(cursor):
+    """Recount hall_of_fame_endings from the runs themselves (as migration 003 does)."""
+    cursor.execute("DELETE FROM hall_of_fame_endings;")
+    cursor.execute("""
+        INSERT INTO hall_of_fame_endings (ending, runs)
+        SELECT ending, COUNT(*) FROM hall_of_fame WHERE ending IS NOT NULL GROUP BY ending;
+    """)
 
 
-def fetch_runs(limit=5):
-    """Fetch past runs from the Hall of Fame table."""
-    conn = connect_db()
-    cursor = conn.cursor(dictionary=True)
+# -------------------------------
+# HALL OF FAME WRITE-BEHIND QUEUE
+# -------------------------------
+# save_run only queues the row. A background thread gathers queued rows
+# and inserts them with one executemany per batch, when RUN_BATCH_SIZE
+# rows are waiting or RUN_FLUSH_INTERVAL seconds after the first one.
+# If the insert fails the batch is appended to a local journal (one JSON
+# row per line); the journal is replayed once the database answers again.
+# Pending rows are flushed when the process exits, waiting at most
+# RUN_FLUSH_TIMEOUT seconds. An error the writer cannot recover from
+# (say, the database is down and the journal unwritable) is reported on
+# stderr and costs that batch, never the writer thread.
+RUN_BATCH_SIZE = 500
+RUN_FLUSH_INTERVAL = 1.0    # seconds a queued run may wait for company
+RUN_RETRY_INTERVAL = 30.0   # after a failed insert, journal straight away this long
+RUN_FLUSH_TIMEOUT = 10.0    # longest flush() waits, so exiting never hangs on the writer
+RUN_JOURNAL_PATH = os.environ.get("AURORA_RUN_JOURNAL", "hall_of_fame.journal")
+
+
+@metrics.timed("db.insert_runs")
+def insert_runs(rows):
+    """
+    Insert (player_name, ending, survivors, fuel, played_at) rows in one
+    batch, and add them to the per-ending counters in the same transaction.
+    """
     query = """
-        SELECT player_name, ending, survivors, fuel, played_at
-        FROM hall_of_fame
-        ORDER BY played_at DESC
-        LIMIT %s;
+        INSERT INTO hall_of_fame (player_name, ending, survivors, fuel, played_at)
+        VALUES (%s, %s, %s, %s, %s)
     """
-    cursor.execute(query, (limit,))
-    runs = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return runs
+    endings = {}
+    for row in rows:
+        if row[1] is not None:
+            endings[row[1]] = endings.get(row[1], 0) + 1
+    with db_cursor(commit=True) as cursor:
+        cursor.executemany(query, rows)
+        cursor.executemany(get_backend().add_ending_runs, list(endings.items()))
+    clear_hall_of_fame_cache()
+
+
+class RunWriter:
+    """Background batch writer for Hall of Fame rows, with an on-disk fallback."""
+
+    def __init__(self, batch_size=RUN_BATCH_SIZE, interval=RUN_FLUSH_INTERVAL,
+                 journal_path=RUN_JOURNAL_PATH, insert=insert_runs):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.journal_path = journal_path
+        self.stats = {"written": 0, "journaled": 0, "replayed": 0, "batches": 0, "lost": 0}
+        self._insert = insert
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._retry_at = 0.0
+
+    def submit(self, row):
+        self._queue.put(row)
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="run-writer", daemon=True)
+                    self._thread.start()
+
+    def flush(self, timeout=RUN_FLUSH_TIMEOUT):
+        """
+        Wait up to `timeout` seconds until every submitted row is in the
+        database or the journal; returns False if the writer did not finish.
+        """
+        if self._thread is None:
+            return True
+        done = threading.Event()   # set by the writer once it gets here
+        self._queue.put(done)
+        return done.wait(timeout)
 
+    def _run(self):
+        self._safely(self._replay_journal, True)
+        while True:
+            batch, flushed = self._gather()
+            if batch and not self._safely(self._write, batch):
+                self.stats["lost"] += len(batch)
+            if flushed is not None:
+                flushed.set()
 
+    def _safely(self, step, *args):
+        """Run one step of the writer; an error is reported, never fatal to the thread."""
+        try:
+            step(*args)
+            return True
+        except Exception as e:
+            metrics.count("db.run_writer.errors")
+            print(f"⚠️ Hall of Fame writer: {type(e).__name__}: {e}", file=sys.stderr)
+            return False
 
+    def _gather(self):
+        """
+        Wait for a row, then collect more until the batch is full or its time
+        is up. Returns (rows, the flush() event that cut the batch short or None).
+        """
+        first = self._queue.get()
+        if isinstance(first, threading.Event):
+            return [], first
+        batch = [first]
+        deadline = time.monotonic() + self.interval
+        while len(batch) < self.batch_size:
+            try:
+                row = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if isinstance(row, threading.Event):
+                return batch, row
+            batch.append(row)
+        return batch, None
+
+    def _write(self, batch):
+        if time.monotonic() < self._retry_at:
+            self._journal(batch)
+            return
+        try:
+            self._insert(batch)
+        except Exception:
+            self._retry_at = time.monotonic() + RUN_RETRY_INTERVAL
+            self._journal(batch)
+            return
+        self.stats["written"] += len(batch)
+        self.stats["batches"] += 1
+        if os.path.exists(self.journal_path):
+            self._replay_journal()
+
+    def _journal(self, rows):
+        import json
+
+        with open(self.journal_path, "a", encoding="utf-8") as journal:
+            journal.writelines(json.dumps(row) + "\n" for row in rows)
+        self.stats["journaled"] += len(rows)
+
+    # A journal is replayed from a claimed copy, {journal}.{pid}.{n}.replay,
+    # so rows journaled meanwhile go to a new file. A claim is removed once
+    # its rows are in the database or back in the journal; one left behind
+    # by a process that died mid-replay is claimed again when the next
+    # writer starts.
+    def _replay_journal(self, orphans=False):
+        for source in [self.journal_path] + (self._orphaned_claims() if orphans else []):
+            if time.monotonic() < self._retry_at:
+                return
+            claimed = f"{self.journal_path}.{os.getpid()}.{next(_claims)}.replay"
+            try:
+                os.replace(source, claimed)
+            except OSError:
+                continue  # nothing journaled, or another writer got there first
+            self._replay(claimed)
+
+    def _orphaned_claims(self):
+        """Claims whose process is gone, oldest process first."""
+        folder, name = os.path.split(os.path.abspath(self.journal_path))
+        try:
+            entries = os.listdir(folder)
+        except OSError:
+            return []
+        orphans = []
+        for entry in entries:
+            parts = entry[len(name) + 1:].split(".")
+            if (entry.startswith(name + ".") and len(parts) == 3 and parts[0].isdigit()
+                    and parts[2] == "replay" and not _process_alive(int(parts[0]))):
+                orphans.append(os.path.join(folder, entry))
+        return sorted(orphans)
+
+    def _replay(self, claimed):
+        import json
+
+        rows = []
+        with open(claimed, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    rows.append(tuple(json.loads(line)))
+                except ValueError:
+                    pass  # torn last line from a crash mid-append
+        done = 0
+        try:
+            for done in range(0, len(rows), self.batch_size):
+                self._insert(rows[done:done + self.batch_size])
+            done = len(rows)
+        except Exception:
+            self._retry_at = time.monotonic() + RUN_RETRY_INTERVAL
+            self._journal(rows[done:])
+        self.stats["replayed"] += done
+        os.remove(claimed)
+
+
+_claims = itertools.count()
 
 
+def _process_alive(pid):
+    """Whether a process with this id is running (True when unsure)."""
+    if os.name == "nt":
+        import ctypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return ctypes.get_last_error() == 5  # ERROR_ACCESS_DENIED: running, not ours
+        kernel32.CloseHandle(handle)
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True   # exists, but belongs to someone else
+    return True
+
+
+_run_writer = RunWriter()
+atexit.register(flush_runs)
+
+
+# -------------------------------
+# EMBEDDED DATABASE SETUP
+# -------------------------------
+def init_sqlite(path=SQLITE_PATH, airports=None):
+    """
+    Create or refresh an embedded SQLite game database at `path`.
+    Airports come from `airports`, else the airport snapshot if there is
+    one, else the current backend's airport table. Saved runs are kept.
+    """
+    if airports is None:
+        snapshot = get_snapshot()
+        if snapshot is not None:
+            airports = [snapshot.airport(row) for row in range(len(snapshot))]
+        else:
+            with db_cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                    SELECT ident, name, iso_country, type, latitude_deg, longitude_deg
+                    FROM airport
+                    ORDER BY id;
+                """)
+                airports = cursor.fetchall()
+    backend = SQLiteBackend(path)
+    backend.create_schema()
+    return backend.load_airports(airports)
+
 
+if __name__ == "__main__":
+    import sys
 
+    if len(sys.argv) < 2 or sys.argv[1] != "init-sqlite":
+        print("Usage: python database.py init-sqlite [path]")
+        sys.exit(1)
+    target = sys.argv[2] if len(sys.argv) > 2 else SQLITE_PATH
+    loaded = init_sqlite(target)
+    print(f"✅ {target}: {loaded} airports; play on it with AURORA_DB=sqlite:{target}")
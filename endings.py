@@ -2,6 +2,11 @@
 # endings.py – Final outcomes for Flight AURORA
 # ============================================
 
+import bisect
+import operator
+
+import metrics
+
 from dialogue import (
     ending_victory, ending_loop, ending_drowned,
     ending_haunt, ending_storm, ending_green_route,
@@ -36,105 +41,207 @@ def generate_summary(player):
 
 
 # ============================================================
-# Main Function: Determine Ending
+# Ending Rules (no output)
 # ============================================================
-def check_ending(player, final_choice):
-    """
-    Decide which ending to trigger based on player state and final choice.
-    final_choice = 'AURORA', 'LOOP', 'DEC', 'HAUNT', 'STORM', etc.
-    """
-
-    # ============================================================
+# Checked top to bottom; the first rule that matches decides the ending.
+# Each rule: (name, final choices it applies to or None for any,
+#             player condition (stat, op, value) or None).
+# Final choices no rule names -- GHOST and SURVIVOR from the story
+# events -- only match the any-choice rules (fuel_out, ghost, fallback).
+ENDING_RULES = (
     # CRITICAL FAILURES
-    # ============================================================
-    if player["fuel"] <= 0:
-        print("\n⚠️ Fuel tanks empty. Engines sputter in silence...")
-        print("The cockpit goes dark as the storm swallows the plane whole.")
-        ending_storm()
-        return "Storm Failure"
-
-    # ============================================================
+    ("fuel_out", None, ("fuel", "<=", 0)),
     # SECRET & CONDITIONAL ENDINGS
-    # ============================================================
-    if player["survivors"] >= 3 and final_choice == "AURORA":
-        print("\n🌱 Because you saved lives and flew wisely...")
-        print("The world itself seems to respond. Clouds part, and a green-gold light emerges.")
-        ending_green_route()
-        return "Green Route"
-
-    if final_choice == "LOOP":
-        print("\n🔄 You circle back… again and again.")
-        print("Each landing looks the same. Each takeoff drains more fuel.")
-        print("At last, NOVA’s voice fades: 'Pilot… we are trapped.'")
-        ending_loop()
-        return "Loop Failure"
-
-    if final_choice == "DEC":
-        print("\n🌊 The runway seems real, but waves crash across it.")
-        print("The wheels touch water. Engines choke. Alarms scream in vain.")
-        print("Cold sea water fills the cabin as the plane disappears beneath the tide.")
-        ending_drowned()
-        return "Drowned Failure"
-
-    if final_choice == "HAUNT":
-        print("\n💀 The runway glows faintly, but shadows cling to it.")
-        print("As you descend, fog thickens into hands pulling at the wings.")
-        print("The ground gives way—there was never a runway here.")
-        print("Your last sight is Aurora fading into mist.")
-        ending_haunt()
-        return "Haunted Failure"
-
-    if final_choice == "STORM":
-        print("\n⚡ Lightning blinds. Turbulence tears the plane apart.")
-        print("Winds scream louder than NOVA’s failing systems.")
-        print("One last bolt strikes—everything fades to black.")
-        ending_storm()
-        return "Storm Failure"
-
-    # ============================================================
+    ("green_route", {"AURORA"}, ("survivors", ">=", 3)),
+    ("loop", {"LOOP"}, None),
+    ("drowned", {"DEC"}, None),
+    ("haunt", {"HAUNT"}, None),
+    ("storm", {"STORM"}, None),
     # NEW EXPANDED ENDINGS
-    # ============================================================
-    if final_choice == "REBELLION":
-        print("\n🚀 The plane tilts upward — beyond the storm, beyond the Beacon.")
-        print("🛰️ NOVA: 'Pilot...? Where are you going?'")
-        print("💫 Your signal disappears into the stars.")
-        return "Rebellion Ending"
-
-    if final_choice == "COMPASS":
-        print("\n🧭 The Storm Compass glows, guiding you through impossible winds.")
-        print("The storm bends as if obeying your will.")
-        print("Aurora fades… but you soar into unknown skies.")
-        return "Compass Ending"
-
-    # ============================================================
+    ("rebellion", {"REBELLION"}, None),
+    ("compass", {"COMPASS"}, None),
     # MORAL OUTCOMES
-    # ============================================================
-    if final_choice == "AURORA" and player["survivors"] == 0:
-        ending_mercenary()
-        return "Mercenary Ending"
+    ("mercenary", {"AURORA"}, ("survivors", "==", 0)),
+    ("hero", {"AURORA"}, ("survivors", ">=", 5)),  # unreachable: Green Route wins from 3
+    ("ghost", None, ("chances", "<=", 0)),
+    # TRUE VICTORY
+    ("victory", {"AURORA"}, None),
+    ("fallback", None, None)
+)
+
+ENDING_STATS = ("fuel", "survivors", "chances")
+RULE_OPS = {"<=": operator.le, ">=": operator.ge, "==": operator.eq}
+
+
+def _rule_matches(rule, stats, final_choice):
+    _, choices, condition = rule
+    if choices is not None and final_choice not in choices:
+        return False
+    if condition is None:
+        return True
+    stat, op, value = condition
+    return RULE_OPS[op](stats[stat], value)
+
+
+def evaluate_rules(stats, final_choice):
+    """Walk ENDING_RULES in order for one player; returns the first matching rule name."""
+    for rule in ENDING_RULES:
+        if _rule_matches(rule, stats, final_choice):
+            return rule[0]
+
+
+# -------------------------------
+# Batch classification
+# -------------------------------
+# The rules only ever compare fuel, survivors and chances (whole numbers)
+# against a few thresholds, so every state falls into one of a handful of
+# buckets per stat. The table below holds the resolved ending for every
+# (fuel bucket, survivors bucket, chances bucket, final choice) cell,
+# computed once from ENDING_RULES, so classifying a player is three
+# bisects and one list index, for one player or a whole batch.
+def _bucket_starts(stat):
+    """Sorted values at which the rules' answer for `stat` can change."""
+    starts = set()
+    for _, _, condition in ENDING_RULES:
+        if condition and condition[0] == stat:
+            _, op, value = condition
+            starts.update({"<=": (value + 1,), ">=": (value,), "==": (value, value + 1)}[op])
+    return sorted(starts)
+
+
+def _compile_ending_table():
+    choices = sorted({c for _, rule_choices, _ in ENDING_RULES if rule_choices for c in rule_choices})
+    choice_codes = {choice: code for code, choice in enumerate(choices)}
+    other = len(choices)   # any final choice no rule names ("GHOST", "SURVIVOR", ...)
+
+    starts = {stat: _bucket_starts(stat) for stat in ENDING_STATS}
+    samples = {stat: [s[0] - 1] + s for stat, s in starts.items()}   # one value per bucket
+
+    table = []
+    for fuel in samples["fuel"]:
+        for survivors in samples["survivors"]:
+            for chances in samples["chances"]:
+                stats = {"fuel": fuel, "survivors": survivors, "chances": chances}
+                for final_choice in choices + [None]:
+                    table.append(evaluate_rules(stats, final_choice))
+
+    # Offsets of each stat's bucket in the flattened table
+    width = len(choices) + 1
+    strides = {"chances": width}
+    strides["survivors"] = strides["chances"] * len(samples["chances"])
+    strides["fuel"] = strides["survivors"] * len(samples["survivors"])
+    return table, starts, strides, choice_codes, other
+
+
+_ENDING_TABLE, _BUCKET_STARTS, _BUCKET_STRIDES, _CHOICE_CODES, _OTHER_CHOICE = _compile_ending_table()
+_FUEL_STARTS, _SURVIVOR_STARTS, _CHANCE_STARTS = (_BUCKET_STARTS[stat] for stat in ENDING_STATS)
+_FUEL_STRIDE, _SURVIVOR_STRIDE, _CHANCE_STRIDE = (_BUCKET_STRIDES[stat] for stat in ENDING_STATS)
+
+
+def resolve_ending(player, final_choice):
+    """
+    Decide which ending applies, without printing anything.
+    Returns the ending rule name; ENDING_RESULTS maps it to the result text.
+    """
+    cell = (bisect.bisect_right(_FUEL_STARTS, player["fuel"]) * _FUEL_STRIDE
+            + bisect.bisect_right(_SURVIVOR_STARTS, player["survivors"]) * _SURVIVOR_STRIDE
+            + bisect.bisect_right(_CHANCE_STARTS, player["chances"]) * _CHANCE_STRIDE
+            + _CHOICE_CODES.get(final_choice, _OTHER_CHOICE))
+    return _ENDING_TABLE[cell]
 
-    if final_choice == "AURORA" and player["survivors"] >= 5:
-        ending_hero()
-        return "Hero Ending"
 
-    if player["chances"] <= 0:
-        ending_ghost()
-        return "Ghost Ending"
+def resolve_endings(fuel, survivors, chances, final_choices):
+    """
+    resolve_ending for a whole batch: equal-length sequences (lists,
+    array.array, ...) of fuel, survivors, chances and final choices.
+    Returns the list of ending rule names.
+    """
+    bucket = bisect.bisect_right
+    choice_code, table = _CHOICE_CODES.get, _ENDING_TABLE
+    return [table[bucket(_FUEL_STARTS, f) * _FUEL_STRIDE + bucket(_SURVIVOR_STARTS, s) * _SURVIVOR_STRIDE
+                  + bucket(_CHANCE_STARTS, c) * _CHANCE_STRIDE + choice_code(choice, _OTHER_CHOICE)]
+            for f, s, c, choice in zip(fuel, survivors, chances, final_choices)]
+
+
+def resolve_player_endings(players, final_choices):
+    """resolve_endings for a list of players (hud.Player or dicts)."""
+    return resolve_endings([p["fuel"] for p in players], [p["survivors"] for p in players],
+                           [p["chances"] for p in players], final_choices)
+
+
+ENDING_RESULTS = {
+    "fuel_out": "Storm Failure",
+    "green_route": "Green Route",
+    "loop": "Loop Failure",
+    "drowned": "Drowned Failure",
+    "haunt": "Haunted Failure",
+    "storm": "Storm Failure",
+    "rebellion": "Rebellion Ending",
+    "compass": "Compass Ending",
+    "mercenary": "Mercenary Ending",
+    "hero": "Hero Ending",
+    "ghost": "Ghost Ending",
+    "victory": "Victory",
+    "fallback": "Unknown"
+}
 
-    # ============================================================
-    # TRUE VICTORY
-    # ============================================================
-    if final_choice == "AURORA":
-        print("\n✨ Against all odds, you pass through the final storm.")
-        print("The clouds open… and Aurora Beacon shines like a star reborn.")
-        print("NOVA: 'Pilot… you made it.'")
-        print("On the horizon, survivors gather at the light. The Cartographer is waiting.")
-        ending_victory()
-        return "Victory"
-
-    # ============================================================
-    # FINAL FALLBACK (AI-style outro)
-    # ============================================================
+
+# ============================================================
+# Ending Presentation
+# ============================================================
+def _show_fuel_out(player):
+    print("\n⚠️ Fuel tanks empty. Engines sputter in silence...")
+    print("The cockpit goes dark as the storm swallows the plane whole.")
+    ending_storm()
+
+def _show_green_route(player):
+    print("\n🌱 Because you saved lives and flew wisely...")
+    print("The world itself seems to respond. Clouds part, and a green-gold light emerges.")
+    ending_green_route()
+
+def _show_loop(player):
+    print("\n🔄 You circle back… again and again.")
+    print("Each landing looks the same. Each takeoff drains more fuel.")
+    print("At last, NOVA’s voice fades: 'Pilot… we are trapped.'")
+    ending_loop()
+
+def _show_drowned(player):
+    print("\n🌊 The runway seems real, but waves crash across it.")
+    print("The wheels touch water. Engines choke. Alarms scream in vain.")
+    print("Cold sea water fills the cabin as the plane disappears beneath the tide.")
+    ending_drowned()
+
+def _show_haunt(player):
+    print("\n💀 The runway glows faintly, but shadows cling to it.")
+    print("As you descend, fog thickens into hands pulling at the wings.")
+    print("The ground gives way—there was never a runway here.")
+    print("Your last sight is Aurora fading into mist.")
+    ending_haunt()
+
+def _show_storm(player):
+    print("\n⚡ Lightning blinds. Turbulence tears the plane apart.")
+    print("Winds scream louder than NOVA’s failing systems.")
+    print("One last bolt strikes—everything fades to black.")
+    ending_storm()
+
+def _show_rebellion(player):
+    print("\n🚀 The plane tilts upward — beyond the storm, beyond the Beacon.")
+    print("🛰️ NOVA: 'Pilot...? Where are you going?'")
+    print("💫 Your signal disappears into the stars.")
+
+def _show_compass(player):
+    print("\n🧭 The Storm Compass glows, guiding you through impossible winds.")
+    print("The storm bends as if obeying your will.")
+    print("Aurora fades… but you soar into unknown skies.")
+
+def _show_victory(player):
+    print("\n✨ Against all odds, you pass through the final storm.")
+    print("The clouds open… and Aurora Beacon shines like a star reborn.")
+    print("NOVA: 'Pilot… you made it.'")
+    print("On the horizon, survivors gather at the light. The Cartographer is waiting.")
+    ending_victory()
+
+def _show_fallback(player):
     # Generate an AI-style closing line based on performance
     fuel = player.get("fuel", 0)
     survivors = player.get("survivors", 0)
@@ -148,12 +255,39 @@ def check_ending(player, final_choice):
     else:
         message = "‘Through storm and silence, you proved humanity can still fly.’"
 
-    fuel = player.get("fuel", 0)
-    survivors = player.get("survivors", 0)
     print(f"\nNOVA (final transmission): {message}")
     print("🌠 Aurora fades — but your story becomes part of the light.")
 
-    return "Unknown"
+
+ENDING_SCENES = {
+    "fuel_out": _show_fuel_out,
+    "green_route": _show_green_route,
+    "loop": _show_loop,
+    "drowned": _show_drowned,
+    "haunt": _show_haunt,
+    "storm": _show_storm,
+    "rebellion": _show_rebellion,
+    "compass": _show_compass,
+    "mercenary": lambda player: ending_mercenary(),
+    "hero": lambda player: ending_hero(),
+    "ghost": lambda player: ending_ghost(),
+    "victory": _show_victory,
+    "fallback": _show_fallback
+}
+
+
+# ============================================================
+# Main Function: Determine Ending
+# ============================================================
+@metrics.timed("endings.check_ending")
+def check_ending(player, final_choice):
+    """
+    Decide which ending to trigger based on player state and final choice.
+    final_choice = 'AURORA', 'LOOP', 'DEC', 'HAUNT', 'STORM', etc.
+    """
+    rule = resolve_ending(player, final_choice)
+    ENDING_SCENES[rule](player)
+    return ENDING_RESULTS[rule]
 
 
 # ============================================================
@@ -0,0 +1,91 @@
+# ============================================
+# flow.py – Decision flows for Flight AURORA
+# ============================================
+# Game code that needs a player decision is written as a generator:
+#
+#     answer = yield "Enter 1 or 2: "
+#
+# The generator never blocks on input itself, so the same flow can be
+# driven by the console (drive + input), by a network session, or by a
+# replay log. The generator's return value is the flow's result.
+#
+# Anything with the same send()/StopIteration protocol is a flow too, such
+# as game.Mission, a state machine whose state can be saved between
+# decisions. FlowScheduler parks such flows as serialized state while
+# they wait on an idle player.
+
+import time
+
+
+def drive(flow, ask=input):
+    """Run a decision flow to the end, answering every prompt with ask()."""
+    try:
+        prompt = next(flow)
+        while True:
+            prompt = flow.send(ask(prompt))
+    except StopIteration as done:
+        return done.value
+
+
+def step(flow, answer=None):
+    """
+    Advance a flow by one decision.
+    Returns (finished, value): the next prompt, or the flow's result once finished.
+    Pass answer=None for the first step.
+    """
+    try:
+        return False, (next(flow) if answer is None else flow.send(answer))
+    except StopIteration as done:
+        return True, done.value
+
+
+class FlowScheduler:
+    """
+    Steps many saveable flows (to_dict/from_dict) on whatever threads call it.
+    Flows in active use stay live; park_idle() turns the ones left waiting
+    longer than `park_after` seconds into pickled state, so an idle game
+    costs only a few kilobytes and comes back on its next answer.
+    """
+
+    def __init__(self, restore, park_after=30.0):
+        self.restore = restore   # state dict -> flow, e.g. Mission.from_dict
+        self.park_after = park_after
+        self.live = {}           # key -> (flow, time of its last step)
+        self.parked = {}         # key -> pickled flow state
+
+    def __len__(self):
+        return len(self.live) + len(self.parked)
+
+    def start(self, key, flow):
+        """Run a new flow to its first decision; returns step()'s (finished, value)."""
+        return self._keep(key, flow, step(flow))
+
+    def send(self, key, answer):
+        """Answer a flow's pending prompt; returns step()'s (finished, value)."""
+        if key in self.live:
+            flow = self.live.pop(key)[0]
+        else:
+            import pickle
+            flow = self.restore(pickle.loads(self.parked.pop(key)))
+        return self._keep(key, flow, step(flow, answer))
+
+    def drop(self, key):
+        self.live.pop(key, None)
+        self.parked.pop(key, None)
+
+    def park_idle(self, now=None):
+        """Serialize every flow that has waited longer than park_after; returns how many."""
+        import pickle
+
+        now = time.monotonic() if now is None else now
+        idle = [key for key, (_, last) in list(self.live.items()) if now - last >= self.park_after]
+        for key in idle:
+            entry = self.live.pop(key, None)
+            if entry:
+                self.parked[key] = pickle.dumps(entry[0].to_dict(), pickle.HIGHEST_PROTOCOL)
+        return len(idle)
+
+    def _keep(self, key, flow, stepped):
+        if not stepped[0]:
+            self.live[key] = (flow, time.monotonic())
+        return stepped
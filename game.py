@@ -1,20 +1,31 @@
-from database import fetch_runs, save_run
+import bisect
 import random
 import sys
-import mysql.connector
 import math
 import os
-import time
-
-from World import build_game_world, get_airport_clue
-from dialogue import (
-    intro_dialogue, nova_transition_warning, nova_twilight_warning,
-    nova_crisis_warning, nova_final_warning, cartographer_dialogue,
-    nova_dynamic_commentary, nova_dynamic_comment
+import threading
+from array import array
+
+import clock
+import metrics
+from hud import (
+    Player, create_player, show_hud, update_fuel, rescue_survivors, lose_chance, change_zone, add_item, show_inventory,
+    burn_fuel, warn_if_out_of_fuel, show_rescued, show_lost_chance, gain_item, show_item_added,
+    show_role_menu, pick_role, ROLE_PROMPT, show_difficulty_menu, pick_difficulty, DIFFICULTY_PROMPT, show_map_progress
 )
-from weather import get_weather
-from hud import create_player, show_hud, update_fuel, rescue_survivors, lose_chance, change_zone, add_item, show_inventory, choose_role, choose_difficulty, show_map_progress
-from endings import check_ending
+from rng import RNGContext
+from render import render_text, read_line
+from flow import drive
+from startup import lazy_import
+
+# Only needed once a mission starts (or the Hall of Fame opens), so they
+# are loaded on first use and the main menu comes up without them.
+database = lazy_import("database")
+World = lazy_import("World")
+dialogue = lazy_import("dialogue")
+weather_system = lazy_import("weather")
+endings = lazy_import("endings")
+replay = lazy_import("replay")
 
 # =====================================================================
 # Distance & Fuel Calculation
@@ -30,62 +41,154 @@ def calculate_distance(lat1, lon1, lat2, lon2):
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
 
 
-def calculate_fuel_cost(origin, destination, weather, player=None):
+def calculate_distance_batch(lats1, lons1, lats2, lons2):
+    """
+    Haversine over paired coordinate sequences.
+    Returns an array of distances (km), one per pair.
+    """
+    R = 6371
+    radians, sin, cos, asin, sqrt = math.radians, math.sin, math.cos, math.asin, math.sqrt
+    out = array("d")
+    append = out.append
+    for lat1, lon1, lat2, lon2 in zip(lats1, lons1, lats2, lons2):
+        p1 = radians(lat1)
+        p2 = radians(lat2)
+        a = sin((p2 - p1) / 2) ** 2 + cos(p1) * cos(p2) * sin(radians(lon2 - lon1) / 2) ** 2
+        append(2 * R * asin(sqrt(a)))
+    return out
+
+
+def distance_matrix(origins, candidates):
+    """
+    Distances (km) from every origin to every candidate in one call.
+    origins, candidates are sequences of (lat, lon); returns one array per origin.
+    Radians and cosines are computed once per point, not once per pair.
+    """
+    R = 6371
+    sin, asin, sqrt = math.sin, math.asin, math.sqrt
+    cand = [(math.radians(lat), math.radians(lon)) for lat, lon in candidates]
+    cand = [(p, l, math.cos(p)) for p, l in cand]
+    rows = []
+    for lat, lon in origins:
+        p1, l1 = math.radians(lat), math.radians(lon)
+        cos1 = math.cos(p1)
+        rows.append(array("d", [
+            2 * R * asin(sqrt(sin((p2 - p1) / 2) ** 2 + cos1 * cos2 * sin((l2 - l1) / 2) ** 2))
+            for p2, l2, cos2 in cand
+        ]))
+    return rows
+
+
+def airport_position(airport):
+    """(lat, lon) of a real airport dict."""
+    return float(airport["latitude_deg"]), float(airport["longitude_deg"])
+
+
+# Every mission departs from home base
+HOME_BASE = ("EFHK", "Helsinki Vantaa Airport", "FI", 60.3172, 24.963301)
+
+
+def calculate_fuel_cost(origin, destination, weather, player=None, distance=None):
     """
     Fuel cost = base + distance/100 + weather penalty
     origin, destination are (ident, name, country, lat, lon)
+    distance (km) can be passed in when it was already computed in a batch.
     """
-    lat1, lon1 = origin[3], origin[4]
-    lat2, lon2 = destination[3], destination[4]
-    distance = calculate_distance(lat1, lon1, lat2, lon2)
-    base_cost = 10
-    fuel_cost = base_cost + (distance / 100) + weather["fuel_penalty"]
+    if distance is None:
+        lat1, lon1 = origin[3], origin[4]
+        lat2, lon2 = destination[3], destination[4]
+        distance = calculate_distance(lat1, lon1, lat2, lon2)
+    role = player.get("role") if player else None
+    engine_boost = player.get("engine_boost", False) if player else False
+    if role == "Engineer":
+        print("🔧 Engineer skill reduces fuel consumption!")
+    if engine_boost:
+        print("⚙️ Engine upgrade efficiency bonus active!")
+    return flight_fuel_cost(distance, weather["fuel_penalty"], role, engine_boost)
+
+
+def flight_fuel_cost(distance, fuel_penalty, role=None, engine_boost=False):
+    """
+    Fuel a flight costs, without any output. distance is None for a
+    phantom airport, which costs a flat 15 and ignores the Engine Upgrade.
+    """
+    if distance is None:
+        fuel_cost = 15 + fuel_penalty
+        return int(fuel_cost * 0.8) if role == "Engineer" else fuel_cost
+    fuel_cost = 10 + (distance / 100) + fuel_penalty
 
     # ▼ Engineer role → 20% less fuel
-    if player and player.get("role") == "Engineer":
+    if role == "Engineer":
         fuel_cost = int(fuel_cost * 0.8)
-        print("🔧 Engineer skill reduces fuel consumption!")
 
     # ▼ Engine Upgrade → extra 10% reduction (stacks with Engineer)
-    if player and player.get("engine_boost", False):
+    if engine_boost:
         fuel_cost = int(fuel_cost * 0.9)
-        print("⚙️ Engine upgrade efficiency bonus active!")
 
     return int(fuel_cost)
 # =====================================================================
 # Random Flight Events
 # =====================================================================
-def random_flight_event(player):
+# Each one time in five; flight_event rolls and applies one quietly,
+# random_flight_event also tells the player about it.
+FLIGHT_EVENTS = ("tailwind", "turbulence", "mechanical", "signal", "clear")
+_FLIGHT_EVENT_ROLLS = (0.20, 0.40, 0.60, 0.80)
+
+
+def flight_event(player, rng=random):
+    """Roll a flight event and apply it, without any output; returns its name."""
+    event = FLIGHT_EVENTS[bisect.bisect_right(_FLIGHT_EVENT_ROLLS, rng.random())]
+    apply_flight_event(player, event)
+    return event
+
+
+def apply_flight_event(player, event):
+    """A flight event's effect on the player, with role effects."""
+    role = player.get("role")
+    if event == "tailwind":
+        player["fuel"] = burn_fuel(player["fuel"], -5)  # give back fuel
+    elif event == "turbulence":
+        player["fuel"] = burn_fuel(player["fuel"], 5)
+        if role == "Navigator":
+            player["fuel"] = burn_fuel(player["fuel"], -3)  # Navigator reduces penalty
+    elif event == "mechanical":
+        if role != "Engineer":
+            player["fuel"] = burn_fuel(player["fuel"], 5)
+    elif event == "signal":
+        if role == "Leader":
+            player["survivors"] += 1
+
+
+def random_flight_event(player, rng=random):
     """Trigger a random event during flight, with role effects."""
-    event_roll = random.random()
+    fuel = player["fuel"]
+    event = flight_event(player, rng)
 
-    if event_roll < 0.20:
+    if event == "tailwind":
         print("🌬️ Tailwind! You save 5 fuel.")
-        update_fuel(player, -5)  # give back fuel
 
-    elif event_roll < 0.40:
+    elif event == "turbulence":
         print("⚠️ Turbulence shakes the plane! You lose 5 fuel.")
-        update_fuel(player, 5)
+        warn_if_out_of_fuel(burn_fuel(fuel, 5))
         # Navigator helps here
         if player.get("role") == "Navigator":
-            update_fuel(player, -3)  # Navigator reduces penalty
             print("🧭 Navigator skill helps steady the flight (reduced loss).")
 
-    elif event_roll < 0.60:
+    elif event == "mechanical":
         print("🔧 Minor mechanical issue detected...")
         # Engineer helps here
         if player.get("role") == "Engineer":
             print("🔧 Engineer fixes it quickly — no fuel lost!")
         else:
-            update_fuel(player, 5)
+            warn_if_out_of_fuel(player["fuel"])
             print("⚠️ Without an Engineer, it costs 5 extra fuel.")
 
-    elif event_roll < 0.80:
+    elif event == "signal":
         print("📻 Survivor radio signal detected...")
         # Leader helps here
         if player.get("role") == "Leader":
             print("👥 Leader convinces them to join — you gain +1 survivor!")
-            rescue_survivors(player, 1)
+            show_rescued(player, 1)
         else:
             print("The signal fades before you can respond.")
 
@@ -94,104 +197,175 @@ def random_flight_event(player):
 # =====================================================================
 # Fuel Upgrade & Refueling System
 # =====================================================================
-def refuel_or_upgrade(player):
-    """Chance to refuel or find upgrade at airports."""
-    chance = random.random()
+def airport_find(player, rng=random):
+    """
+    What refuel_or_upgrade finds, applied without any output:
+    ("station", fuel gained), ("upgrade", item name) or (None, None).
+    """
+    chance = rng.random()
 
     # 15% chance for refueling station
     if chance < 0.15:
-        gained = random.randint(15, 40)
+        gained = rng.randint(15, 40)
         player["fuel"] = min(150, player["fuel"] + gained)
-        print(f"⛽ You found a refueling station! +{gained} fuel added.")
+        return "station", gained
 
     # 10% chance to find upgrades
-    elif chance < 0.25:
-        upgrade = random.choice(["Extra Fuel Tank", "Engine Upgrade"])
-        add_item(player, upgrade)
-        print(f"🔩 You discovered a rare upgrade: {upgrade}!")
+    if chance < 0.25:
+        upgrade = rng.choice(["Extra Fuel Tank", "Engine Upgrade"])
+        gain_item(player, upgrade)
 
         # Apply benefits
         if upgrade == "Extra Fuel Tank":
             player["fuel"] = min(200, player["fuel"] + 50)
-            print("💨 Max fuel temporarily increased to 200!")
         elif upgrade == "Engine Upgrade":
             player["engine_boost"] = True
+        return "upgrade", upgrade
+
+    return None, None
+
+
+def refuel_or_upgrade(player, rng=random):
+    """Chance to refuel or find upgrade at airports."""
+    had = set(player["inventory"])
+    find, detail = airport_find(player, rng)
+
+    if find == "station":
+        print(f"⛽ You found a refueling station! +{detail} fuel added.")
+
+    elif find == "upgrade":
+        show_item_added(detail, detail not in had)
+        print(f"🔩 You discovered a rare upgrade: {detail}!")
+        if detail == "Extra Fuel Tank":
+            print("💨 Max fuel temporarily increased to 200!")
+        elif detail == "Engine Upgrade":
             print("⚙️ Engine upgrade active — fuel cost reduced by 10%!")
 
     else:
         print("🛫 Nothing special found at this stop.")
 
-def branching_story_event(player, zone_name):
+def branching_story_event(player, zone_name, rng=random, ask=input):
     """Trigger a zone-based branching narrative event."""
+    return drive(branching_story_flow(player, zone_name, rng), ask)
+
+
+def branching_story_flow(player, zone_name, rng=random):
+    """branching_story_event as a decision flow (see flow.py)."""
+    prompt = show_story_event(zone_name)
+    if prompt is None:
+        return None
+    final_choice = resolve_story_event(player, zone_name, (yield prompt), rng)
+    if final_choice:
+        return endings.check_ending(player, final_choice)
+    return None  # continue game
+
+
+def show_story_event(zone_name):
+    """Print the zone's story event; returns its prompt, or None if the zone has none."""
     if "Transition" in zone_name:
         print("\n🌌 You detect a strange shimmering runway in the distance...")
         print(" 1. 🛬 Land and investigate")
         print(" 2. ✈️ Stay on course")
-        choice = input("Enter 1 or 2: ")
-        if choice == "1":
-            update_fuel(player, 10)
-            if random.random() < 0.5:
-                add_item(player, "Storm Compass")
-                print("✨ You found a Storm Compass!")
-            else:
-                print("⚠️ The runway collapses, wasted fuel.")
-        return None  # continue game
-
     elif "Twilight" in zone_name:
         print("\n👻 A ghostly radio whispers coordinates...")
         print(" 1. Follow it")
         print(" 2. Shut off the radio")
-        choice = input("Enter 1 or 2: ")
-        if choice == "1":
-            if random.random() < 0.3:
-                lose_chance(player)
-                print("👻 It was a phantom trap! You lose a chance.")
-                if player["chances"] <= 0:
-                    return check_ending(player, "GHOST")  # new ghost ending
-            else:
-                add_item(player, "Fuel Canister")
-                print("🛢️ You found a Fuel Canister in an old hangar.")
-        else:
-            print("📻 You cut the radio and avoid distraction.")
-        return None
-
     elif "Crisis" in zone_name:
         print("\n🚨 A military outpost requests help!")
         print(" 1. Divert to assist")
         print(" 2. Stay on mission")
-        choice = input("Enter 1 or 2: ")
-        if choice == "1":
-            update_fuel(player, 15)
-            rescue_survivors(player, 2)
-            print("👥 You rescued 2 survivors, but lost 15 fuel.")
-            if player["survivors"] >= 10:
-                return check_ending(player, "SURVIVOR")  # special ending
-        else:
-            lose_chance(player)
-            print("⚠️ Survivors abandoned. You lose 1 chance.")
-        return None
-
     elif "Aurora" in zone_name:
         print("\n🌠 A dazzling aurora storm blocks your path...")
         print(" 1. Push through")
         print(" 2. Wait it out")
-        choice = input("Enter 1 or 2: ")
-        if choice == "1":
-            if random.random() < 0.4:
-                print("⚡ The storm destroys your plane!")
-                return check_ending(player, "STORM")
-            else:
-                player["fuel"] = min(150, player["fuel"] + 50)
-                print("✨ You brave the storm and gain mysterious energy! Fuel +50.")
-        else:
-            print("⏳ You wait until the storm passes safely.")
+    else:
         return None
+    return "Enter 1 or 2: "
+
+
+# Zones whose names bring a branching story event
+STORY_ZONES = ("Transition", "Twilight", "Crisis", "Aurora")
+
+
+def story_outcome(player, zone_name, choice, rng=random):
+    """
+    Apply the player's story choice without any output.
+    Returns (what happened, the final choice if it ends the game).
+    """
+    if "Transition" in zone_name:
+        if choice == "1":
+            player["fuel"] = burn_fuel(player["fuel"], 10)
+            if rng.random() < 0.5:
+                gain_item(player, "Storm Compass")
+                return "compass", None
+            return "collapse", None
+
+    elif "Twilight" in zone_name:
+        if choice == "1":
+            if rng.random() < 0.3:
+                player["chances"] = max(0, player["chances"] - 1)
+                return "trap", "GHOST" if player["chances"] <= 0 else None  # new ghost ending
+            gain_item(player, "Fuel Canister")
+            return "canister", None
+        return "radio_off", None
+
+    elif "Crisis" in zone_name:
+        if choice == "1":
+            player["fuel"] = burn_fuel(player["fuel"], 15)
+            player["survivors"] += 2
+            return "assist", "SURVIVOR" if player["survivors"] >= 10 else None  # special ending
+        player["chances"] = max(0, player["chances"] - 1)
+        return "abandon", None
+
+    elif "Aurora" in zone_name:
+        if choice == "1":
+            if rng.random() < 0.4:
+                return "storm", "STORM"
+            player["fuel"] = min(150, player["fuel"] + 50)
+            return "energy", None
+        return "wait", None
+    return None, None
+
+
+def resolve_story_event(player, zone_name, choice, rng=random):
+    """Apply the player's story choice; returns the final choice if it ends the game."""
+    had = set(player["inventory"])
+    outcome, final_choice = story_outcome(player, zone_name, choice, rng)
+
+    if outcome in ("compass", "collapse", "assist"):
+        warn_if_out_of_fuel(player["fuel"])
+    if outcome == "compass":
+        show_item_added("Storm Compass", "Storm Compass" not in had)
+        print("✨ You found a Storm Compass!")
+    elif outcome == "collapse":
+        print("⚠️ The runway collapses, wasted fuel.")
+    elif outcome == "trap":
+        show_lost_chance(player)
+        print("👻 It was a phantom trap! You lose a chance.")
+    elif outcome == "canister":
+        show_item_added("Fuel Canister", "Fuel Canister" not in had)
+        print("🛢️ You found a Fuel Canister in an old hangar.")
+    elif outcome == "radio_off":
+        print("📻 You cut the radio and avoid distraction.")
+    elif outcome == "assist":
+        show_rescued(player, 2)
+        print("👥 You rescued 2 survivors, but lost 15 fuel.")
+    elif outcome == "abandon":
+        show_lost_chance(player)
+        print("⚠️ Survivors abandoned. You lose 1 chance.")
+    elif outcome == "storm":
+        print("⚡ The storm destroys your plane!")
+    elif outcome == "energy":
+        print("✨ You brave the storm and gain mysterious energy! Fuel +50.")
+    elif outcome == "wait":
+        print("⏳ You wait until the storm passes safely.")
+    return final_choice
 
 # =====================================================================
 # NOVA Weather Prediction System
 # =====================================================================
 def nova_weather_prediction(next_zone):
-    """Predicts the possible weather type in the next zone."""
+    """Predicts the weather in the next zone, with the odds of its weather table."""
     possible_weathers = {
         "Reality": "Stable skies ahead — minor cloud formations detected.",
         "Transition": "Sensors picking up interference — fog or radio static likely.",
@@ -200,15 +374,14 @@ def nova_weather_prediction(next_zone):
         "Aurora": "Massive storm front detected — unpredictable electromagnetic fields."
     }
 
-    # Random variation for realism
-    uncertainty = random.choice([
-        "Confidence: 90%.",
-        "Confidence: 75%.",
-        "Confidence: 50%. Conditions may change suddenly."
-    ])
-
-    message = possible_weathers.get(next_zone, "Data unavailable for unknown region.")
-    print(f"\n🔮 NOVA Forecast: {message} {uncertainty}")
+    message = next((text for zone, text in possible_weathers.items() if zone in next_zone),
+                   "Data unavailable for unknown region.")
+    # Confidence is how often the most likely weather actually turns up there
+    condition, confidence = weather_system.forecast(next_zone)
+    outlook = f"Most likely {condition['condition']}. Confidence: {confidence:.0%}."
+    if confidence < 0.5:
+        outlook += " Conditions may change suddenly."
+    print(f"\n🔮 NOVA Forecast: {message} {outlook}")
 
 # =====================================================================
 # NOVA Weather Alert System
@@ -229,6 +402,49 @@ def nova_weather_alert(weather):
     else:
         print(f"\n☀️ NOVA: 'Skies are calm, pilot. {condition} ahead — clear flight path.'")
 
+# =====================================================================
+# NOVA Destination Advisor
+# =====================================================================
+def nova_destination_advice(player, zone_name, airports, distances):
+    """
+    NOVA's estimate for a flight to each airport, in one pass over the
+    zone's weather table: {"fuel": expected fuel cost, "crash": crash
+    chance after role and Storm Shield, "ending": the ending the airport
+    forces if the plane gets there, or None}.
+    distances maps a real airport's ident to its km from the pilot.
+    """
+    outlook = [(p, condition) for p, condition
+               in zip(weather_system.weather_table(zone_name).probabilities, weather_system.CONDITIONS) if p]
+    crash = sum(p * condition["crash_chance"] for p, condition in outlook)
+    if "Storm Shield" in player["inventory"]:
+        crash *= 0.5
+    role, engine_boost = player.get("role"), player.get("engine_boost", False)
+    if role == "Navigator":
+        crash *= 0.8
+
+    advice = []
+    for airport in airports:
+        distance = distances[airport["ident"]] if "ident" in airport else None
+        fuel = sum(p * flight_fuel_cost(distance, condition["fuel_penalty"], role, engine_boost)
+                   for p, condition in outlook)
+        ending = None
+        if airport.get("effect") in PHANTOM_ENDINGS:
+            landed = {"fuel": max(0, player["fuel"] - round(fuel)), "survivors": player["survivors"],
+                      "chances": player["chances"]}
+            ending = endings.ENDING_RESULTS[endings.resolve_ending(landed, PHANTOM_ENDINGS[airport["effect"]])]
+        advice.append({"fuel": fuel, "crash": crash, "ending": ending})
+    return advice
+
+
+def show_destination_advice(player, estimate):
+    """One line of NOVA's estimate under an airport in the zone listing."""
+    line = f"    🛰️ NOVA: ~{estimate['fuel']:.0f} fuel | crash risk {estimate['crash']:.0%}"
+    if estimate["ending"]:
+        line += f" | ends the run: {estimate['ending']}"
+    elif estimate["fuel"] >= player["fuel"]:
+        line += " | ⚠️ would drain the tank"
+    print(line)
+
 # =====================================================================
 # NOVA Dynamic Dialogue System
 # =====================================================================
@@ -297,17 +513,65 @@ def nova_dynamic_dialogue(player, zone_name):
 
 # ✨ Typing effect for cinematic feel
 def type_text(text, delay=0.03):
-    """Print text with typing animation."""
-    for char in text:
-        sys.stdout.write(char)
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
+    """Print text with typing animation (any key skips ahead)."""
+    render_text(text, delay)
 
 # ✨ Fancy divider
 def divider():
     print("=============================================")
 
+# 🏆 Hall of Fame screen
+HALL_OF_FAME_VIEWS = {
+    "r": "Most Recent Pilots",
+    "s": "Most Survivors Rescued",
+    "f": "Most Fuel Left",
+    "e": "Most Common Endings"
+}
+
+
+def format_run(run):
+    return (f"{run['played_at']} | {run['player_name']} → {run['ending']} "
+            f"| Survivors: {run['survivors']} | Fuel Left: {run['fuel']}")
+
+
+def show_hall_of_fame(page_size=10):
+    """Hall of Fame screen: each page is drawn in one go, older runs a page at a time."""
+    view, before = "r", None
+    while True:
+        lines = []
+        runs = []
+        try:
+            if view == "r":
+                runs = database.fetch_runs(page_size, before)
+            elif view == "e":
+                lines = [f"{row['ending']}: {row['runs']} pilot(s)" for row in database.fetch_ending_counts(page_size)]
+            else:
+                runs = database.fetch_top_runs("survivors" if view == "s" else "fuel", page_size)
+            lines = lines or [format_run(run) for run in runs]
+            lines = lines or ["No recorded pilots found. You could be the first."]
+        except Exception as e:
+            lines = [f"⚠️ Database link error: {e}"]
+
+        os.system("cls" if os.name == "nt" else "clear")
+        more = view == "r" and len(runs) == page_size
+        print("\n".join([
+            "=============================================",
+            f"🏆 HALL OF FAME – {HALL_OF_FAME_VIEWS[view]}",
+            "=============================================",
+            *lines,
+            "",
+            ("[N] Older  " if more else "") + "[R] Recent  [S] Survivors  [F] Fuel  [E] Endings  [ENTER] Menu"
+        ]))
+
+        choice = read_line("> ").strip().lower()
+        if not choice:
+            return
+        if choice == "n" and more:
+            before = runs[-1]
+        elif choice in HALL_OF_FAME_VIEWS:
+            view, before = choice, None
+
+
 # 🧭 Animated Main Menu (with Resume Option)
 def main_menu():
     """Animated main menu for Flight AURORA."""
@@ -316,7 +580,7 @@ def main_menu():
         divider()
         type_text("           ✈️  FLIGHT AURORA SYSTEM BOOTING...", 0.02)
         divider()
-        time.sleep(0.5)
+        clock.sleep(0.5)
 
         print("""
 1. 🛫 Start New Mission
@@ -325,32 +589,18 @@ def main_menu():
 4. ❌ Exit
 """)
 
-        choice = input("Select an option (1–4): ").strip()
+        choice = read_line("Select an option (1–4): ").strip()
 
         # --- Start New Game ---
         if choice == "1":
             os.system("cls" if os.name == "nt" else "clear")
             type_text("🛰️  Initializing systems...", 0.03)
-            time.sleep(1)
+            clock.sleep(1)
             return "start"
 
         # --- View Hall of Fame ---
         elif choice == "2":
-            os.system("cls" if os.name == "nt" else "clear")
-            divider()
-            type_text("🏆 HALL OF FAME – Past Pilots", 0.02)
-            divider()
-            try:
-                past_runs = fetch_runs()
-                if past_runs:
-                    for run in past_runs:
-                        type_text(f"{run['played_at']} | {run['player_name']} → {run['ending']} "
-                                  f"| Survivors: {run['survivors']} | Fuel Left: {run['fuel']}", 0.01)
-                else:
-                    type_text("No recorded pilots found. You could be the first.", 0.02)
-            except Exception as e:
-                type_text(f"⚠️ Database link error: {e}", 0.02)
-            input("\nPress ENTER to return to menu...")
+            show_hall_of_fame()
 
         # --- Instructions ---
         elif choice == "3":
@@ -375,19 +625,19 @@ def main_menu():
 🌩️ REMINDER:
     Not all airports are real. Some whisper. Some vanish.
 """, 0.01)
-            input("Press ENTER to return to main menu...")
+            read_line("Press ENTER to return to main menu...")
 
         # --- Exit ---
         elif choice == "4":
             os.system("cls" if os.name == "nt" else "clear")
             type_text("👋 Shutting down FLIGHT AURORA system...", 0.02)
-            time.sleep(1)
+            clock.sleep(1)
             type_text("Goodbye, Pilot. The skies will remember you.", 0.03)
             sys.exit()
 
         else:
             type_text("⚠️ Invalid input. Please enter 1–5.", 0.02)
-            time.sleep(1)
+            clock.sleep(1)
 
 
 def story_intro():
@@ -396,81 +646,241 @@ def story_intro():
     print("=============================================")
     print("         ✈️  Welcome to Flight Aurora ")
     print("=============================================\n")
-    time.sleep(2)
+    clock.sleep(2)
 
     # Ask for player name early
-    player_name = input("🧭 Enter your pilot name: ").strip().title()
+    player_name = read_line("🧭 Enter your pilot name: ").strip().title()
     os.system("cls" if os.name == "nt" else "clear")
 
     # --- Cinematic Story Begins ---
     print("🌌 [NARRATOR] The world above the clouds has changed.")
-    time.sleep(3)
+    clock.sleep(3)
     print("🌌 [NARRATOR] Airports flicker in and out of existence. Maps no longer hold meaning.")
-    time.sleep(3)
+    clock.sleep(3)
     print("🌌 [NARRATOR] Some say a light still shines beyond the storm — the Aurora Beacon.")
-    time.sleep(4)
+    clock.sleep(4)
 
     print("\n💫 SYSTEM BOOT: AI NAVIGATOR – NOVA ONLINE.")
-    time.sleep(2)
+    clock.sleep(2)
     print(f"NOVA: 'Pilot {player_name}, systems are unstable... but you’re still here.'")
-    time.sleep(3)
+    clock.sleep(3)
     print(f"NOVA: 'Our world is vanishing, one airport at a time. You’re the last pilot still transmitting.'")
-    time.sleep(4)
+    clock.sleep(4)
     print(f"NOVA: 'Your mission, {player_name}: locate and reach the Aurora Beacon.'")
-    time.sleep(3)
+    clock.sleep(3)
     print("NOVA: 'It’s the last signal left in the northern sky… and maybe humanity’s last hope.'")
-    time.sleep(4)
+    clock.sleep(4)
 
     print("\n⚠️ SYSTEM CHECK:")
     print("   ✈️ Fuel System: ONLINE")
     print("   🧭 Navigation: UNSTABLE")
     print("   ☁️ Weather Forecast: CHAOTIC")
     print("   💾 Database Link: ACTIVE")
-    time.sleep(3)
+    clock.sleep(3)
 
     print(f"\nNOVA: 'I’ll guide you, {player_name}, but your instincts will decide your fate.'")
-    time.sleep(3)
+    clock.sleep(3)
     print("NOVA: 'Ready your engines... the sky won’t wait much longer.'")
-    input("\n🔹 Press ENTER to begin your journey... ")
+    read_line("\n🔹 Press ENTER to begin your journey... ")
     os.system("cls" if os.name == "nt" else "clear")
 
     return player_name
 
-def run_game(player_name):
-    # === 🏆 Show Hall of Fame ===
-    try:
-            past_runs = fetch_runs()
-            print("=== 🏆 HALL OF FAME ===")
-            player = create_player()
+def run_game(player_name, rngs=None, ask=read_line, prefetch=None):
+    """
+    Play one mission. rngs seeds every subsystem; ask reads each player decision.
+    prefetch is a started WorldPrefetch for the same rngs, if there is one.
+    """
+    return drive(Mission(player_name, rngs, prefetch), ask)
+
+
+# =====================================================================
+# World Prefetch
+# =====================================================================
+class WorldPrefetch:
+    """
+    Loads the Hall of Fame and builds the mission's world. start() does
+    it on a background thread, so the database round trips happen while
+    the intro plays; load() does it right away. Errors are kept and
+    reported by the mission when it picks the results up.
+    """
+
+    def __init__(self, rngs):
+        self.rngs = rngs
+        self.past_runs = self.runs_error = None
+        self.world = self.world_error = None
+        self._thread = threading.Thread(target=self.load, name="world-prefetch", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def load(self):
+        try:
+            self.past_runs = database.fetch_runs()
+        except Exception as e:
+            self.runs_error = e
+        # The world only draws from its own stream, rngs.world
+        try:
+            self.world = World.build_game_world(self.rngs.world)
+        except Exception as e:
+            self.world_error = e
+        return self
+
+    def wait(self):
+        if self._thread.is_alive():
+            self._thread.join()
+        return self
+
+
+# =====================================================================
+# Mission State Machine
+# =====================================================================
+# Phantom airport effect -> the final choice it forces ("loop" flies on)
+PHANTOM_ENDINGS = {"win": "AURORA", "trap": "LOOP", "stranded": "DEC", "crash": "HAUNT", "death": "STORM"}
+
+
+class Mission:
+    """
+    One mission as an explicit state machine. All of its state lives in
+    plain attributes, so a mission waiting for a decision can be saved with
+    to_dict() and picked up later, anywhere, with from_dict().
+
+    It is also a decision flow (see flow.py): send() an answer to get the
+    next prompt; the mission's result is (result, player_name, player).
+
+    Every state is a _state_* method. A method either moves straight on
+    by setting self.state and returning None, or asks for a decision by
+    returning a prompt; the answer is then handed to the next state.
+    """
+
+    def __init__(self, player_name, rngs=None, prefetch=None):
+        self.player_name = player_name
+        self.rngs = rngs or RNGContext()
+        self.player = create_player()
+        self.prefetch = prefetch   # WorldPrefetch, used up by the start state
+        self.world = None
+        self.state = "start"
+        self.zone = 0              # index of the current zone in self.world
+        self.origin = HOME_BASE
+        self.distances = {}        # ident -> km from origin, for the current zone
+        self.chosen = 0            # index of the chosen destination airport
+        self.weather = None        # weather of the current flight
+        self.final_choice = None
+        self.result = None
+
+    # -------------------------------
+    # Flow protocol
+    # -------------------------------
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.send(None)
+
+    def send(self, answer):
+        """Answer the pending prompt; returns the next one (StopIteration when done)."""
+        while self.state != "done":
+            with metrics.timer("phase." + self.state):
+                prompt = getattr(self, "_state_" + self.state)(answer)
+            answer = None
+            if prompt is not None:
+                return prompt
+        raise StopIteration((self.result, self.player_name, self.player))
+
+    def close(self):
+        pass
+
+    # -------------------------------
+    # Saving and restoring
+    # -------------------------------
+    def to_dict(self):
+        state = dict(vars(self))
+        state["rngs"] = self.rngs.to_dict()
+        state["player"] = self.player.to_dict()
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        mission = cls.__new__(cls)
+        vars(mission).update(state)
+        mission.rngs = RNGContext.from_dict(state["rngs"])
+        mission.player = Player.from_dict(state["player"])
+        mission.origin = tuple(state["origin"])
+        return mission
+
+    # -------------------------------
+    # States
+    # -------------------------------
+    @property
+    def zone_name(self):
+        return list(self.world)[self.zone]
+
+    def _state_start(self, answer):
+        loaded = self.prefetch.wait() if self.prefetch else WorldPrefetch(self.rngs).load()
+        self.prefetch = None
+
+        # === 🏆 Show Hall of Fame ===
+        if loaded.runs_error is None:
+                past_runs = loaded.past_runs
+                print("=== 🏆 HALL OF FAME ===")
+
+                if past_runs:
+                    ...
+        else:
+            print("⚠️ Could not load Hall of Fame:", loaded.runs_error)
+
+        # Build world zones
+        if loaded.world_error is not None:
+            raise loaded.world_error
+        self.world = loaded.world
+
+        # === Choose difficulty ===
+        show_difficulty_menu()
+        self.state = "difficulty"
+        return DIFFICULTY_PROMPT
+
+    def _state_difficulty(self, answer):
+        player = self.player
+        difficulty = pick_difficulty(answer)
+        if not difficulty:
+            return DIFFICULTY_PROMPT
+        player["difficulty"] = difficulty
+
+        if difficulty == "Easy":
+            player["fuel"] = 150
+            player["chances"] = 5
+        elif difficulty == "Normal":
+            player["fuel"] = 100
+            player["chances"] = 3
+        elif difficulty == "Hard":
+            player["fuel"] = 70
+            player["chances"] = 2
+
+        print(f"\n🎮 Difficulty set to {difficulty}! Starting with {player['fuel']} fuel and {player['chances']} chances.")
+        show_role_menu()
+        self.state = "role"
+        return ROLE_PROMPT
+
+    def _state_role(self, answer):
+        role = pick_role(answer)
+        if not role:
+            return ROLE_PROMPT
+        self.player["role"] = role
+        print(f"\n✨ You are playing as a {role}!\n")
+        self.state = "zone_entry"
+        return None
+
+    def _state_zone_entry(self, answer):
+        # Progress through zones in order; past the last one the mission is won
+        if self.zone >= len(self.world):
+            return self._end("AURORA")
+        player, rngs = self.player, self.rngs
+        zone_name = self.zone_name
+        # Airports within reach of wherever the last flight landed
+        World.fill_zone(self.world, zone_name, self.origin[3:5], rngs.world)
+        data = self.world[zone_name]
 
-            if past_runs:
-                ...
-    except Exception as e:
-        print("⚠️ Could not load Hall of Fame:", e)
-
-    # Build world zones
-    game_world = build_game_world()
-
-    # === Choose difficulty ===
-    difficulty = choose_difficulty()
-    player["difficulty"] = difficulty
-
-    if difficulty == "Easy":
-        player["fuel"] = 150
-        player["chances"] = 5
-    elif difficulty == "Normal":
-        player["fuel"] = 100
-        player["chances"] = 3
-    elif difficulty == "Hard":
-        player["fuel"] = 70
-        player["chances"] = 2
-
-    print(f"\n🎮 Difficulty set to {difficulty}! Starting with {player['fuel']} fuel and {player['chances']} chances.")
-    player["role"] = choose_role()
-    print(f"\n✨ You are playing as a {player['role']}!\n")
-
-    # Progress through zones in order
-    for zone_name, data in game_world.items():
         print("\n=====================================")
         print(f"🌍 Entering {zone_name}")
         show_map_progress(zone_name)
@@ -481,15 +891,14 @@ def run_game(player_name):
         show_hud(player)
         show_inventory(player)
         # Apply weather after mid-flight events
-        weather = get_weather(zone_name)
+        weather = weather_system.get_weather(zone_name, rngs.weather)
         print(
             f"☁️ Weather: {weather['condition']} | Fuel Penalty: {weather['fuel_penalty']} | Crash Chance: {weather['crash_chance'] * 100:.0f}%")
         nova_weather_alert(weather)
         nova_dynamic_comment(player, "weather")
 
-        refuel_or_upgrade(player)
+        refuel_or_upgrade(player, rngs.refuel)
 
-        # (flight logic here...)
         # NOVA checks in before next jump
         nova_dynamic_comment(player, "end_zone")
 
@@ -499,40 +908,61 @@ def run_game(player_name):
 
         # Zone-specific warnings
         if "Transition" in zone_name:
-            nova_transition_warning()
+            dialogue.nova_transition_warning()
         elif "Twilight" in zone_name:
-            nova_twilight_warning()
-            cartographer_dialogue()
+            dialogue.nova_twilight_warning()
+            dialogue.cartographer_dialogue()
         elif "Crisis" in zone_name:
-            nova_crisis_warning()
+            dialogue.nova_crisis_warning()
         elif "Aurora" in zone_name:
-            nova_final_warning()
+            dialogue.nova_final_warning()
 
         # NOVA gives a weather prediction for the next zone
-        nova_weather_prediction(zone_name)
+        if self.zone + 1 < len(self.world):
+            nova_weather_prediction(list(self.world)[self.zone + 1])
+
+        # Distances from where we are now to every real airport in the zone
+        real_airports = [a for a in data["airports"] if "ident" in a]
+        self.distances = dict(zip(
+            (a["ident"] for a in real_airports),
+            distance_matrix([self.origin[3:5]], [airport_position(a) for a in real_airports])[0]
+        ))
 
-        # Show airports
+        # Show airports, each with NOVA's estimate for the flight there
         print("\nAirports in this zone:")
-        for idx, airport in enumerate(data["airports"], start=1):
+        advice = nova_destination_advice(player, zone_name, data["airports"], self.distances)
+        for idx, (airport, estimate) in enumerate(zip(data["airports"], advice), start=1):
             if "effect" in airport:  # phantom/aurora airports
                 print(f" {idx}. {airport['id']} | {airport['name']} (Effect: {airport['effect']})")
             else:  # real DB airports
                 print(f" {idx}. {airport['ident']} | {airport['name']} ({airport['iso_country']}) [{airport['type']}]")
-            print(f"    ✧ Clue: {get_airport_clue(airport, data['prefix'])}")
+            print(f"    ✧ Clue: {World.get_airport_clue(airport, data['prefix'])}")
+            show_destination_advice(player, estimate)
+
+        self.state = "destination"
+        return "Choose your destination (number): "
 
-        # Player chooses
+    def _state_destination(self, answer):
+        airports = self.world[self.zone_name]["airports"]
         try:
-            choice = int(input("Choose your destination (number): ")) - 1
-            chosen_airport = data["airports"][choice]
+            self.chosen = int(answer) - 1
+            airports[self.chosen]
         except (ValueError, IndexError):
             print("⚠️ Invalid input! Defaulting to first airport.")
-            chosen_airport = data["airports"][0]
+            self.chosen = 0
+        self.state = "flight"
+        return None
+
+    def _state_flight(self, answer):
+        player, rngs = self.player, self.rngs
+        zone_name = self.zone_name
+        chosen_airport = self.world[zone_name]["airports"][self.chosen]
 
         # Random mid-flight event
-        random_flight_event(player)
+        random_flight_event(player, rngs.events)
 
         # Apply weather
-        weather = get_weather(zone_name)
+        weather = self.weather = weather_system.get_weather(zone_name, rngs.weather)
         print(
             f"☁️ Weather: {weather['condition']} | Fuel Penalty: {weather['fuel_penalty']} | Crash Chance: {weather['crash_chance'] * 100:.0f}%")
         nova_weather_alert(weather)
@@ -541,44 +971,62 @@ def run_game(player_name):
 
         # Fuel cost (distance + weather)
         if "ident" in chosen_airport:
-            origin = (chosen_airport['ident'], chosen_airport['name'], chosen_airport['iso_country'],
-                      random.uniform(-60, 60), random.uniform(-120, 120))
             dest = (chosen_airport['ident'], chosen_airport['name'], chosen_airport['iso_country'],
-                    random.uniform(-60, 60), random.uniform(-120, 120))
-            fuel_cost = calculate_fuel_cost(origin, dest, weather, player)
+                    *airport_position(chosen_airport))
+            fuel_cost = calculate_fuel_cost(self.origin, dest, weather, player,
+                                            distance=self.distances[chosen_airport['ident']])
+            self.origin = dest
         else:
             # phantom airports (no coords, so flat cost)
-            fuel_cost = 15 + weather["fuel_penalty"]
+            fuel_cost = flight_fuel_cost(None, weather["fuel_penalty"], player.get("role"))
             if player.get("role") == "Engineer":
-                fuel_cost = int(fuel_cost * 0.8)
                 print("🔧 Engineer skill reduces fuel consumption!")
 
         update_fuel(player, fuel_cost)
         print(f"🛢️ Fuel consumed: {fuel_cost} | Remaining: {player['fuel']}")
 
-        refuel_or_upgrade(player)
-        nova_dynamic_commentary(player)
+        refuel_or_upgrade(player, rngs.refuel)
+        dialogue.nova_dynamic_commentary(player, rngs.dialogue)
 
         # 25% chance to trigger a branching story event
-        if random.random() < 0.25:
-            outcome = branching_story_event(player, zone_name)
-            if outcome:  # if event ends game (Aurora storm crash)
-                return outcome, player_name, player
+        self.state = "approach"
+        if rngs.story.random() < 0.25:
+            prompt = show_story_event(zone_name)
+            if prompt is not None:
+                self.state = "story_event"
+                return prompt
+        return None
 
+    def _state_story_event(self, answer):
+        final_choice = resolve_story_event(self.player, self.zone_name, answer, self.rngs.story)
+        if final_choice:  # if event ends game (Aurora storm crash)
+            return self._end(final_choice)
+        self.state = "approach"
+        return None
 
+    def _state_approach(self, answer):
         # === Special branching endings in Aurora zone ===
-        if "Aurora" in zone_name:
+        self.state = "crash"
+        if "Aurora" in self.zone_name:
             # Compass Ending (if Storm Compass is in inventory)
-            if "Storm Compass" in player["inventory"]:
-                return check_ending(player, "COMPASS")
+            if "Storm Compass" in self.player["inventory"]:
+                return self._end("COMPASS")
 
             # Rebellion Ending (player choice)
-            rebellion_choice = input("\n🚀 You see Aurora Beacon shining ahead... Do you want to turn away and forge your own path? (y/n): ").lower()
-            if rebellion_choice == "y":
-                return check_ending(player, "REBELLION")
+            self.state = "rebellion"
+            return "\n🚀 You see Aurora Beacon shining ahead... Do you want to turn away and forge your own path? (y/n): "
+        return None
 
+    def _state_rebellion(self, answer):
+        if answer.lower() == "y":
+            return self._end("REBELLION")
+        self.state = "crash"
+        return None
+
+    def _state_crash(self, answer):
+        player = self.player
         # Apply inventory effects on crash chance
-        crash_chance = weather["crash_chance"]
+        crash_chance = self.weather["crash_chance"]
 
         if "Storm Shield" in player["inventory"]:
             crash_chance *= 0.5
@@ -590,56 +1038,77 @@ def run_game(player_name):
             print("🧭 Navigator skill reduces phantom crash risk!")
 
         # Crash roll
-        if random.random() < crash_chance:
+        if self.rngs.crash.random() < crash_chance:
             print("⚡ The storm overwhelms you!")
-            result = check_ending(player, "STORM")
-            return result, player_name, player
+            return self._end("STORM")
 
         # Phantom airports effects
-        if "effect" in chosen_airport:
-            effect = chosen_airport["effect"]
-            if effect == "win":
-                result = check_ending(player, "AURORA")
-                return result, player_name, player
-            elif effect == "trap":
-                result = check_ending(player, "LOOP")
-                return result, player_name, player
-            elif effect == "stranded":
-                result = check_ending(player, "DEC")
-                return result, player_name, player
-            elif effect == "crash":
-                result = check_ending(player, "HAUNT")
-                return result, player_name, player
-            elif effect == "death":
-                result = check_ending(player, "STORM")
-                return result, player_name, player
+        effect = self.world[self.zone_name]["airports"][self.chosen].get("effect")
+        if effect in PHANTOM_ENDINGS:
+            return self._end(PHANTOM_ENDINGS[effect])
 
         # Crisis zone → survivor mission
-        if "Crisis" in zone_name and random.random() < 0.5:  # 50% chance
+        self.state = "next_zone"
+        if "Crisis" in self.zone_name and self.rngs.crash.random() < 0.5:  # 50% chance
             print("\n🚨 Distress call detected! Survivors need rescue.")
-            action = input("Do you want to rescue them? (y/n): ").lower()
-            if action == "y":
-                print("🛬 You land and rescue survivors, but it costs extra fuel.")
-                rescue_survivors(player, 1)
-                update_fuel(player, 5)
-                nova_dynamic_comment(player, "end_zone")
-                # Chance to find item
-                chance = 0.3
-                if player.get("role") == "Leader":
-                    chance = 0.45  # Leaders inspire survivors more
-                if random.random() < chance:
-                    add_item(player, "Storm Shield")
-                    print("✨ You found a Storm Shield! Crash risk reduced.")
-            else:
-                print("🛫 You ignore the call. Fuel saved, but survivors left behind.")
-    # If reached here, final ending check
-    result = check_ending(player, "AURORA")
-    return result, player_name, player
+            self.state = "rescue"
+            return "Do you want to rescue them? (y/n): "
+        return None
+
+    def _state_rescue(self, answer):
+        player = self.player
+        if answer.lower() == "y":
+            print("🛬 You land and rescue survivors, but it costs extra fuel.")
+            rescue_survivors(player, 1)
+            update_fuel(player, 5)
+            nova_dynamic_comment(player, "end_zone")
+            # Chance to find item
+            chance = 0.3
+            if player.get("role") == "Leader":
+                chance = 0.45  # Leaders inspire survivors more
+            if self.rngs.crash.random() < chance:
+                add_item(player, "Storm Shield")
+                print("✨ You found a Storm Shield! Crash risk reduced.")
+        else:
+            print("🛫 You ignore the call. Fuel saved, but survivors left behind.")
+        self.state = "next_zone"
+        return None
+
+    def _state_next_zone(self, answer):
+        self.zone += 1
+        self.state = "zone_entry"
+        return None
+
+    def _end(self, final_choice):
+        self.final_choice = final_choice
+        self.state = "ending"
+        return None
+
+    def _state_ending(self, answer):
+        self.result = endings.check_ending(self.player, self.final_choice)
+        self.state = "done"
+        return None
+
 
 # =====================================================================
 # Run
 # =====================================================================
 if __name__ == "__main__":
+    # A bare `python game.py` skips argparse: importing it costs ~10 ms of startup
+    profile, metrics_out = False, None
+    if len(sys.argv) > 1:
+        import argparse
+
+        parser = argparse.ArgumentParser(description="Flight AURORA")
+        parser.add_argument("--profile", action="store_true",
+                            help="print where the session spent its time at game over")
+        parser.add_argument("--metrics-out", metavar="PATH",
+                            help="write the timing histograms to PATH as JSON at game over")
+        args = parser.parse_args()
+        profile, metrics_out = args.profile, args.metrics_out
+    if profile or metrics_out:
+        metrics.enable()
+
     os.system("cls" if os.name == "nt" else "clear")
 
     # 🧭 Show Main Menu (Start / Resume / Hall of Fame / Instructions / Exit)
@@ -647,17 +1116,41 @@ if __name__ == "__main__":
 
     # ✈️ Start a New Mission
     if menu_action == "start":
+        # Load the Hall of Fame and the world while the intro plays
+        rngs = RNGContext()
+        prefetch = WorldPrefetch(rngs).start()
         player_name = story_intro()
         os.system("cls" if os.name == "nt" else "clear")
-        result, _, player = run_game(player_name)
+        # Flight recorder: seed + answers, enough to replay this run exactly
+        replay_log = replay.ReplayLog(rngs.seed, player_name)
+        try:
+            result, _, player = run_game(player_name, rngs, replay_log.recorder(read_line), prefetch)
+        finally:
+            replay_log.save(replay.LAST_RUN_PATH)
     # 🏁 Show Final Results
     print(f"\n=== GAME OVER: {result} ===")
     try:
-        save_run(player_name, result, player["survivors"], player["fuel"])
-        print("🏆 Your run has been saved to the Hall of Fame!")
+        # save_run only queues the row; wait for the writer to say where it went
+        before = database.run_writer_stats()
+        database.save_run(player_name, result, player["survivors"], player["fuel"])
+        flushed = database.flush_runs()
+        after = database.run_writer_stats()
+        if after["written"] > before["written"]:
+            print("🏆 Your run has been saved to the Hall of Fame!")
+        elif after["journaled"] > before["journaled"]:
+            print("💾 Hall of Fame offline — your run is kept locally and will be added when it is back.")
+        elif not flushed:
+            print("⏳ Your run is still on its way to the Hall of Fame.")
+        else:
+            print("⚠️ Could not save run (see the error above).")
     except Exception as e:
         print("⚠️ Could not save run:", e)
 
+    if metrics.is_enabled():
+        if profile:
+            metrics.print_report("Session profile")
+        if metrics_out:
+            metrics.write(metrics_out)
 
 
 
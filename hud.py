@@ -2,24 +2,128 @@
 # hud.py – Player HUD & Core Gameplay Utilities
 # ============================================
 import sys
-import time
 import random
 
+import clock
+from flow import drive
+
 # ============================================================
 # PLAYER CREATION
 # ============================================================
+# Every item the game can hand out; a player's inventory is a bitset over these.
+ITEMS = ("Engine Upgrade", "Extra Fuel Tank", "Storm Compass", "Storm Shield", "Fuel Canister")
+ITEM_BITS = {item: 1 << bit for bit, item in enumerate(ITEMS)}
+
+
+class Player:
+    """
+    Compact player state: fixed __slots__ and the inventory as an int bitset.
+    Fast code uses attributes and has()/add(); everything else can keep
+    treating it as the old dict (player["fuel"], player.get("role"),
+    "Storm Compass" in player["inventory"], ...).
+    """
+    __slots__ = ("fuel", "survivors", "chances", "zone", "items", "role", "difficulty", "engine_boost")
+    KEYS = ("fuel", "survivors", "chances", "zone", "inventory", "role", "difficulty", "engine_boost")
+
+    def __init__(self, fuel=100, survivors=0, chances=3, zone="Reality", items=0,
+                 role=None, difficulty="Normal", engine_boost=False):
+        self.fuel = fuel
+        self.survivors = survivors
+        self.chances = chances
+        self.zone = zone
+        self.items = items
+        self.role = role
+        self.difficulty = difficulty
+        self.engine_boost = engine_boost
+
+    def has(self, item):
+        return self.items & ITEM_BITS[item] != 0
+
+    def add(self, item):
+        """Add an item; returns False if the player already had it."""
+        bit = ITEM_BITS[item]
+        if self.items & bit:
+            return False
+        self.items |= bit
+        return True
+
+    # --- dict-compatible adapter ---
+    def __getitem__(self, key):
+        if key in _PLAYER_FIELDS:
+            return getattr(self, key)
+        if key == "inventory":
+            return Inventory(self)
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _PLAYER_FIELDS:
+            setattr(self, key, value)
+        elif key == "inventory":
+            self.items = sum(ITEM_BITS[item] for item in set(value))
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in Player.KEYS
+
+    def get(self, key, default=None):
+        return self[key] if key in Player.KEYS else default
+
+    def keys(self):
+        return Player.KEYS
+
+    def to_dict(self):
+        return {key: list(self[key]) if key == "inventory" else self[key] for key in Player.KEYS}
+
+    @classmethod
+    def from_dict(cls, data):
+        player = cls()
+        for key, value in data.items():
+            player[key] = value
+        return player
+
+    def __eq__(self, other):
+        if isinstance(other, Player):
+            other = other.to_dict()
+        return self.to_dict() == other
+
+    def __repr__(self):
+        return f"Player({self.to_dict()})"
+
+
+_PLAYER_FIELDS = frozenset(Player.KEYS) - {"inventory"}
+
+
+class Inventory:
+    """List-like view of a Player's item bits, as returned by player["inventory"]."""
+    __slots__ = ("player",)
+
+    def __init__(self, player):
+        self.player = player
+
+    def __contains__(self, item):
+        return self.player.items & ITEM_BITS.get(item, 0) != 0
+
+    def __iter__(self):
+        items = self.player.items
+        return (item for item in ITEMS if items & ITEM_BITS[item])
+
+    def __len__(self):
+        return bin(self.player.items).count("1")
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def append(self, item):
+        self.player.add(item)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 def create_player():
     """Initialize a new player profile."""
-    return {
-        "fuel": 100,
-        "survivors": 0,
-        "chances": 3,
-        "zone": "Reality",
-        "inventory": [],
-        "role": None,
-        "difficulty": "Normal",
-        "engine_boost": False
-    }
+    return Player()
 
 
 # ============================================================
@@ -43,8 +147,17 @@ def show_hud(player):
 # ============================================================
 def update_fuel(player, amount):
     """Increase or decrease fuel, clamped safely between 0 and 200."""
-    player["fuel"] = max(0, min(200, player.get("fuel", 0) - amount))
-    if player["fuel"] <= 0:
+    player["fuel"] = burn_fuel(player.get("fuel", 0), amount)
+    warn_if_out_of_fuel(player["fuel"])
+
+
+def burn_fuel(fuel, amount):
+    """Fuel left after update_fuel(amount), without any output."""
+    return max(0, min(200, fuel - amount))
+
+
+def warn_if_out_of_fuel(fuel):
+    if fuel <= 0:
         print("⚠️  WARNING: Fuel depleted! Systems critical.")
 
 
@@ -54,11 +167,17 @@ def update_fuel(player, amount):
 def rescue_survivors(player, count=1):
     """Add rescued survivors to player data."""
     player["survivors"] += count
+    show_rescued(player, count)
+
+def show_rescued(player, count):
     print(f"👥 {count} survivor(s) rescued! Total: {player['survivors']}")
 
 def lose_chance(player):
     """Reduce a player chance after failure."""
     player["chances"] = max(0, player["chances"] - 1)
+    show_lost_chance(player)
+
+def show_lost_chance(player):
     print(f"💔 You lost a chance. Remaining chances: {player['chances']}")
 
 
@@ -67,10 +186,19 @@ def lose_chance(player):
 # ============================================================
 def add_item(player, item):
     """Add an item to the player's inventory."""
-    if "inventory" not in player:
-        player["inventory"] = []
-    if item not in player["inventory"]:
-        player["inventory"].append(item)
+    show_item_added(item, gain_item(player, item))
+
+
+def gain_item(player, item):
+    """add_item without any output; returns False if the player already had it."""
+    if item in player["inventory"]:
+        return False
+    player["inventory"].append(item)
+    return True
+
+
+def show_item_added(item, added):
+    if added:
         print(f"🎒 Added to inventory: {item}")
     else:
         print(f"🧳 You already have {item}.")
@@ -99,45 +227,80 @@ def change_zone(player, new_zone):
 # ============================================================
 # ROLE & DIFFICULTY SELECTION
 # ============================================================
-def choose_role():
+ROLES = {
+    "1": "Navigator 🧭 (Reduced crash chance)",
+    "2": "Engineer 🔧 (Lower fuel cost)",
+    "3": "Leader 👥 (Higher survivor rescue odds)"
+}
+ROLE_PROMPT = "Enter role number: "
+DIFFICULTY_PROMPT = "Enter 1, 2, or 3: "
+
+
+def choose_role(ask=input):
     """Allow player to choose a special role."""
-    roles = {
-        "1": "Navigator 🧭 (Reduced crash chance)",
-        "2": "Engineer 🔧 (Lower fuel cost)",
-        "3": "Leader 👥 (Higher survivor rescue odds)"
-    }
-    print("\n🎭 Choose your role:")
-    for key, desc in roles.items():
-        print(f" {key}. {desc}")
+    return drive(choose_role_flow(), ask)
+
 
+def choose_role_flow():
+    """Role selection as a decision flow (see flow.py)."""
+    show_role_menu()
     while True:
-        choice = input("Enter role number: ").strip()
-        if choice in roles:
-            role_name = roles[choice].split()[0]
-            print(f"✅ Role assigned: {roles[choice]}")
+        role_name = pick_role((yield ROLE_PROMPT))
+        if role_name:
             return role_name
-        print("❌ Invalid choice. Please select 1, 2, or 3.")
 
 
-def choose_difficulty():
+def show_role_menu():
+    print("\n🎭 Choose your role:")
+    for key, desc in ROLES.items():
+        print(f" {key}. {desc}")
+
+
+def pick_role(choice):
+    """Role name for a menu answer, or None (after a warning) if it is invalid."""
+    choice = choice.strip()
+    if choice in ROLES:
+        print(f"✅ Role assigned: {ROLES[choice]}")
+        return ROLES[choice].split()[0]
+    print("❌ Invalid choice. Please select 1, 2, or 3.")
+    return None
+
+
+def choose_difficulty(ask=input):
     """Allow player to select game difficulty."""
+    return drive(choose_difficulty_flow(), ask)
+
+
+def choose_difficulty_flow():
+    """Difficulty selection as a decision flow (see flow.py)."""
+    show_difficulty_menu()
+    while True:
+        difficulty = pick_difficulty((yield DIFFICULTY_PROMPT))
+        if difficulty:
+            return difficulty
+
+
+def show_difficulty_menu():
     print("\n🎯 Select Difficulty:")
     print(" 1.🟢  Easy   – More fuel & chances")
     print(" 2.🟡 Normal – Balanced experience")
     print(" 3.🔴Hard   – Real pilot challenge")
 
-    while True:
-        choice = input("Enter 1, 2, or 3: ").strip()
-        if choice == "1":
-            print("🟢 Easy mode engaged.")
-            return "Easy"
-        elif choice == "2":
-            print("🟡 Normal mode selected.")
-            return "Normal"
-        elif choice == "3":
-            print("🔴 Hard mode — may the skies favor you.")
-            return "Hard"
-        print("❌ Invalid input. Try again.")
+
+def pick_difficulty(choice):
+    """Difficulty for a menu answer, or None (after a warning) if it is invalid."""
+    choice = choice.strip()
+    if choice == "1":
+        print("🟢 Easy mode engaged.")
+        return "Easy"
+    elif choice == "2":
+        print("🟡 Normal mode selected.")
+        return "Normal"
+    elif choice == "3":
+        print("🔴 Hard mode — may the skies favor you.")
+        return "Hard"
+    print("❌ Invalid input. Try again.")
+    return None
 
 
 # ============================================================
@@ -157,7 +320,7 @@ def show_map_progress(zone_name):
     for _ in range(3):
         sys.stdout.write(".")
         sys.stdout.flush()
-        time.sleep(0.3)
+        clock.sleep(0.3)
 
     print("\n🗺️ Flight Path:", " → ".join(progress))
     print(f"   ✈️  Now entering: {zone_name} Zone\n")
@@ -0,0 +1,209 @@
+# ============================================
+# metrics.py – Hot-path timers and histograms for Flight AURORA
+# ============================================
+# Timings are kept in log2 histograms: one bucket per power of two
+# nanoseconds, so recording a sample is a clock read, a bit_length and an
+# increment. Instrumentation is off unless enabled, and then costs a
+# single flag check per call:
+#
+#     python game.py --profile              (per-phase breakdown at game over)
+#     python game.py --metrics-out run.json (histograms as JSON)
+#     python server.py --metrics-port 9100  (Prometheus text on /metrics)
+#     AURORA_METRICS=1                      (enable without a flag)
+#
+# Names are dotted: db.*, world.*, render.*, input, phase.<mission state>,
+# endings.*. Phase times include the rendering and database calls made
+# inside them.
+
+import functools
+import os
+import threading
+from time import perf_counter_ns
+
+BUCKETS = 48   # 2^47 ns is about 39 hours; anything longer lands in the last bucket
+
+_enabled = os.environ.get("AURORA_METRICS", "") not in ("", "0")
+_histograms = {}
+_counters = {}
+_lock = threading.Lock()
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+# -------------------------------
+# Histograms
+# -------------------------------
+class Histogram:
+    """Count, sum and log2 buckets of a duration in nanoseconds."""
+
+    __slots__ = ("name", "count", "total", "max", "buckets", "_lock")
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * BUCKETS   # bucket i holds samples below 2^i ns
+        self._lock = threading.Lock()
+
+    def observe(self, ns):
+        with self._lock:
+            self.count += 1
+            self.total += ns
+            if ns > self.max:
+                self.max = ns
+            self.buckets[min(ns.bit_length(), BUCKETS - 1)] += 1
+
+    def quantile(self, q):
+        """Upper bound (ns) of the bucket holding the q-th sample."""
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(1 << i, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {"count": self.count, "total_ns": self.total, "max_ns": self.max, "buckets": list(self.buckets)}
+
+
+def histogram(name):
+    """The named histogram, created on first use."""
+    h = _histograms.get(name)
+    if h is None:
+        with _lock:
+            h = _histograms.setdefault(name, Histogram(name))
+    return h
+
+
+def count(name, n=1):
+    """Add n to a plain event counter."""
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + n
+
+
+# -------------------------------
+# Timers
+# -------------------------------
+class _Timer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        histogram(self.name).observe(perf_counter_ns() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullTimer()
+
+
+def timer(name):
+    """with timer("db.connect"): ... records how long the block took."""
+    return _Timer(name) if _enabled else _NULL
+
+
+def timed(name):
+    """Decorator form of timer(); checks whether metrics are on at call time."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram(name).observe(perf_counter_ns() - start)
+        return wrapper
+    return decorate
+
+
+# -------------------------------
+# Output
+# -------------------------------
+def snapshot():
+    """{"histograms": {name: histogram dict}, "counters": {name: n}} of everything recorded."""
+    with _lock:
+        histograms = sorted(_histograms.values(), key=lambda h: h.name)
+        counters = dict(sorted(_counters.items()))
+    return {"histograms": {h.name: h.to_dict() for h in histograms if h.count}, "counters": counters}
+
+
+def write(path):
+    """Write every histogram and counter to `path` as JSON."""
+    import json
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"bucket_bounds": "bucket i counts samples below 2^i ns", **snapshot()}, f, indent=2)
+
+
+def prometheus_text(prefix="aurora_"):
+    """Everything recorded, in the Prometheus text exposition format (durations in seconds)."""
+    recorded = snapshot()
+    lines = []
+    for name, n in recorded["counters"].items():
+        metric = prefix + name.replace(".", "_").replace("-", "_") + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {n}")
+    for name, h in recorded["histograms"].items():
+        metric = prefix + name.replace(".", "_").replace("-", "_") + "_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        # Every bound on every scrape, empty or not, so rate() and
+        # histogram_quantile() always see the same series. The last bucket
+        # also holds everything longer, so it only goes into +Inf.
+        seen = 0
+        for i, n in enumerate(h["buckets"][:-1]):
+            seen += n
+            lines.append(f'{metric}_bucket{{le="{(1 << i) / 1e9:.9g}"}} {seen}')
+        lines.append(f'{metric}_bucket{{le="+Inf"}} {h["count"]}')
+        lines.append(f"{metric}_sum {h['total_ns'] / 1e9:.9f}")
+        lines.append(f"{metric}_count {h['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def print_report(title="Per-phase timing"):
+    """Table of every histogram (calls, total, mean and percentiles in ms), then the counters."""
+    with _lock:
+        histograms = [h for h in _histograms.values() if h.count]
+        counters = sorted(_counters.items())
+    print(f"\n=== {title} ===")
+    if not histograms and not counters:
+        print("(no samples – metrics were off)")
+        return
+    print(f"{'name':<28} {'calls':>7} {'total ms':>10} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for h in sorted(histograms, key=lambda h: h.total, reverse=True):
+        print(f"{h.name:<28} {h.count:>7} {h.total / 1e6:>10.1f} {h.total / h.count / 1e6:>9.3f} "
+              f"{h.quantile(0.5) / 1e6:>9.3f} {h.quantile(0.99) / 1e6:>9.3f} {h.max / 1e6:>9.3f}")
+    for name, n in counters:
+        print(f"{name:<28} {n:>7}")
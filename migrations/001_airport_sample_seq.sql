@@ -0,0 +1,27 @@
+-- ============================================
+-- 001_airport_sample_seq.sql – Indexed random airport sampling
+-- ============================================
+-- Gives every airport a dense sequence number over the whole table
+-- (sample_seq) and within its type (type_seq). sample_seq is the key the
+-- airport KD-trees in database.py hand to fetch_airports_by_key.
+--
+-- Run once against flight_game:
+--     mysql -u kuser -p flight_game < migrations/001_airport_sample_seq.sql
+-- Re-run the UPDATE block after re-importing airport data.
+
+ALTER TABLE airport
+    ADD COLUMN sample_seq INT NULL,
+    ADD COLUMN type_seq INT NULL;
+
+UPDATE airport a
+JOIN (
+    SELECT id,
+           ROW_NUMBER() OVER (ORDER BY id) AS seq,
+           ROW_NUMBER() OVER (PARTITION BY type ORDER BY id) AS type_rn
+    FROM airport
+) s ON s.id = a.id
+SET a.sample_seq = s.seq,
+    a.type_seq = s.type_rn;
+
+CREATE UNIQUE INDEX idx_airport_sample_seq ON airport (sample_seq);
+CREATE UNIQUE INDEX idx_airport_type_seq ON airport (type, type_seq);
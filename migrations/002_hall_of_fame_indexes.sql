@@ -0,0 +1,34 @@
+-- ============================================
+-- 002_hall_of_fame_indexes.sql – Indexed Hall of Fame reads
+-- ============================================
+-- Backs every query in database.py's Hall of Fame functions with an index,
+-- so each page is an index range read no matter how many runs are stored:
+--
+--   fetch_runs (newest first, keyset pages)  -> idx_hof_played_at
+--   fetch_top_runs(by="survivors")           -> idx_hof_survivors
+--   fetch_top_runs(by="fuel")                -> idx_hof_fuel
+--   fetch_top_runs(..., ending=...)          -> idx_hof_ending_survivors / idx_hof_ending_fuel
+--   fetch_ending_counts                      -> hall_of_fame_endings (migration 003)
+--
+-- id, an AUTO_INCREMENT primary key, breaks ties, so keyset pages never
+-- skip or repeat runs saved in the same second. It is added first if the
+-- table was created without it (existing runs are numbered in table order).
+--
+-- Run once against flight_game:
+--     mysql -u kuser -p flight_game < migrations/002_hall_of_fame_indexes.sql
+
+SET @add_id = IF(
+    (SELECT COUNT(*) FROM information_schema.columns
+     WHERE table_schema = DATABASE() AND table_name = 'hall_of_fame' AND column_name = 'id') = 0,
+    'ALTER TABLE hall_of_fame ADD COLUMN id INT NOT NULL AUTO_INCREMENT PRIMARY KEY FIRST',
+    'DO 0'
+);
+PREPARE add_id FROM @add_id;
+EXECUTE add_id;
+DEALLOCATE PREPARE add_id;
+
+CREATE INDEX idx_hof_played_at ON hall_of_fame (played_at, id);
+CREATE INDEX idx_hof_survivors ON hall_of_fame (survivors, id);
+CREATE INDEX idx_hof_fuel ON hall_of_fame (fuel, id);
+CREATE INDEX idx_hof_ending_survivors ON hall_of_fame (ending, survivors, id);
+CREATE INDEX idx_hof_ending_fuel ON hall_of_fame (ending, fuel, id);
@@ -0,0 +1,22 @@
+-- ============================================
+-- 003_hall_of_fame_ending_counts.sql – Per-ending run counters
+-- ============================================
+-- One row per ending with the number of runs that reached it, so
+-- database.fetch_ending_counts reads a handful of rows instead of
+-- grouping the whole Hall of Fame. database.insert_runs adds to the
+-- counters in the same transaction as the runs themselves.
+--
+-- Run once against flight_game, after 002:
+--     mysql -u kuser -p flight_game < migrations/003_hall_of_fame_ending_counts.sql
+-- Re-run the backfill block if runs are ever inserted or deleted by hand.
+
+CREATE TABLE IF NOT EXISTS hall_of_fame_endings (
+    ending VARCHAR(64) NOT NULL PRIMARY KEY,
+    runs BIGINT NOT NULL DEFAULT 0
+);
+
+START TRANSACTION;
+DELETE FROM hall_of_fame_endings;
+INSERT INTO hall_of_fame_endings (ending, runs)
+SELECT ending, COUNT(*) FROM hall_of_fame WHERE ending IS NOT NULL GROUP BY ending;
+COMMIT;
@@ -0,0 +1,132 @@
+# ============================================
+# render.py – Frame-batched typing effect for Flight AURORA
+# ============================================
+# The typing effect used to write, flush and sleep once per character.
+# render_text instead wakes up FPS times a second and writes every
+# character that has become due in a single call, so the text appears at
+# the same speed with a fraction of the syscalls.
+#
+# On an interactive terminal any key fast-forwards the current text.
+# Whatever the player types meanwhile is kept, and read_line hands it to
+# the next prompt so answers can be typed before the question finishes.
+
+import os
+import sys
+from contextlib import contextmanager
+
+import clock
+import metrics
+
+FPS = 20   # frames per second for the typing effect
+
+# Calls made by render_text, for benchmarks and profiling
+STATS = {"writes": 0, "sleeps": 0}
+
+_typed_ahead = ""
+
+
+# -------------------------------
+# Keyboard watching (interactive terminals only)
+# -------------------------------
+def _interactive():
+    try:
+        return sys.stdin.isatty() and sys.stdout.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+
+def _keep_keys(chars):
+    """Store typed-ahead keys; a bare Enter/space only skips and is dropped."""
+    global _typed_ahead
+    for ch in chars.replace("\r", "\n"):
+        if ch in "\n " and not _typed_ahead.rsplit("\n", 1)[-1]:
+            continue
+        _typed_ahead += ch
+    return bool(chars)
+
+
+@contextmanager
+def _key_watcher():
+    """Yields a poll() that returns True once any key has been pressed."""
+    if not _interactive():
+        yield lambda: False
+        return
+
+    if os.name == "nt":
+        import msvcrt
+
+        def poll():
+            chars = ""
+            while msvcrt.kbhit():
+                chars += msvcrt.getwch()
+            return _keep_keys(chars)
+        yield poll
+        return
+
+    import select
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    tty.setcbreak(fd)
+
+    def poll():
+        chars = ""
+        while select.select([fd], [], [], 0)[0]:
+            chars += os.read(fd, 64).decode("utf-8", errors="ignore")
+        return _keep_keys(chars)
+    try:
+        yield poll
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+
+# -------------------------------
+# Rendering
+# -------------------------------
+@metrics.timed("render.text")
+def render_text(text, delay=0.03, out=None):
+    """Type text out at one character per `delay` seconds, one write per frame."""
+    out = out or sys.stdout
+    if delay <= 0 or not text or clock.is_instant():
+        out.write(text + "\n")
+        out.flush()
+        STATS["writes"] += 1
+        return
+
+    frame = 1.0 / FPS
+    shown = 0
+    start = clock.now()
+    with _key_watcher() as key_pressed:
+        while shown < len(text):
+            if key_pressed():
+                break  # fast-forward the rest
+            due = min(len(text), int((clock.now() - start) / delay) + 1)
+            if due > shown:
+                out.write(text[shown:due])
+                out.flush()
+                STATS["writes"] += 1
+                shown = due
+            if shown < len(text):
+                # Wait a frame, but never past the moment the last character is due
+                now = clock.now()
+                next_due = start + shown * delay
+                last_due = start + (len(text) - 1) * delay
+                clock.sleep(max(0, next_due - now, min(frame, last_due - now)))
+                STATS["sleeps"] += 1
+    out.write(text[shown:] + "\n")
+    out.flush()
+    STATS["writes"] += 1
+
+
+@metrics.timed("input")
+def read_line(prompt=""):
+    """input() that first answers with anything typed ahead during rendering."""
+    global _typed_ahead
+    if "\n" in _typed_ahead:
+        line, _typed_ahead = _typed_ahead.split("\n", 1)
+        print(prompt + line)
+        return line
+    partial, _typed_ahead = _typed_ahead, ""
+    return partial + input(prompt + partial)
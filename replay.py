@@ -0,0 +1,115 @@
+# ============================================
+# replay.py – Flight recorder for Flight AURORA
+# ============================================
+# A run is fully determined by its RNG seed (see rng.py) and the answers
+# the pilot typed, so that is all the recorder keeps. Replays run at full
+# speed with pacing sleeps skipped:
+#
+#     python replay.py last_run.replay [--show]
+#
+# File layout (little-endian):
+#   "AURR" | version u8 | seed u64 | name length u16 + UTF-8 name
+#   | answer count u32 | per answer: length u16 + UTF-8 text
+
+import argparse
+import io
+import struct
+from contextlib import redirect_stdout
+
+import clock
+
+MAGIC = b"AURR"
+VERSION = 1
+LAST_RUN_PATH = "last_run.replay"
+
+
+class ReplayLog:
+    """Seed, pilot name and every answer typed during a run, in order."""
+
+    def __init__(self, seed, player_name="", decisions=None):
+        self.seed = seed
+        self.player_name = player_name
+        self.decisions = list(decisions or [])
+
+    def recorder(self, ask=input):
+        """Wrap an input function so every answer is also logged."""
+        def record(prompt=""):
+            answer = ask(prompt)
+            self.decisions.append(answer)
+            return answer
+        return record
+
+    def player(self):
+        """An input function that answers with the recorded decisions."""
+        answers = iter(self.decisions)
+
+        def replay(prompt=""):
+            try:
+                return next(answers)
+            except StopIteration:
+                raise EOFError("Replay log has no more recorded decisions") from None
+        return replay
+
+    def to_bytes(self):
+        out = bytearray(struct.pack("<4sBQ", MAGIC, VERSION, self.seed))
+        name = self.player_name.encode("utf-8")
+        out += struct.pack("<H", len(name)) + name
+        out += struct.pack("<I", len(self.decisions))
+        for answer in self.decisions:
+            data = answer.encode("utf-8")[:0xFFFF]
+            out += struct.pack("<H", len(data)) + data
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed = struct.unpack_from("<4sBQ", data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a Flight AURORA replay log")
+        pos = struct.calcsize("<4sBQ")
+
+        def read_text():
+            nonlocal pos
+            (length,) = struct.unpack_from("<H", data, pos)
+            pos += 2 + length
+            return data[pos - length:pos].decode("utf-8")
+
+        player_name = read_text()
+        (count,) = struct.unpack_from("<I", data, pos)
+        pos += 4
+        return cls(seed, player_name, [read_text() for _ in range(count)])
+
+    def save(self, path=LAST_RUN_PATH):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path=LAST_RUN_PATH):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def replay_run(log, quiet=True):
+    """Re-run a recorded mission; returns run_game's (result, name, player)."""
+    from game import run_game
+    from rng import RNGContext
+
+    output = io.StringIO() if quiet else None
+    with clock.using("zero"):
+        if quiet:
+            with redirect_stdout(output):
+                return run_game(log.player_name, RNGContext(log.seed), log.player())
+        return run_game(log.player_name, RNGContext(log.seed), log.player())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded Flight AURORA run")
+    parser.add_argument("path", nargs="?", default=LAST_RUN_PATH)
+    parser.add_argument("--show", action="store_true", help="print the game output while replaying")
+    args = parser.parse_args()
+
+    log = ReplayLog.load(args.path)
+    print(f"📼 Replaying {log.player_name or 'unknown pilot'} | seed {log.seed} | {len(log.decisions)} decisions")
+    result, _, player = replay_run(log, quiet=not args.show)
+    print(f"\n=== REPLAY RESULT: {result} ===")
+    print(f"Fuel: {player['fuel']} | Survivors: {player['survivors']} | Chances: {player['chances']} "
+          f"| Inventory: {', '.join(player['inventory']) or '(empty)'}")
@@ -0,0 +1,52 @@
+# ============================================
+# rng.py – Seeded random streams for Flight AURORA
+# ============================================
+# Each game subsystem draws from its own random.Random stream, all derived
+# from one seed. A run is fully reproducible from (seed, player decisions),
+# and extra draws in one subsystem never shift the rolls of another.
+
+import random
+
+STREAMS = (
+    "world",     # which airports fill each zone
+    "weather",   # weather.get_weather
+    "events",    # random_flight_event
+    "refuel",    # refuel_or_upgrade
+    "story",     # branching_story_event + its 25% trigger
+    "crash",     # crash roll and Crisis distress calls
+    "dialogue",  # NOVA's flavour picks in dialogue.py
+    "policy"     # simulated player decisions
+)
+
+
+class RNGContext:
+    """One independent random.Random per subsystem, derived from a single seed."""
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        for name in STREAMS:
+            # String seeds are hashed with SHA-512, so streams are stable across runs
+            setattr(self, name, random.Random(f"{seed}:{name}"))
+
+    def to_dict(self):
+        """Seed and every stream's position, as plain JSON-friendly data."""
+        return {
+            "seed": self.seed,
+            "streams": {name: getattr(self, name).getstate() for name in STREAMS}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        rngs = cls.__new__(cls)
+        rngs.seed = data["seed"]
+        for name, (version, internal, gauss) in data["streams"].items():
+            stream = random.Random(0)   # cheap seed, replaced right away
+            stream.setstate((version, tuple(internal), gauss))
+            setattr(rngs, name, stream)
+        for name in STREAMS:
+            # Saved before the stream existed: it has not been drawn from yet
+            if not hasattr(rngs, name):
+                setattr(rngs, name, random.Random(f"{rngs.seed}:{name}"))
+        return rngs
@@ -0,0 +1,290 @@
+# ============================================
+# server.py – Multi-pilot Flight AURORA server
+# ============================================
+# Hosts many missions at once over plain TCP/telnet:
+#
+#     python server.py --port 4000          (then: telnet localhost 4000)
+#     python server.py --loadtest 1000      (local load generator)
+#     python server.py --metrics-port 9100  (timings at http://host:9100/metrics)
+#
+# Each connection is a session with its own player state, RNG streams and
+# output stream. Missions are game.Mission state machines stepped by a
+# flow.FlowScheduler from one asyncio event loop; a mission whose pilot
+# has been idle for --park-after seconds is held only as serialized state.
+# The database reads at mission start run in worker threads; finished runs
+# are handed to the Hall of Fame write-behind queue.
+# Every prompt ends with telnet GA (Go Ahead), so clients can tell when the
+# server wants an answer.
+
+import argparse
+import asyncio
+import contextvars
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+
+import clock
+import metrics
+from flow import FlowScheduler
+from rng import RNGContext
+
+IAC_GA = b"\xff\xf9"
+# Telnet commands a client may send: IAC + command (+ option byte)
+_TELNET_WITH_OPTION = range(0xfb, 0xff)
+
+_session_output = contextvars.ContextVar("session_output", default=None)
+
+
+# -------------------------------
+# Per-session output
+# -------------------------------
+class SessionOutput:
+    """Collects everything one session prints until it is sent."""
+
+    def __init__(self):
+        self._parts = []
+
+    def write(self, text):
+        self._parts.append(text)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+    def take(self):
+        text = "".join(self._parts)
+        self._parts = []
+        return text
+
+
+class RoutedStdout:
+    """sys.stdout replacement that writes to the current session's output."""
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def _target(self):
+        return _session_output.get() or self.fallback
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def isatty(self):
+        return self._target().isatty()
+
+
+# -------------------------------
+# Sessions
+# -------------------------------
+WELCOME = """=============================================
+         ✈️  Welcome to Flight Aurora
+=============================================
+"""
+
+
+def _strip_telnet(data):
+    """Drop telnet negotiation bytes from a received line."""
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        if data[i] == 0xff and i + 1 < len(data):
+            i += 3 if data[i + 1] in _TELNET_WITH_OPTION else 2
+            continue
+        out.append(data[i])
+        i += 1
+    return out.decode("utf-8", errors="ignore").strip()
+
+
+def _save_run(player_name, result, player):
+    from database import save_run
+
+    try:
+        save_run(player_name, result, player["survivors"], player["fuel"])
+        # Only queued: waiting for the writer here would stall the event loop
+        print("🏆 Your run is on its way to the Hall of Fame!")
+    except Exception as e:
+        print("⚠️ Could not save run:", e)
+
+
+async def handle_session(reader, writer, scheduler):
+    """One pilot's visit: name, mission, Hall of Fame save."""
+    from game import Mission
+
+    output = SessionOutput()
+    _session_output.set(output)   # also copied into worker threads by to_thread
+
+    async def send(text, prompt=b""):
+        writer.write(text.replace("\n", "\r\n").encode("utf-8") + prompt)
+        await writer.drain()
+
+    async def ask(prompt):
+        await send(output.take() + prompt, IAC_GA)
+        with metrics.timer("input"):
+            line = await reader.readline()
+        if not line:
+            raise ConnectionResetError("pilot disconnected")
+        return _strip_telnet(line)
+
+    key = id(output)
+    try:
+        player_name = (await ask(WELCOME + "🧭 Enter your pilot name: ")).title() or "Pilot"
+        # A mission's first step loads the Hall of Fame and the world from the
+        # database, so it runs in a worker thread. That includes every airport
+        # index later zones are drawn from (database.airport_tree), so every
+        # later step is pure game logic and runs right here on the event loop.
+        # If the pilot goes quiet, the scheduler parks the mission as
+        # serialized state.
+        mission = Mission(player_name, RNGContext())
+        finished, value = await asyncio.to_thread(scheduler.start, key, mission)
+        while not finished:
+            finished, value = scheduler.send(key, await ask(value))
+
+        result, _, player = value
+        print(f"\n=== GAME OVER: {result} ===")
+        _save_run(player_name, result, player)   # only queues the row (database.RunWriter)
+        await send(output.take())
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception:
+        # Mostly the database: the Hall of Fame or world could not be loaded at start
+        traceback.print_exc(file=sys.__stderr__)
+        try:
+            await send(output.take() + "\n⚠️ Database link error – your flight has been cancelled.\n")
+        except ConnectionError:
+            pass
+    finally:
+        scheduler.drop(key)
+        writer.close()
+
+
+async def park_idle_missions(scheduler, every=5.0):
+    """Keep serializing missions whose pilots have gone quiet."""
+    while True:
+        await asyncio.sleep(every)
+        scheduler.park_idle()
+
+
+async def serve_metrics(reader, writer):
+    """Answer one HTTP request with metrics.prometheus_text(), whatever the path."""
+    try:
+        await reader.readuntil(b"\r\n\r\n")
+        body = metrics.prometheus_text().encode()
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\n"
+                     b"Content-Length: %d\r\nConnection: close\r\n\r\n" % len(body) + body)
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=4000, park_after=30.0, metrics_port=None):
+    from game import Mission
+
+    # Pacing is not replayed over the network: text is sent as soon as it is ready
+    clock.set_mode("zero")
+    sys.stdout = RoutedStdout(sys.stdout)
+    scheduler = FlowScheduler(Mission.from_dict, park_after)
+    parking = asyncio.create_task(park_idle_missions(scheduler))  # keep a reference to the task
+    if metrics_port is not None:
+        metrics.enable()
+        await asyncio.start_server(serve_metrics, host, metrics_port)
+    server = await asyncio.start_server(lambda reader, writer: handle_session(reader, writer, scheduler),
+                                        host, port, limit=2 ** 16, backlog=4096)
+    print(f"🛰️ Flight AURORA server listening on {host}:{port}", file=sys.__stdout__, flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+# -------------------------------
+# Load generator
+# -------------------------------
+async def fake_pilot(host, port, latencies, answers=("1", "2", "3", "y", "n")):
+    """Plays one session with random answers, recording prompt latency."""
+    reader, writer = await asyncio.open_connection(host, port, limit=2 ** 16)
+    try:
+        await reader.readuntil(IAC_GA)
+        writer.write(b"Load Tester\r\n")
+        while True:
+            sent = time.perf_counter()
+            await writer.drain()
+            try:
+                await reader.readuntil(IAC_GA)
+            except asyncio.IncompleteReadError:
+                return  # game over, server closed the session
+            latencies.append(time.perf_counter() - sent)
+            writer.write(random.choice(answers).encode() + b"\r\n")
+    finally:
+        writer.close()
+
+
+async def run_load(sessions, host, port):
+    latencies = []
+    start = time.perf_counter()
+    results = await asyncio.gather(*(fake_pilot(host, port, latencies) for _ in range(sessions)),
+                                   return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    failed = sum(isinstance(r, Exception) for r in results)
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(f"{sessions:>6} sessions | {len(latencies):>7} prompts | p50 {p50:7.2f} ms | "
+          f"p99 {p99:7.2f} ms | {elapsed:6.1f} s | failed {failed}")
+
+
+def _raise_fd_limit():
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def loadtest(levels, host, port, spawn=True):
+    """Run the load generator at each concurrency level against a server."""
+    _raise_fd_limit()
+    server = None
+    if spawn:
+        server = subprocess.Popen([sys.executable, __file__, "--host", host, "--port", str(port)],
+                                  stdout=subprocess.PIPE, env={**os.environ})
+        server.stdout.readline()  # wait until it is listening
+    try:
+        print(f"=== Load test against {host}:{port} ===")
+        for sessions in levels:
+            asyncio.run(run_load(sessions, host, port))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Flight AURORA multi-session server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    parser.add_argument("--loadtest", type=int, nargs="*", metavar="SESSIONS",
+                        help="run the load generator instead (default levels: 1000 10000)")
+    parser.add_argument("--park-after", type=float, default=30.0, metavar="SECONDS",
+                        help="serialize missions whose pilot has been idle this long")
+    parser.add_argument("--external", action="store_true",
+                        help="load-test an already running server instead of spawning one")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="record timings and serve them in Prometheus format on PORT")
+    args = parser.parse_args()
+
+    _raise_fd_limit()
+    if args.loadtest is not None:
+        loadtest(args.loadtest or [1000, 10000], args.host, args.port, spawn=not args.external)
+    else:
+        asyncio.run(serve(args.host, args.port, args.park_after, args.metrics_port))
@@ -0,0 +1,225 @@
+# ============================================
+# simulation.py – Headless Monte Carlo runs of Flight AURORA
+# ============================================
+# Plays the run_game zone loop with no input(), print or sleep: the same
+# weather, flight events, refuels, story branches, crash rolls and
+# endings.resolve_ending rules, with every player decision delegated to
+# a policy. Every game draws from its own seeded rng.RNGContext, so any
+# game can be re-played exactly. Games are spread across a process pool.
+#
+#     python simulation.py --games 1000000 --workers 8 --policy random
+
+import argparse
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from database import get_snapshot
+from endings import ENDING_RESULTS, resolve_ending
+from game import (
+    HOME_BASE, PHANTOM_ENDINGS, STORY_ZONES, airport_find, airport_position, distance_matrix, flight_event,
+    flight_fuel_cost, story_outcome
+)
+from hud import burn_fuel, create_player
+from rng import RNGContext
+from weather import get_weather
+from World import ZONE_DRAWS, assemble_world, build_game_world, fill_zone
+
+DIFFICULTY_START = {"Easy": (150, 5), "Normal": (100, 3), "Hard": (70, 2)}
+ROLES = ("Navigator", "Engineer", "Leader")
+
+
+# -------------------------------
+# Decision policies
+# -------------------------------
+# A policy is called as policy(decision, player, options, rng) and returns the
+# answer the player would have typed:
+#   "destination" -> index into options (the zone's airports)
+#   "branch"      -> "1" or "2"  (options is the zone name)
+#   "rebellion"   -> "y" or "n"
+#   "rescue"      -> "y" or "n"
+def random_policy(decision, player, options, rng):
+    """Every answer picked uniformly at random."""
+    if decision == "destination":
+        return rng.randrange(len(options))
+    if decision == "branch":
+        return rng.choice("12")
+    return rng.choice("yn")
+
+
+def cautious_policy(decision, player, options, rng):
+    """Prefer real airports and the Beacon, avoid gambles with low fuel."""
+    if decision == "destination":
+        for idx, airport in enumerate(options):
+            if airport.get("effect") == "win":
+                return idx
+        real = [idx for idx, airport in enumerate(options) if "ident" in airport]
+        return real[0] if real else 0
+    if decision == "branch":
+        return "1" if player.fuel > 60 and "Aurora" not in options else "2"
+    if decision == "rebellion":
+        return "n"
+    return "y" if player.fuel > 30 else "n"
+
+
+POLICIES = {"random": random_policy, "cautious": cautious_policy}
+
+
+# -------------------------------
+# World
+# -------------------------------
+def simulated_world(rng):
+    """The game's world from the airport snapshot if there is one, else random coordinates."""
+    if get_snapshot() is not None:
+        return build_game_world(rng)
+    batches = []
+    for limit, airport_type in ZONE_DRAWS:
+        batches.append([{
+            "ident": f"SIM{i}", "name": "Simulated Field", "iso_country": "--", "type": airport_type,
+            "latitude_deg": rng.uniform(-60, 70), "longitude_deg": rng.uniform(-180, 180)
+        } for i in range(limit)])
+    return assemble_world(*batches)
+
+
+# -------------------------------
+# Quiet game rules (the output-free cores in game.py)
+# -------------------------------
+def _update_fuel(player, amount):
+    player.fuel = burn_fuel(player.fuel, amount)
+
+
+def _story_event(player, zone_name, policy, rngs):
+    """Returns a final choice if the branch ends the game, else None."""
+    if not any(zone in zone_name for zone in STORY_ZONES):
+        return None
+    choice = policy("branch", player, zone_name, rngs.policy)
+    return story_outcome(player, zone_name, choice, rngs.story)[1]
+
+
+def play_game(policy, difficulty, role, rngs=None, world=None):
+    """Play one headless game; returns (ending result, final player state)."""
+    rngs = rngs or RNGContext()
+    world = world or simulated_world(rngs.world)
+    player = create_player()
+    player.difficulty = difficulty
+    player.fuel, player.chances = DIFFICULTY_START[difficulty]
+    player.role = role
+    origin = HOME_BASE[3:5]
+
+    def finish(final_choice):
+        return ENDING_RESULTS[resolve_ending(player, final_choice)], player
+
+    for zone_name, data in world.items():
+        fill_zone(world, zone_name, origin, rngs.world)
+        get_weather(zone_name, rngs.weather)  # the zone-entry forecast run_game shows
+        airport_find(player, rngs.refuel)
+
+        airports = data["airports"]
+        choice = policy("destination", player, airports, rngs.policy)
+        chosen = airports[choice] if 0 <= choice < len(airports) else airports[0]
+
+        flight_event(player, rngs.events)
+        weather = get_weather(zone_name, rngs.weather)
+
+        distance = None
+        if "ident" in chosen:
+            destination = airport_position(chosen)
+            distance = distance_matrix([origin], [destination])[0][0]
+            origin = destination
+        _update_fuel(player, flight_fuel_cost(distance, weather["fuel_penalty"], player.role, player.engine_boost))
+        airport_find(player, rngs.refuel)
+
+        if rngs.story.random() < 0.25:
+            outcome = _story_event(player, zone_name, policy, rngs)
+            if outcome:
+                return finish(outcome)
+
+        if "Aurora" in zone_name:
+            if player.has("Storm Compass"):
+                return finish("COMPASS")
+            if policy("rebellion", player, None, rngs.policy) == "y":
+                return finish("REBELLION")
+
+        crash_chance = weather["crash_chance"]
+        if player.has("Storm Shield"):
+            crash_chance *= 0.5
+        if role == "Navigator":
+            crash_chance *= 0.8
+        if rngs.crash.random() < crash_chance:
+            return finish("STORM")
+
+        # The "loop" effect has no ending in game.PHANTOM_ENDINGS, so that flight carries on
+        if chosen.get("effect") in PHANTOM_ENDINGS:
+            return finish(PHANTOM_ENDINGS[chosen["effect"]])
+
+        if "Crisis" in zone_name and rngs.crash.random() < 0.5:
+            if policy("rescue", player, None, rngs.policy) == "y":
+                player.survivors += 1
+                _update_fuel(player, 5)
+                chance = 0.45 if role == "Leader" else 0.3
+                if rngs.crash.random() < chance:
+                    player.add("Storm Shield")
+
+    return finish("AURORA")
+
+
+# -------------------------------
+# Process pool driver
+# -------------------------------
+def run_batch(games, first_seed, policy_name):
+    """
+    Worker entry point: play `games` games per difficulty/role combination.
+    Game k uses seed first_seed + k for every combination, so the
+    combinations are compared on the same weather and event rolls.
+    """
+    policy = POLICIES[policy_name]
+    tallies = {}
+    for difficulty in DIFFICULTY_START:
+        for role in ROLES:
+            tally = tallies.setdefault((difficulty, role), Counter())
+            for k in range(games):
+                tally[play_game(policy, difficulty, role, RNGContext(first_seed + k))[0]] += 1
+    return tallies
+
+
+def simulate(games=100_000, workers=None, policy_name="random", seed=0, chunk=2_000):
+    """
+    Play `games` games for every difficulty/role combination across a process pool.
+    Returns (tallies, games per second per core).
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = [chunk] * (games // chunk) + ([games % chunk] if games % chunk else [])
+    tallies = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_batch, size, seed * games + i * chunk, policy_name)
+                   for i, size in enumerate(chunks)]
+        for future in futures:
+            for key, tally in future.result().items():
+                tallies.setdefault(key, Counter()).update(tally)
+    elapsed = time.perf_counter() - start
+    played = games * len(DIFFICULTY_START) * len(ROLES)
+    return tallies, played / elapsed / workers
+
+
+def print_report(tallies, per_core):
+    endings = sorted({ending for tally in tallies.values() for ending in tally})
+    print(f"{'Difficulty':<8} {'Role':<10} " + " ".join(f"{e[:10]:>10}" for e in endings))
+    for (difficulty, role), tally in sorted(tallies.items()):
+        total = sum(tally.values())
+        print(f"{difficulty:<8} {role:<10} " +
+              " ".join(f"{tally[e] / total:>10.2%}" for e in endings))
+    print(f"\n⚙️ Throughput: {per_core:,.0f} games/sec/core")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless Flight AURORA simulations")
+    parser.add_argument("--games", type=int, default=10_000,
+                        help="games per difficulty/role combination")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print_report(*simulate(args.games, args.workers, args.policy, args.seed))
@@ -0,0 +1,175 @@
+# ============================================
+# snapshot.py – Offline airport snapshot for Flight AURORA
+# ============================================
+# The airport table never changes during play, so it can be exported once
+# to a compact columnar file and memory-mapped by every game process:
+#
+#     python snapshot.py export [path]
+#
+# Layout (little-endian):
+#   8-byte magic, 4-byte header length, JSON header, then each column
+#   padded to 8 bytes. Rows are sorted by type so every type is one
+#   contiguous row range. Numeric columns are read in place through
+#   memoryview casts; text columns are a uint32 offset array + UTF-8 blob.
+
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+
+MAGIC = b"AURSNAP1"
+DEFAULT_PATH = "airports.snap"
+COLUMNS = ("ident", "name", "iso_country", "type", "latitude_deg", "longitude_deg")
+
+
+def _pad(buf):
+    buf.extend(b"\0" * (-len(buf) % 8))
+
+
+# -------------------------------
+# WRITING
+# -------------------------------
+def write_snapshot(path, airports):
+    """
+    Write airport dicts (with the COLUMNS keys) to a snapshot file. Airports
+    without coordinates are left out, as database._airport_positions does.
+    """
+    airports = sorted((a for a in airports if a["latitude_deg"] is not None and a["longitude_deg"] is not None),
+                      key=lambda a: a["type"])
+    count = len(airports)
+
+    types = {}
+    for row, airport in enumerate(airports):
+        start, size = types.get(airport["type"], (row, 0))
+        types[airport["type"]] = (start, size + 1)
+
+    body = bytearray()
+    offsets = {}
+
+    def add_column(name, data):
+        offsets[name] = len(body)
+        body.extend(data)
+        _pad(body)
+
+    add_column("latitude_deg", struct.pack(f"<{count}d", *(float(a["latitude_deg"]) for a in airports)))
+    add_column("longitude_deg", struct.pack(f"<{count}d", *(float(a["longitude_deg"]) for a in airports)))
+    for name in ("ident", "name", "iso_country"):
+        blob = bytearray()
+        ends = [0]
+        for airport in airports:
+            blob.extend((airport[name] or "").encode("utf-8"))
+            ends.append(len(blob))
+        add_column(f"{name}_offsets", struct.pack(f"<{count + 1}I", *ends))
+        add_column(f"{name}_text", blob)
+
+    header = json.dumps({"rows": count, "types": types, "offsets": offsets}).encode("utf-8")
+    header += b" " * (-(len(MAGIC) + 4 + len(header)) % 8)
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(body)
+
+
+def export_snapshot(path=DEFAULT_PATH):
+    """Dump the live airport table to a snapshot file."""
+    from database import db_cursor
+
+    with db_cursor(dictionary=True) as cursor:
+        cursor.execute("""
+            SELECT ident, name, iso_country, type, latitude_deg, longitude_deg
+            FROM airport
+            WHERE latitude_deg IS NOT NULL AND longitude_deg IS NOT NULL;
+        """)
+        airports = cursor.fetchall()
+    write_snapshot(path, airports)
+    return len(airports)
+
+
+# -------------------------------
+# READING
+# -------------------------------
+class AirportSnapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+    Pages are shared between every process that maps the same file.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not an airport snapshot")
+        (header_len,) = struct.unpack_from("<I", self._map, len(MAGIC))
+        base = len(MAGIC) + 4
+        header = json.loads(self._map[base:base + header_len])
+        base += header_len
+
+        self.rows = header["rows"]
+        self.types = {name: tuple(span) for name, span in header["types"].items()}
+        spans = sorted((start, name) for name, (start, _) in self.types.items())
+        self._type_starts = [start for start, _ in spans]
+        self._type_names = [name for _, name in spans]
+        view = memoryview(self._map)
+        self._views = [view]
+        offsets = header["offsets"]
+
+        def numbers(name, fmt, count):
+            start = base + offsets[name]
+            column = view[start:start + count * struct.calcsize(fmt)]
+            self._views.append(column)
+            self._views.append(column.cast(fmt))
+            return self._views[-1]
+
+        self.latitude = numbers("latitude_deg", "d", self.rows)
+        self.longitude = numbers("longitude_deg", "d", self.rows)
+        self._text = {}
+        for name in ("ident", "name", "iso_country"):
+            ends = numbers(f"{name}_offsets", "I", self.rows + 1)
+            start = base + offsets[f"{name}_text"]
+            blob = view[start:start + ends[self.rows]]
+            self._views.append(blob)
+            self._text[name] = (ends, blob)
+
+    def __len__(self):
+        return self.rows
+
+    def _string(self, column, row):
+        ends, blob = self._text[column]
+        return bytes(blob[ends[row]:ends[row + 1]]).decode("utf-8")
+
+    def type_of(self, row):
+        return self._type_names[bisect.bisect_right(self._type_starts, row) - 1]
+
+    def airport(self, row):
+        """Row as the same dict shape database.fetch_airports_by_key returns."""
+        return {
+            "ident": self._string("ident", row),
+            "name": self._string("name", row),
+            "iso_country": self._string("iso_country", row),
+            "type": self.type_of(row),
+            "latitude_deg": self.latitude[row],
+            "longitude_deg": self.longitude[row]
+        }
+
+    def row_range(self, airport_type):
+        if airport_type == "all":
+            return range(self.rows)
+        start, size = self.types.get(airport_type, (0, 0))
+        return range(start, start + size)
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._map.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "export":
+        print("Usage: python snapshot.py export [path]")
+        sys.exit(1)
+    target = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATH
+    exported = export_snapshot(target)
+    print(f"✅ Exported {exported} airports to {target} ({os.path.getsize(target) / 1024:.0f} KiB)")
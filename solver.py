@@ -0,0 +1,460 @@
+# ============================================
+# solver.py – Best achievable outcome for Flight AURORA
+# ============================================
+# Exact expected-value dynamic programming over the zones of a world:
+# the weather tables of weather.py, the odds of random_flight_event,
+# refuel_or_upgrade and the branching story events, and the crash, rescue
+# and ending rules of Mission, with every decision taken to maximise the
+# objective:
+#
+#     "win"        probability the mission succeeds (WIN_ENDINGS)
+#     "survivors"  expected survivors flown home on a successful mission
+#
+#     solver = RouteSolver(world, "Navigator")
+#     solver.value(zone, player)                  -> best expected value from a zone's entry
+#     solver.destination_values(zone, player)     -> {"1": value, "2": ...} for the airport prompt
+#     solver.mission_values(mission)              -> the same for whatever a Mission is asking
+#
+#     python solver.py --objective win --seed 7
+#
+# Fuel is always a whole number from 0 to 200, so every stage is solved
+# for all fuel levels at once: a memo entry is a table of 201 values, keyed
+# on the rest of the state -- (zone, position, chances, survivors, items),
+# where items keeps only the Engine Upgrade, Storm Compass and Storm Shield
+# (the other items never change an outcome) and position is the last
+# airport whose coordinates are known. A zone fill_zone has not drawn yet
+# is solved as every draw it could make there: `limit` airports picked at
+# random from the candidates in reach, of which the pilot takes the best,
+# each landing at its own coordinates, around which the next zone is drawn.
+# Once no later zone has real airports the position is dropped from the key.
+
+import argparse
+import itertools
+import math
+import time
+
+from endings import resolve_ending
+from game import (
+    FLIGHT_EVENTS, HOME_BASE, PHANTOM_ENDINGS, airport_position, apply_flight_event, distance_matrix, flight_fuel_cost
+)
+from hud import ITEM_BITS, Player, burn_fuel
+from weather import CONDITIONS, weather_table
+from World import fetch_airports_by_key, zone_candidates
+
+ENGINE, COMPASS, SHIELD = ITEM_BITS["Engine Upgrade"], ITEM_BITS["Storm Compass"], ITEM_BITS["Storm Shield"]
+KEY_ITEMS = ENGINE | COMPASS | SHIELD
+FUELS = range(201)
+
+# Endings where the Beacon is reached or the storm beaten; turning away (rebellion)
+# or arriving alone (mercenary) does not save the world
+WIN_ENDINGS = frozenset({"victory", "green_route", "hero", "compass"})
+OBJECTIVES = {
+    "win": lambda ending, survivors: 1.0 if ending in WIN_ENDINGS else 0.0,
+    "survivors": lambda ending, survivors: float(survivors) if ending in WIN_ENDINGS else 0.0
+}
+
+
+# -------------------------------
+# Fuel arithmetic (mirrors game.py)
+# -------------------------------
+def _burns(amount):
+    """Fuel after update_fuel(amount), for every fuel level."""
+    return [burn_fuel(fuel, amount) for fuel in FUELS]
+
+
+TOP_UPS = [min(150, fuel + 50) for fuel in FUELS]   # braving the aurora storm
+
+
+def _flight_events(role):
+    """
+    game.FLIGHT_EVENTS as {survivors gained: [fuel after, per fuel level, of
+    each event]}, from apply_flight_event; the events are equally likely.
+    """
+    events = {}
+    for event in FLIGHT_EVENTS:
+        after = []
+        for fuel in FUELS:
+            player = Player(fuel=fuel, survivors=0, role=role)
+            apply_flight_event(player, event)
+            after.append(player.fuel)
+        events.setdefault(player.survivors, []).append(after)
+    return events
+
+
+# A refuelling station adds 15..40 fuel up to 150: fuel levels low..top of
+# that range are summed from a running total, the other `capped` sit at 150.
+_STATION_LOWS = [min(fuel + 15, 151) for fuel in FUELS]
+_STATION_TOPS = [min(fuel + 40, 150) + 1 for fuel in FUELS]
+_STATION_CAPPED = [26 - (top - low) for low, top in zip(_STATION_LOWS, _STATION_TOPS)]
+_FUEL_TANKS = [min(200, fuel + 50) for fuel in FUELS]
+
+
+def refuel(plain, engine):
+    """
+    Value before refuel_or_upgrade, from the values after it without and
+    with a newly found Engine Upgrade.
+    """
+    running = list(itertools.accumulate(plain[:151], initial=0.0))
+    full = plain[150]
+    return [0.15 / 26 * (running[top] - running[low] + capped * full) + 0.05 * plain[tank]
+            + 0.05 * upgraded + 0.75 * value
+            for low, top, capped, tank, value, upgraded
+            in zip(_STATION_LOWS, _STATION_TOPS, _STATION_CAPPED, _FUEL_TANKS, plain, engine)]
+
+
+def draw_weights(n, k):
+    """Chance that the i-th best of n candidates is the best of k drawn at random."""
+    return [math.comb(n - 1 - i, k - 1) / math.comb(n, k) for i in range(n)]
+
+
+# -------------------------------
+# Solver
+# -------------------------------
+class RouteSolver:
+    """
+    Memoized optimal play of one world for one role. Every stage of a zone
+    keeps its own table of values by fuel level, so the memo is shared by
+    every question asked of the same solver -- including after the mission
+    draws a zone: entries for a zone drawn and not yet drawn are kept apart.
+    """
+
+    def __init__(self, world, role, objective="win"):
+        self.world = world
+        self.zones = list(world)
+        self.role = role
+        self.objective = objective
+        self.score = OBJECTIVES[objective]
+        self.events = _flight_events(role)
+        self.crash_factor = 0.8 if role == "Navigator" else 1.0
+        self.shield_chance = 0.45 if role == "Leader" else 0.3
+        self.weather = [[(p, c["fuel_penalty"], c["crash_chance"])
+                         for p, c in zip(weather_table(name).probabilities, CONDITIONS) if p > 0]
+                        for name in self.zones]
+        self.prefixes = [world[name]["prefix"] for name in self.zones]
+        # Whether the pilot's position still matters from a zone on: some zone
+        # from there has real airports or is yet to be drawn around the pilot
+        self.placed = [any("draw" in world[name] or any("ident" in a for a in world[name]["airports"])
+                           for name in self.zones[zone:])
+                       for zone in range(len(self.zones) + 1)]
+        self._legs = {}
+        self._burns = {}
+        self._endings = {}
+        self._entered = {}
+        self._chosen = {}
+        self._landed = {}
+        self._settled = {}
+
+    def states(self):
+        """Number of memoized (state, fuel level) values."""
+        tables = len(self._entered) + len(self._chosen) + len(self._landed) + len(self._settled)
+        return tables * len(FUELS)
+
+    # --- public questions ---
+    def value(self, zone, player, origin=HOME_BASE[3:5]):
+        """Best expected value from entering zone index `zone` at `origin` (lat, lon)."""
+        fuel, rest = player_state(player)
+        return self._enter(zone, tuple(origin), rest)[fuel]
+
+    def destination_values(self, zone, player, origin=HOME_BASE[3:5]):
+        """{answer: value} for the destination prompt of a drawn zone."""
+        if "draw" in self.world[self.zones[zone]]:
+            raise ValueError(f"{self.zones[zone]} has not been drawn yet")
+        fixed, _ = self._zone_legs(zone, tuple(origin))
+        fuel, rest = player_state(player)
+        return {str(i): self._fly(zone, leg, rest)[fuel] for i, leg in enumerate(fixed, start=1)}
+
+    def story_values(self, zone, player, weather, effect=None, origin=HOME_BASE[3:5]):
+        """{answer: value} for a story event after a flight in `weather` to an airport with `effect`."""
+        fuel, rest = player_state(player)
+        return {choice: self._branch(zone, effect, tuple(origin), weather["crash_chance"], rest, choice)[fuel]
+                for choice in ("1", "2")}
+
+    def rebellion_values(self, zone, player, weather, effect=None, origin=HOME_BASE[3:5]):
+        """{answer: value} for the Aurora Beacon prompt."""
+        fuel, rest = player_state(player)
+        return {"y": self._ending("REBELLION", rest)[fuel],
+                "n": self._crash(zone, effect, tuple(origin), weather["crash_chance"], rest)[fuel]}
+
+    def rescue_values(self, zone, player, origin=HOME_BASE[3:5]):
+        """{answer: value} for the Crisis Zone distress call."""
+        fuel, rest = player_state(player)
+        return {"y": self._rescue(zone, tuple(origin), rest)[fuel],
+                "n": self._enter(zone + 1, tuple(origin), rest)[fuel]}
+
+    def mission_values(self, mission):
+        """{answer: value} for the decision a Mission is waiting on ({} if it needs no choice)."""
+        zone, player, origin = mission.zone, mission.player, mission.origin[3:5]
+        if mission.state == "destination":
+            return self.destination_values(zone, player, origin)
+        effect = None
+        if mission.state in ("story_event", "rebellion"):
+            effect = self.world[self.zones[zone]]["airports"][mission.chosen].get("effect")
+        if mission.state == "story_event":
+            return self.story_values(zone, player, mission.weather, effect, origin)
+        if mission.state == "rebellion":
+            return self.rebellion_values(zone, player, mission.weather, effect, origin)
+        if mission.state == "rescue":
+            return self.rescue_values(zone, player, origin)
+        return {}
+
+    # --- building blocks ---
+    def _burned(self, amount):
+        burned = self._burns.get(amount)
+        if burned is None:
+            burned = self._burns[amount] = _burns(amount)
+        return burned
+
+    def _ending(self, final_choice, rest):
+        key = (final_choice, rest)
+        values = self._endings.get(key)
+        if values is None:
+            chances, survivors, _ = rest
+            values = self._endings[key] = [
+                self.score(resolve_ending({"fuel": fuel, "survivors": survivors, "chances": chances},
+                                          final_choice), survivors)
+                for fuel in FUELS]
+        return values
+
+    def _zone_legs(self, zone, origin):
+        """
+        (fixed, pool) of a zone flown from `origin`. Every leg in `fixed` is
+        on offer; `pool` is None, or (legs, counts, weights) when the zone is
+        still to be drawn: see _drawn. A leg is (distance or None, phantom
+        effect, where it lands), and lands nowhere (None) once no later zone
+        is drawn around the pilot.
+        """
+        name = self.zones[zone]
+        data = self.world[name]
+        key = (zone, origin, "draw" in data)
+        legs = self._legs.get(key)
+        if legs is not None:
+            return legs
+        placed = self.placed[zone + 1]
+        positions = [airport_position(a) for a in data["airports"] if "ident" in a]
+        distances = iter(distance_matrix([origin], positions)[0] if positions else ())
+        positions = iter(positions)
+        fixed = [(next(distances), None, next(positions) if placed else None) if "ident" in a
+                 else (None, a["effect"], origin if placed else None)
+                 for a in data["airports"]]
+        pool = None
+        if "draw" in data:
+            limit, airport_type = data["draw"]
+            nearby, reachable = zone_candidates(name, airport_type, origin)
+            candidates = reachable if len(reachable) >= limit else nearby[:limit]
+            # Flown distances by haversine, exactly as Mission bills the flight
+            positions = [airport_position(a) for a in fetch_airports_by_key([key for _, key in candidates])]
+            distances = distance_matrix([origin], positions)[0] if positions else ()
+            drawn = [(km, None, position if placed else None) for km, position in zip(distances, positions)]
+            if len(reachable) >= limit:
+                pool = self._pool(drawn, limit, zone)
+            else:
+                fixed += drawn
+        legs = self._legs[key] = (fixed, pool)
+        return legs
+
+    def _pool(self, drawn, limit, zone):
+        """
+        A random draw of `limit` of the legs in `drawn` as (legs, counts,
+        weights). Legs that cost the same fuel in every weather and land at
+        the same place are flown once, counted `counts` times; weights[i] is
+        the chance that the i-th best of all the legs is among those drawn
+        and the best of them.
+        """
+        legs, counts = [], []
+        seen = {}
+        for distance, effect, landing in drawn:
+            costs = tuple(flight_fuel_cost(distance, penalty, self.role, engine)
+                          for _, penalty, _ in self.weather[zone] for engine in (False, True))
+            i = seen.get((costs, landing))
+            if i is None:
+                i = seen[(costs, landing)] = len(legs)
+                legs.append((distance, effect, landing))
+                counts.append(0)
+            counts[i] += 1
+        return legs, counts, draw_weights(len(drawn), limit)
+
+    # --- stages, each a table of values by fuel level ---
+    def _enter(self, zone, origin, rest):
+        if zone >= len(self.zones):
+            return self._ending("AURORA", rest)
+        if not self.placed[zone]:
+            origin = None
+        key = (zone, origin, rest, "draw" in self.world[self.zones[zone]])
+        values = self._entered.get(key)
+        if values is None:
+            chances, survivors, items = rest
+            values = self._entered[key] = refuel(self._choose(zone, origin, rest),
+                                                 self._choose(zone, origin, (chances, survivors, items | ENGINE)))
+        return values
+
+    def _choose(self, zone, origin, rest):
+        key = (zone, origin, rest, "draw" in self.world[self.zones[zone]])
+        values = self._chosen.get(key)
+        if values is None:
+            fixed, pool = self._zone_legs(zone, origin)
+            best = None
+            for leg in fixed:
+                flown = self._fly(zone, leg, rest)
+                best = flown if best is None else [a if a > b else b for a, b in zip(best, flown)]
+            if pool:
+                best = self._drawn(zone, pool, best, rest)
+            values = self._chosen[key] = best
+        return values
+
+    def _drawn(self, zone, pool, best, rest):
+        """
+        Expected value of the best leg of a random draw (or of `best`, the
+        best fixed leg, if that is better). The legs land in different
+        places, so at every fuel level they are ranked by value and the
+        i-th best is worth weights[i].
+        """
+        legs, counts, weights = pool
+        tables = [self._fly(zone, leg, rest) for leg in legs]
+        if best is not None:
+            tables = [[a if a > b else b for a, b in zip(best, flown)] for flown in tables]
+        ranks = list(itertools.accumulate(weights, initial=0.0))
+        values = []
+        for column in zip(*tables):
+            total, rank = 0.0, 0
+            for value, count in sorted(zip(column, counts), reverse=True):
+                total += (ranks[rank + count] - ranks[rank]) * value
+                rank += count
+            values.append(total)
+        return values
+
+    def _fly(self, zone, leg, rest):
+        """
+        The flight: an event, then the weather and its fuel bill. The event
+        only moves fuel and survivors, so the weather is summed first and
+        each event's fuel change applied once to the sum.
+        """
+        distance, effect, landing = leg
+        chances, survivors, items = rest
+        engine = items & ENGINE and distance is not None
+        values = [0.0] * len(FUELS)
+        share = 1 / len(FLIGHT_EVENTS)
+        for gained, events in self.events.items():
+            billed = [0.0] * len(FUELS)
+            for pw, penalty, crash in self.weather[zone]:
+                landed = self._land(zone, effect, landing, crash, (chances, survivors + gained, items))
+                burned = self._burned(flight_fuel_cost(distance, penalty, self.role, engine))
+                billed = [total + pw * landed[fuel] for total, fuel in zip(billed, burned)]
+            for after in events:
+                values = [total + share * billed[fuel] for total, fuel in zip(values, after)]
+        return values
+
+    def _land(self, zone, effect, landing, crash, rest):
+        """After the fuel bill: refuel, then settle."""
+        key = (zone, effect, landing, crash, rest)
+        values = self._landed.get(key)
+        if values is None:
+            chances, survivors, items = rest
+            values = self._landed[key] = refuel(
+                self._settle(zone, effect, landing, crash, rest),
+                self._settle(zone, effect, landing, crash, (chances, survivors, items | ENGINE)))
+        return values
+
+    def _settle(self, zone, effect, landing, crash, rest):
+        """A story event one time in four, then the approach."""
+        key = (zone, effect, landing, crash, rest)
+        values = self._settled.get(key)
+        if values is None:
+            values = self._approach(zone, effect, landing, crash, rest)
+            if self.prefixes[zone] != "Reality":
+                first = self._branch(zone, effect, landing, crash, rest, "1")
+                second = self._branch(zone, effect, landing, crash, rest, "2")
+                values = [0.75 * value + 0.25 * (a if a > b else b) for value, a, b in zip(values, first, second)]
+            self._settled[key] = values
+        return values
+
+    def _branch(self, zone, effect, landing, crash, rest, choice):
+        """resolve_story_event for one answer."""
+        prefix = self.prefixes[zone]
+        chances, survivors, items = rest
+
+        def onward(rest, final_choice=None):
+            if final_choice:
+                return self._ending(final_choice, rest)
+            return self._approach(zone, effect, landing, crash, rest)
+
+        if prefix == "Transition" and choice == "1":
+            found, lost = onward((chances, survivors, items | COMPASS)), onward(rest)
+            return [0.5 * found[fuel] + 0.5 * lost[fuel] for fuel in self._burned(10)]
+        if prefix == "Twilight" and choice == "1":
+            chances = max(0, chances - 1)
+            trapped, clear = onward((chances, survivors, items), "GHOST" if chances <= 0 else None), onward(rest)
+            return [0.3 * a + 0.7 * b for a, b in zip(trapped, clear)]
+        if prefix == "Crisis" and choice == "1":
+            survivors += 2
+            helped = onward((chances, survivors, items), "SURVIVOR" if survivors >= 10 else None)
+            return [helped[fuel] for fuel in self._burned(15)]
+        if prefix == "Crisis":
+            return onward((max(0, chances - 1), survivors, items))
+        if prefix == "Aurora" and choice == "1":
+            storm, braved = self._ending("STORM", rest), onward(rest)
+            return [0.4 * a + 0.6 * braved[fuel] for a, fuel in zip(storm, TOP_UPS)]
+        return onward(rest)
+
+    def _approach(self, zone, effect, landing, crash, rest):
+        if self.prefixes[zone] == "Aurora":
+            if rest[2] & COMPASS:
+                return self._ending("COMPASS", rest)
+            return [a if a > b else b for a, b in zip(self._ending("REBELLION", rest),
+                                               self._crash(zone, effect, landing, crash, rest))]
+        return self._crash(zone, effect, landing, crash, rest)
+
+    def _crash(self, zone, effect, landing, crash, rest):
+        """The crash roll, phantom effects and the Crisis Zone distress call."""
+        crash_chance = crash * self.crash_factor
+        if rest[2] & SHIELD:
+            crash_chance *= 0.5
+        if effect in PHANTOM_ENDINGS:
+            onward = self._ending(PHANTOM_ENDINGS[effect], rest)
+        else:
+            onward = self._enter(zone + 1, landing, rest)
+            if self.prefixes[zone] == "Crisis":
+                rescued = self._rescue(zone, landing, rest)
+                onward = [0.5 * a + 0.5 * (a if a > b else b) for a, b in zip(onward, rescued)]
+        return [crash_chance * a + (1 - crash_chance) * b for a, b in zip(self._ending("STORM", rest), onward)]
+
+    def _rescue(self, zone, landing, rest):
+        chances, survivors, items = rest
+        shielded = self._enter(zone + 1, landing, (chances, survivors + 1, items | SHIELD))
+        plain = self._enter(zone + 1, landing, (chances, survivors + 1, items))
+        q = self.shield_chance
+        return [q * shielded[fuel] + (1 - q) * plain[fuel] for fuel in self._burned(5)]
+
+
+def player_state(player):
+    """(fuel, (chances, survivors, items)) of a hud.Player, as the solver keys it."""
+    items = player.items & KEY_ITEMS
+    if player.engine_boost:
+        items |= ENGINE
+    return player.fuel, (player.chances, player.survivors, items)
+
+
+# -------------------------------
+# Balance table
+# -------------------------------
+if __name__ == "__main__":
+    from hud import create_player
+    from rng import RNGContext
+    from simulation import DIFFICULTY_START, ROLES, simulated_world
+
+    parser = argparse.ArgumentParser(description="Best achievable outcome of Flight AURORA per difficulty and role")
+    parser.add_argument("--objective", choices=sorted(OBJECTIVES), default="win")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the world to solve")
+    args = parser.parse_args()
+
+    world = simulated_world(RNGContext(args.seed).world)
+    print(f"Best {args.objective} from the start, world seed {args.seed}")
+    print(f"{'Difficulty':<10} {'Role':<10} {'value':>8}")
+    for role in ROLES:
+        start = time.perf_counter()
+        solver = RouteSolver(world, role, args.objective)
+        for difficulty, (fuel, chances) in DIFFICULTY_START.items():
+            player = create_player()
+            player.fuel, player.chances = fuel, chances
+            value = solver.value(0, player)
+            print(f"{difficulty:<10} {role:<10} " + (f"{value:>8.2%}" if args.objective == "win" else f"{value:>8.3f}"))
+        print(f"  ({solver.states():,} values in {time.perf_counter() - start:.2f} s)")
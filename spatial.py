@@ -0,0 +1,153 @@
+# ============================================
+# spatial.py – Nearest-airport index for Flight AURORA
+# ============================================
+# A KD-tree over airports placed on the unit sphere (x, y, z), so straight
+# chord distance orders points exactly like great-circle distance and there
+# is no trouble at the poles or the date line. Queries answer in km:
+#
+#     tree = KDTree(lats, lons, keys)
+#     tree.nearest(60.3, 24.9, k=5)       -> [(km, key), ...] nearest first
+#     tree.within(60.3, 24.9, 1500)       -> [(km, key), ...] nearest first
+#
+# Leaves hold up to LEAF_SIZE points in contiguous arrays; every split is
+# on the widest axis of its node at the median.
+
+import heapq
+import math
+from array import array
+
+EARTH_RADIUS_KM = 6371
+LEAF_SIZE = 32
+
+
+def unit_vector(lat, lon):
+    lat, lon = math.radians(lat), math.radians(lon)
+    cos_lat = math.cos(lat)
+    return cos_lat * math.cos(lon), cos_lat * math.sin(lon), math.sin(lat)
+
+
+def chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+def km_to_chord(km):
+    return 2 * math.sin(min(math.pi, km / EARTH_RADIUS_KM) / 2)
+
+
+class KDTree:
+    """Static KD-tree over (lat, lon) points, each tagged with a key (default: its index)."""
+
+    def __init__(self, lats, lons, keys=None, leaf_size=LEAF_SIZE):
+        count = len(lats)
+        keys = range(count) if keys is None else keys
+        points = [unit_vector(lat, lon) for lat, lon in zip(lats, lons)]
+        axes = ([p[0] for p in points], [p[1] for p in points], [p[2] for p in points])
+        order = list(range(count))
+
+        # Nodes as parallel lists. Every node covers order[lo:hi]; a leaf has
+        # axis -1, an inner node puts coordinates <= split on `axis` to the left.
+        self.lo, self.hi, self.axis, self.split, self.left, self.right = [], [], [], [], [], []
+        self.leaf_size = leaf_size
+        if count:
+            self._build(order, axes)
+
+        # Points stored in tree order, so a leaf is one contiguous slice
+        self.xs = array("d", (axes[0][i] for i in order))
+        self.ys = array("d", (axes[1][i] for i in order))
+        self.zs = array("d", (axes[2][i] for i in order))
+        self.keys = [keys[i] for i in order]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _new_node(self, lo, hi):
+        for column, value in ((self.lo, lo), (self.hi, hi), (self.axis, -1), (self.split, 0.0),
+                              (self.left, -1), (self.right, -1)):
+            column.append(value)
+        return len(self.lo) - 1
+
+    def _build(self, order, axes):
+        root = self._new_node(0, len(order))
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            lo, hi = self.lo[node], self.hi[node]
+            if hi - lo <= self.leaf_size:
+                continue
+            part = order[lo:hi]
+            sample = part[::max(1, len(part) // 256)]   # a strided sample is enough to pick the axis
+            spreads = [max(map(c.__getitem__, sample)) - min(map(c.__getitem__, sample)) for c in axes]
+            axis = spreads.index(max(spreads))
+            coord = axes[axis]
+            part.sort(key=coord.__getitem__)
+            order[lo:hi] = part
+            mid = (lo + hi) // 2
+            self.axis[node] = axis
+            self.split[node] = coord[order[mid]]
+            self.left[node] = self._new_node(lo, mid)
+            self.right[node] = self._new_node(mid, hi)
+            stack.append(self.left[node])
+            stack.append(self.right[node])
+
+    # On the unit sphere chord² = 2 - 2·dot, so leaves are scanned with one
+    # dot product per point and the nearest points are the most aligned.
+    def _leaf_dots(self, node, qx, qy, qz):
+        lo, hi = self.lo[node], self.hi[node]
+        return lo, [x * qx + y * qy + z * qz for x, y, z in zip(self.xs[lo:hi], self.ys[lo:hi], self.zs[lo:hi])]
+
+    def nearest(self, lat, lon, k=1):
+        """The k nearest points as [(km, key)], nearest first."""
+        if not self.keys or k <= 0:
+            return []
+        qx, qy, qz = query = unit_vector(lat, lon)
+        best = []          # min-heap of (dot, index): the k most aligned points so far
+        floor = -2.0       # dot of the k-th best once there are k
+        worst = math.inf   # the same as chord²
+        stack = [(0, 0.0)]
+        while stack:
+            node, gap = stack.pop()
+            if gap >= worst:
+                continue
+            axis = self.axis[node]
+            if axis < 0:
+                lo, dots = self._leaf_dots(node, qx, qy, qz)
+                for i, dot in enumerate(dots, lo):
+                    if dot > floor:
+                        if len(best) < k:
+                            heapq.heappush(best, (dot, i))
+                            if len(best) < k:
+                                continue
+                        else:
+                            heapq.heapreplace(best, (dot, i))
+                        floor = best[0][0]
+                        worst = 2 - 2 * floor
+                continue
+            diff = query[axis] - self.split[node]
+            near, far = (self.left[node], self.right[node]) if diff < 0 else (self.right[node], self.left[node])
+            stack.append((far, diff * diff))   # pushed first, so the near side is searched first
+            stack.append((near, gap))
+        return [(chord_to_km(math.sqrt(max(0.0, 2 - 2 * dot))), self.keys[i]) for dot, i in sorted(best, reverse=True)]
+
+    def within(self, lat, lon, km):
+        """Every point within `km` great-circle distance as [(km, key)], nearest first."""
+        if not self.keys:
+            return []
+        qx, qy, qz = query = unit_vector(lat, lon)
+        radius = km_to_chord(km)
+        floor = 1 - radius * radius / 2
+        found = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            axis = self.axis[node]
+            if axis < 0:
+                lo, dots = self._leaf_dots(node, qx, qy, qz)
+                found.extend((dot, i) for i, dot in enumerate(dots, lo) if dot >= floor)
+                continue
+            diff = query[axis] - self.split[node]
+            if diff - radius <= 0:
+                stack.append(self.left[node])
+            if diff + radius >= 0:
+                stack.append(self.right[node])
+        found.sort(reverse=True)
+        return [(chord_to_km(math.sqrt(max(0.0, 2 - 2 * dot))), self.keys[i]) for dot, i in found]
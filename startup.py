@@ -0,0 +1,108 @@
+# ============================================
+# startup.py – Lazy imports and startup profiling for Flight AURORA
+# ============================================
+# Kiosks and server workers restart often, so the main menu should be on
+# screen before anything a mission needs has been loaded. Modules only
+# used once a mission starts are imported through lazy_import(), and
+# the MySQL driver is imported on the first connection (database.py).
+#
+#     python startup.py            (import-time breakdown + time to menu)
+#     python startup.py --top 30
+
+import importlib
+import os
+import sys
+import time
+
+MENU_PROMPT = "Select an option"
+
+
+# -------------------------------
+# Lazy modules
+# -------------------------------
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            # import_module holds the import lock, so threads racing here get one module
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_import(name):
+    return LazyModule(name)
+
+
+# -------------------------------
+# Startup profiler
+# -------------------------------
+# (game.py imports this module, so the profiler's own imports stay inside it)
+def import_breakdown(module="game", env=None):
+    """
+    Import `module` in a fresh interpreter with -X importtime.
+    Returns [(cumulative ms, self ms, module name)], slowest first.
+    """
+    import subprocess
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, env={**os.environ, **(env or {})},
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1000, int(own) / 1000, name.rstrip()))
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return sorted(rows, reverse=True)
+
+
+def time_to_menu(env=None, timeout=30):
+    """Seconds from launching `python game.py` until the main menu asks for input."""
+    import subprocess
+
+    env = {**os.environ, "AURORA_CLOCK": "zero", "TERM": "dumb", **(env or {})}
+    start = time.perf_counter()
+    game = subprocess.Popen([sys.executable, "game.py"], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            stderr=subprocess.DEVNULL, env=env,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    try:
+        seen = b""
+        while MENU_PROMPT.encode() not in seen:
+            chunk = game.stdout.read1(4096)
+            if not chunk or time.perf_counter() - start > timeout:
+                raise RuntimeError("game.py exited before showing the menu")
+            seen += chunk
+        return time.perf_counter() - start
+    finally:
+        game.kill()
+        game.wait()
+
+
+def print_profile(top=15):
+    rows = import_breakdown()
+    total = rows[0][0] if rows else 0.0
+    print(f"=== Import time for 'import game': {total:.1f} ms ===")
+    print(f"{'cumulative':>10} {'self':>8}  module")
+    for cumulative, own, name in rows[:top]:
+        print(f"{cumulative:8.1f} ms {own:5.1f} ms  {name}")
+    print(f"\n⏱️ Time to main menu: {time_to_menu() * 1000:.0f} ms (fresh process, pacing off)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Flight AURORA startup profiler")
+    parser.add_argument("--top", type=int, default=15, help="modules to list")
+    args = parser.parse_args()
+    print_profile(args.top)
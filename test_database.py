@@ -0,0 +1,62 @@
+# ============================================
+# test_database.py – Hall of Fame run writer
+# ============================================
+#     python -m pytest -q test_database.py
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import database
+
+
+def refuse(rows):
+    raise ConnectionError("database down")
+
+
+def test_flush_returns_when_the_database_and_journal_both_fail(tmp_path):
+    writer = database.RunWriter(interval=0.01, insert=refuse,
+                                journal_path=str(tmp_path / "missing" / "runs.journal"))
+    writer.submit(("Pilot", "Victory", 3, 40, "2025-01-01 00:00:00"))
+
+    start = time.monotonic()
+    assert writer.flush(timeout=5)
+    assert time.monotonic() - start < 5
+    assert writer.stats["lost"] == 1
+    assert writer._thread.is_alive()
+
+    # The writer keeps going once there is somewhere to put the rows
+    os.mkdir(tmp_path / "missing")
+    writer.submit(("Pilot", "Victory", 4, 50, "2025-01-01 00:00:01"))
+    assert writer.flush(timeout=5)
+    assert writer.stats["journaled"] == 1
+
+
+def test_flush_gives_up_after_its_timeout(tmp_path):
+    def stuck(rows):
+        time.sleep(2)
+
+    writer = database.RunWriter(interval=0.01, insert=stuck, journal_path=str(tmp_path / "runs.journal"))
+    writer.submit(("Pilot", "Victory", 3, 40, "2025-01-01 00:00:00"))
+    assert not writer.flush(timeout=0.2)
+
+
+def test_claims_left_by_a_dead_process_are_replayed(tmp_path):
+    journal = tmp_path / "runs.journal"
+    finished = subprocess.Popen([sys.executable, "-c", "pass"])
+    finished.wait()
+    orphan = tmp_path / f"runs.journal.{finished.pid}.0.replay"
+    orphan.write_text(json.dumps(["Ghost", "Loop Failure", 0, 0, "2025-01-01 00:00:00"]) + "\n")
+    live = tmp_path / f"runs.journal.{os.getpid()}.999.replay"   # being replayed by a running process
+    live.write_text(json.dumps(["Busy", "Victory", 1, 1, "2025-01-01 00:00:00"]) + "\n")
+
+    inserted = []
+    writer = database.RunWriter(interval=0.01, insert=inserted.extend, journal_path=str(journal))
+    writer.submit(("Pilot", "Victory", 3, 40, "2025-01-01 00:00:01"))
+    assert writer.flush(timeout=5)
+
+    assert ("Ghost", "Loop Failure", 0, 0, "2025-01-01 00:00:00") in inserted
+    assert not orphan.exists()
+    assert live.exists()
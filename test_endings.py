@@ -0,0 +1,74 @@
+# ============================================
+# test_endings.py – Compiled ending table
+# ============================================
+#     python -m pytest -q test_endings.py
+
+import itertools
+
+import endings
+from hud import Player
+
+FINAL_CHOICES = ("AURORA", "LOOP", "DEC", "HAUNT", "STORM", "REBELLION", "COMPASS",
+                 "GHOST", "SURVIVOR", "NOT-A-CHOICE", "", None)
+GRID = list(itertools.product(range(-5, 206), range(-2, 16), range(-3, 8)))
+
+
+def if_chain_ending(player, final_choice):
+    """The if-chain ENDING_RULES replaced, kept as the reference."""
+    # CRITICAL FAILURES
+    if player["fuel"] <= 0:
+        return "fuel_out"
+
+    # SECRET & CONDITIONAL ENDINGS
+    if player["survivors"] >= 3 and final_choice == "AURORA":
+        return "green_route"
+    if final_choice == "LOOP":
+        return "loop"
+    if final_choice == "DEC":
+        return "drowned"
+    if final_choice == "HAUNT":
+        return "haunt"
+    if final_choice == "STORM":
+        return "storm"
+
+    # NEW EXPANDED ENDINGS
+    if final_choice == "REBELLION":
+        return "rebellion"
+    if final_choice == "COMPASS":
+        return "compass"
+
+    # MORAL OUTCOMES
+    if final_choice == "AURORA" and player["survivors"] == 0:
+        return "mercenary"
+    if final_choice == "AURORA" and player["survivors"] >= 5:
+        return "hero"
+    if player["chances"] <= 0:
+        return "ghost"
+
+    # TRUE VICTORY
+    if final_choice == "AURORA":
+        return "victory"
+    return "fallback"
+
+
+def test_compiled_table_matches_the_if_chain_and_the_rules():
+    for final_choice in FINAL_CHOICES:
+        for fuel, survivors, chances in GRID:
+            player = {"fuel": fuel, "survivors": survivors, "chances": chances}
+            expected = if_chain_ending(player, final_choice)
+            assert endings.evaluate_rules(player, final_choice) == expected, (player, final_choice)
+            assert endings.resolve_ending(player, final_choice) == expected, (player, final_choice)
+
+
+def test_batch_classification_matches_the_if_chain():
+    for final_choice in FINAL_CHOICES:
+        fuel, survivors, chances = (list(column) for column in zip(*GRID))
+        expected = [if_chain_ending({"fuel": f, "survivors": s, "chances": c}, final_choice) for f, s, c in GRID]
+        assert endings.resolve_endings(fuel, survivors, chances, [final_choice] * len(GRID)) == expected
+
+
+def test_player_endings_read_hud_players():
+    players = [Player(fuel=fuel, survivors=survivors, chances=chances) for fuel, survivors, chances in GRID[::97]]
+    expected = [if_chain_ending({"fuel": p.fuel, "survivors": p.survivors, "chances": p.chances}, "AURORA")
+                for p in players]
+    assert endings.resolve_player_endings(players, ["AURORA"] * len(players)) == expected
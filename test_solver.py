@@ -0,0 +1,101 @@
+# ============================================
+# test_solver.py – Solving zones that are not drawn yet
+# ============================================
+#     python -m pytest -q test_solver.py
+
+import copy
+import itertools
+import random
+
+import pytest
+
+import database
+import World
+from hud import Player
+from solver import RouteSolver
+
+# A handful of airports over Europe, so every draw can be enumerated
+AIRPORT_TYPES = ["large_airport"] * 2 + ["medium_airport"] * 4 + ["small_airport"] * 2
+
+
+def europe_airports(seed):
+    rng = random.Random(seed)
+    return [{"ident": f"E{i:02d}", "name": f"Europe Field {i}", "iso_country": "FI", "type": airport_type,
+             "latitude_deg": rng.uniform(45, 68), "longitude_deg": rng.uniform(-5, 35)}
+            for i, airport_type in enumerate(AIRPORT_TYPES)]
+
+
+PLAYERS = [Player(fuel=fuel, survivors=1, chances=2) for fuel in (25, 60, 110, 170)]
+
+
+@pytest.fixture
+def airport_db(monkeypatch):
+    monkeypatch.setattr(database, "SNAPSHOT_PATH", "")
+    monkeypatch.setattr(database, "_snapshot", None)
+    backend = database.SQLiteBackend("file:test_solver?mode=memory&cache=shared")
+    backend.create_schema()
+    backend.load_airports(europe_airports(seed=24))
+    database.set_backend(backend)
+    yield backend
+    database.set_backend(None)
+
+
+class FixedDraw:
+    """Stands in for the world rng: fill_zone draws exactly `keys`."""
+
+    def __init__(self, keys):
+        self.keys = list(keys)
+
+    def sample(self, population, k):
+        assert len(self.keys) == k and set(self.keys) <= set(population)
+        return self.keys
+
+
+def every_draw(world, zone_name, position):
+    """A copy of `world` for each draw fill_zone could make of a zone around `position`."""
+    limit, airport_type = world[zone_name]["draw"]
+    nearby, reachable = World.zone_candidates(zone_name, airport_type, position)
+    assert len(reachable) > limit   # otherwise there is nothing to average over
+    for keys in itertools.combinations([key for _, key in reachable], limit):
+        drawn = copy.deepcopy(world)
+        World.fill_zone(drawn, zone_name, position, FixedDraw(keys))
+        yield drawn
+
+
+def solved(world, zone, origin, role="Navigator"):
+    solver = RouteSolver(world, role)
+    return [solver.value(zone, player, origin) for player in PLAYERS]
+
+
+@pytest.mark.parametrize("role", ["Navigator", "Engineer"])
+@pytest.mark.parametrize("zone_name", ["Twilight Zone", "Crisis Zone"])
+def test_undrawn_zone_is_worth_the_average_of_every_draw(airport_db, zone_name, role):
+    """
+    A zone not drawn yet is worth the average, over every draw fill_zone
+    could make, of the same world with that zone drawn. For the Twilight
+    Zone the Crisis Zone stays undrawn in both, so it has to be drawn around
+    wherever each Twilight airport lands.
+    """
+    origin = World.HOME_POSITION
+    world = World.build_game_world(random.Random(5), origin)
+    zone = list(world).index(zone_name)
+    for earlier in list(world)[1:zone]:
+        World.fill_zone(world, earlier, origin, random.Random(5))
+
+    undrawn = solved(world, zone, origin, role)
+    draws = [solved(drawn, zone, origin, role) for drawn in every_draw(world, zone_name, origin)]
+    average = [sum(values) / len(draws) for values in zip(*draws)]
+    assert undrawn == pytest.approx(average, abs=1e-12)
+    assert any(value > 0 for value in undrawn)
+
+
+def test_drawn_and_undrawn_zones_are_kept_apart(airport_db):
+    """One solver asked before and after the mission draws a zone gives each world its own answer."""
+    origin = World.HOME_POSITION
+    world = World.build_game_world(random.Random(7), origin)
+    solver = RouteSolver(world, "Navigator")
+    before = [solver.value(1, player, origin) for player in PLAYERS]
+    World.fill_zone(world, "Transition Zone", origin, random.Random(7))
+    after = [solver.value(1, player, origin) for player in PLAYERS]
+    assert before == solved(World.build_game_world(random.Random(7), origin), 1, origin)
+    assert after == solved(world, 1, origin)
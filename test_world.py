@@ -0,0 +1,168 @@
+# ============================================
+# test_world.py – Airport KD-trees and zone draws
+# ============================================
+#     python -m pytest -q test_world.py
+
+import math
+import random
+
+import pytest
+
+import database
+import snapshot
+import World
+from game import calculate_distance
+from spatial import KDTree
+
+TYPES = ("large_airport", "medium_airport", "small_airport")
+
+
+def random_point(rng):
+    """Uniform on the sphere, with extra points crowding the poles and the antimeridian."""
+    spot = rng.random()
+    if spot < 0.1:
+        return rng.choice((-1, 1)) * rng.uniform(87, 90), rng.uniform(-180, 180)
+    if spot < 0.2:
+        return math.degrees(math.asin(rng.uniform(-1, 1))), rng.choice((-1, 1)) * rng.uniform(179, 180)
+    return math.degrees(math.asin(rng.uniform(-1, 1))), rng.uniform(-180, 180)
+
+
+def synthetic_airports(count, seed):
+    rng = random.Random(seed)
+    airports = []
+    for i in range(count):
+        lat, lon = random_point(rng)
+        if i % 97 == 0:
+            lat = None   # rows without coordinates never enter a tree
+        airports.append({"ident": f"T{i:05d}", "name": f"Test Field {i}", "iso_country": "FI",
+                         "type": rng.choices(TYPES, (15, 35, 50))[0], "latitude_deg": lat, "longitude_deg": lon})
+    return airports
+
+
+AIRPORTS = synthetic_airports(5000, seed=23)
+PLACED = [a for a in AIRPORTS if a["latitude_deg"] is not None]
+QUERIES = [(90, 0), (-90, 0), (89.99, -179.99), (-89.5, 45), (0, 180), (0, -180), (12.5, 179.999),
+           (-40, -179.5), (60.3172, 24.963301)] + [random_point(random.Random(i)) for i in range(60)]
+
+
+def brute_force(airports, lat, lon):
+    """(km, index) of every airport by haversine, nearest first."""
+    return sorted((calculate_distance(lat, lon, a["latitude_deg"], a["longitude_deg"]), i)
+                  for i, a in enumerate(airports))
+
+
+# -------------------------------
+# spatial.KDTree
+# -------------------------------
+def test_nearest_matches_a_brute_force_scan():
+    tree = KDTree([a["latitude_deg"] for a in PLACED], [a["longitude_deg"] for a in PLACED])
+    for lat, lon in QUERIES:
+        expected = brute_force(PLACED, lat, lon)
+        for k in (1, 5, 25):
+            found = tree.nearest(lat, lon, k)
+            assert [key for _, key in found] == [i for _, i in expected[:k]], (lat, lon, k)
+            assert [km for km, _ in found] == pytest.approx([km for km, _ in expected[:k]], abs=1e-6)
+
+
+def test_within_matches_a_brute_force_scan():
+    tree = KDTree([a["latitude_deg"] for a in PLACED], [a["longitude_deg"] for a in PLACED])
+    for lat, lon in QUERIES:
+        expected = brute_force(PLACED, lat, lon)
+        for km in (0, 300, 1500, 5000, 25000):
+            found = {key: distance for distance, key in tree.within(lat, lon, km)}
+            inside = {i for distance, i in expected if distance < km - 1e-6}
+            outside = {i for distance, i in expected if distance > km + 1e-6}
+            assert inside <= found.keys() and not outside & found.keys(), (lat, lon, km)
+
+
+def test_empty_tree():
+    tree = KDTree([], [])
+    assert tree.nearest(0, 0, 3) == [] and tree.within(0, 0, 1000) == []
+
+
+# -------------------------------
+# World zone draws from the database trees
+# -------------------------------
+@pytest.fixture
+def airport_db(monkeypatch):
+    monkeypatch.setattr(database, "SNAPSHOT_PATH", "")
+    monkeypatch.setattr(database, "_snapshot", None)
+    backend = database.SQLiteBackend("file:test_world?mode=memory&cache=shared")
+    backend.create_schema()
+    backend.load_airports(AIRPORTS)
+    database.set_backend(backend)
+    yield backend
+    database.set_backend(None)
+
+
+def queried_airports(keys):
+    """Airports by sample_seq, fetched with the per-zone query fill_zone used to make."""
+    with database.db_cursor(dictionary=True) as cursor:
+        cursor.execute(f"""
+            SELECT sample_seq, ident, name, iso_country, type, latitude_deg, longitude_deg
+            FROM airport
+            WHERE sample_seq IN ({", ".join(["%s"] * len(keys))});
+        """, list(keys))
+        rows = {row.pop("sample_seq"): row for row in cursor.fetchall()}
+    return [rows[key] for key in keys if key in rows]
+
+
+def test_zone_candidates_match_a_brute_force_scan(airport_db):
+    for zone_name, (_, airport_type) in zip(World.ZONE_REACH_KM, World.ZONE_DRAWS):
+        airports = PLACED if airport_type == "all" else [a for a in PLACED if a["type"] == airport_type]
+        for lat, lon in QUERIES:
+            nearby, reachable = World.zone_candidates(zone_name, airport_type, (lat, lon))
+            expected = [(km, airports[i]["ident"]) for km, i in brute_force(airports, lat, lon)[:World.ZONE_POOL + 1]
+                        if km > 1]
+            assert [a["ident"] for a in database.fetch_airports_by_key([key for _, key in nearby])] == \
+                [ident for _, ident in expected], (zone_name, lat, lon)
+            assert [km for km, _ in nearby] == pytest.approx([km for km, _ in expected], abs=1e-6)
+            assert reachable == [(km, key) for km, key in nearby if km <= World.ZONE_REACH_KM[zone_name]]
+
+
+def draw_world(seed, positions):
+    """A world with every zone drawn, the later ones around `positions`."""
+    world = World.build_game_world(random.Random(seed), positions[0])
+    for zone_name, position in zip(list(World.ZONE_REACH_KM)[1:], positions[1:]):
+        World.fill_zone(world, zone_name, position, random.Random(seed))
+    return world
+
+
+def test_zones_drawn_from_memory_match_the_per_zone_query(airport_db, monkeypatch):
+    drawn = []
+
+    def recorded(keys):
+        airports = database.fetch_airports_by_key(keys)
+        drawn.append((keys, airports))
+        return airports
+
+    def offline(*args, **kwargs):
+        raise AssertionError("a zone draw went to the database")
+
+    monkeypatch.setattr(World, "fetch_airports_by_key", recorded)
+    for seed in range(10):
+        positions = [random_point(random.Random(seed * 7 + i)) for i in range(4)]
+        world = World.build_game_world(random.Random(seed), positions[0])
+        with monkeypatch.context() as m:
+            m.setattr(database, "db_cursor", offline)   # every tree is built: later zones come from memory
+            for zone_name, position in zip(list(World.ZONE_REACH_KM)[1:], positions[1:]):
+                World.fill_zone(world, zone_name, position, random.Random(seed))
+        assert all("draw" not in data for data in world.values())
+
+    assert drawn
+    for keys, airports in drawn:
+        assert airports == queried_airports(keys)
+
+
+def test_snapshot_and_database_draw_the_same_world(airport_db, monkeypatch, tmp_path):
+    positions = [World.HOME_POSITION, (89.9, 0), (-16.5, 179.9), (0.5, -179.95)]
+    from_db = [draw_world(seed, positions) for seed in range(5)]
+
+    path = str(tmp_path / "airports.snap")
+    snapshot.write_snapshot(path, AIRPORTS)
+    monkeypatch.setattr(database, "SNAPSHOT_PATH", path)
+    database.set_backend(airport_db)   # drop the database trees
+    try:
+        assert [draw_world(seed, positions) for seed in range(5)] == from_db
+    finally:
+        database.get_snapshot().close()
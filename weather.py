@@ -3,61 +3,114 @@
 # ============================================
 
 import random
+from array import array
 
-# Weather options for each zone
-ZONE_WEATHER = {
-    "Reality": [
-        {"condition": "Clear Skies", "fuel_penalty": 0, "crash_chance": 0.0},
-        {"condition": "Light Clouds", "fuel_penalty": 2, "crash_chance": 0.0}
-    ],
-    "Transition": [
-        {"condition": "Radio Static", "fuel_penalty": 3, "crash_chance": 0.0},
-        {"condition": "Foggy Horizon", "fuel_penalty": 5, "crash_chance": 0.05}
-    ],
-    "Twilight": [
-        {"condition": "Phantom Fog", "fuel_penalty": 6, "crash_chance": 0.1},
-        {"condition": "Shifting Lights", "fuel_penalty": 8, "crash_chance": 0.15}
-    ],
-    "Crisis": [
-        {"condition": "Thunderstorm", "fuel_penalty": 10, "crash_chance": 0.2},
-        {"condition": "Lightning Storm", "fuel_penalty": 12, "crash_chance": 0.25}
-    ],
-    "Aurora": [
-        {"condition": "Storm Wall", "fuel_penalty": 15, "crash_chance": 0.3},
-        {"condition": "False Lights", "fuel_penalty": 18, "crash_chance": 0.35}
-    ]
+# Every weather the game knows about
+CONDITIONS = [
+    {"condition": "Clear Skies ☀️", "fuel_penalty": 0, "crash_chance": 0.02},
+    {"condition": "Mild Winds 🌤", "fuel_penalty": 3, "crash_chance": 0.05},
+    {"condition": "Rainstorm 🌧", "fuel_penalty": 5, "crash_chance": 0.15},
+    {"condition": "Thunderstorm ⛈", "fuel_penalty": 10, "crash_chance": 0.35},
+    {"condition": "Snowstorm ❄️", "fuel_penalty": 7, "crash_chance": 0.20},
+    {"condition": "Cyclone 🌪", "fuel_penalty": 15, "crash_chance": 0.60},
+]
+
+# Zone-based weighting (same order as CONDITIONS)
+ZONE_WEIGHTS = {
+    "Reality": [0.5, 0.3, 0.2, 0, 0, 0],   # Mostly easy
+    "Transition": [0.3, 0.3, 0.25, 0.15, 0, 0],
+    "Twilight": [0.1, 0.2, 0.3, 0.25, 0.15, 0],
+    "Crisis": [0.05, 0.1, 0.25, 0.3, 0.2, 0.1],
+    "Aurora": [0, 0.05, 0.15, 0.3, 0.25, 0.25],  # Brutal endgame
 }
+UNIFORM_WEIGHTS = [1 / len(CONDITIONS)] * len(CONDITIONS)
 
 
-import random
+# -------------------------------
+# Compiled weather tables
+# -------------------------------
+class WeatherTable:
+    """
+    One zone's weather distribution, compiled once.
+    cumulative holds the running probabilities; prob/alias are Vose's
+    alias tables, so a draw costs one random number and one lookup.
+    """
+
+    def __init__(self, weights):
+        total = sum(weights)
+        n = len(weights)
+        self.probabilities = [w / total for w in weights]
+        self.cumulative = []
+        running = 0.0
+        for p in self.probabilities:
+            running += p
+            self.cumulative.append(running)
+
+        self.prob = [0.0] * n
+        self.alias = list(range(n))
+        scaled = [p * n for p in self.probabilities]
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def draw(self, rng=random):
+        """Index into CONDITIONS."""
+        u = rng.random() * len(self.prob)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+
+ZONE_TABLES = {zone: WeatherTable(weights) for zone, weights in ZONE_WEIGHTS.items()}
+DEFAULT_TABLE = WeatherTable(UNIFORM_WEIGHTS)
+_FUEL_PENALTIES = [c["fuel_penalty"] for c in CONDITIONS]
+_CRASH_CHANCES = [c["crash_chance"] for c in CONDITIONS]
+_tables_by_name = {}
+
+
+def weather_table(zone_name):
+    """Compiled table for a zone name such as 'Crisis Zone' (cached per name)."""
+    table = _tables_by_name.get(zone_name)
+    if table is None:
+        table = DEFAULT_TABLE
+        for zone, zone_table in ZONE_TABLES.items():
+            if zone in zone_name:
+                table = zone_table
+                break
+        _tables_by_name[zone_name] = table
+    return table
+
 
-def get_weather(zone_name):
+def get_weather(zone_name, rng=random):
     """Return weather conditions that depend on the zone."""
+    return CONDITIONS[weather_table(zone_name).draw(rng)]
 
-    conditions = [
-        {"condition": "Clear Skies ☀️", "fuel_penalty": 0, "crash_chance": 0.02},
-        {"condition": "Mild Winds 🌤", "fuel_penalty": 3, "crash_chance": 0.05},
-        {"condition": "Rainstorm 🌧", "fuel_penalty": 5, "crash_chance": 0.15},
-        {"condition": "Thunderstorm ⛈", "fuel_penalty": 10, "crash_chance": 0.35},
-        {"condition": "Snowstorm ❄️", "fuel_penalty": 7, "crash_chance": 0.20},
-        {"condition": "Cyclone 🌪", "fuel_penalty": 15, "crash_chance": 0.60},
-    ]
-
-    # Zone-based weighting
-    if "Reality" in zone_name:
-        weights = [0.5, 0.3, 0.2, 0, 0, 0]   # Mostly easy
-    elif "Transition" in zone_name:
-        weights = [0.3, 0.3, 0.25, 0.15, 0, 0]
-    elif "Twilight" in zone_name:
-        weights = [0.1, 0.2, 0.3, 0.25, 0.15, 0]
-    elif "Crisis" in zone_name:
-        weights = [0.05, 0.1, 0.25, 0.3, 0.2, 0.1]
-    elif "Aurora" in zone_name:
-        weights = [0, 0.05, 0.15, 0.3, 0.25, 0.25]  # Brutal endgame
-    else:
-        weights = [1/len(conditions)] * len(conditions)
-
-    return random.choices(conditions, weights=weights, k=1)[0]
 
+def forecast(zone_name):
+    """(most likely conditions, their probability) for a zone."""
+    probabilities = weather_table(zone_name).probabilities
+    likeliest = max(range(len(CONDITIONS)), key=probabilities.__getitem__)
+    return CONDITIONS[likeliest], probabilities[likeliest]
 
 
+def get_weather_batch(zone_name, n, rng=random):
+    """
+    Draw n weathers for a zone at once.
+    Returns (fuel_penalties, crash_chances) as compact arrays.
+    """
+    table = weather_table(zone_name)
+    prob, alias, size = table.prob, table.alias, len(table.prob)
+    draw = rng.random
+    picks = []
+    for _ in range(n):
+        u = draw() * size
+        i = int(u)
+        picks.append(i if u - i < prob[i] else alias[i])
+    return (array("i", [_FUEL_PENALTIES[i] for i in picks]),
+            array("d", [_CRASH_CHANCES[i] for i in picks]))